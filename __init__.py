@@ -1,3 +1,4 @@
+import alu
 from obj import *
 from obj import __all__ as __obj_all__
 from bits import *
@@ -6,5 +7,28 @@ from bytes import *
 from bytes import __all__ as __bytes_all__
 from data import *
 from data import __all__ as __data_all__
+from tlb import *
+from tlb import __all__ as __tlb_all__
+from cache import *
+from cache import __all__ as __cache_all__
+from memory import *
+from memory import __all__ as __memory_all__
+from arrays import *
+from arrays import __all__ as __arrays_all__
+from gates import *
+from gates import __all__ as __gates_all__
+from rope import *
+from rope import __all__ as __rope_all__
+from bitarrays import *
+from bitarrays import __all__ as __bitarrays_all__
+from structs import *
+from structs import __all__ as __structs_all__
+from vm import *
+from vm import __all__ as __vm_all__
+from heap import *
+from heap import __all__ as __heap_all__
 
-__all__ = __obj_all__ + __bits_all__ + __bytes_all__ + __data_all__
+__all__ = (['alu'] + __obj_all__ + __bits_all__ + __bytes_all__
+           + __data_all__ + __tlb_all__ + __memory_all__ + __arrays_all__
+           + __gates_all__ + __rope_all__ + __bitarrays_all__
+           + __structs_all__ + __vm_all__ + __heap_all__ + __cache_all__)
@@ -0,0 +1,256 @@
+from operator import index
+from typing import Dict, Tuple
+
+from obj import Immutable
+from bits import Bit
+
+__all__ = [
+    'Flags',
+    'add',
+    'adc',
+    'sub',
+    'sbb',
+    'and_',
+    'or_',
+    'xor',
+    'cmp',
+    'result_table',
+    'flags_table',
+]
+
+_FLAGS = [None] * 16
+
+CF = 1
+OF = 2
+ZF = 4
+SF = 8
+
+
+class Flags(Immutable):
+    """
+    Immutable set of 8-bit ALU status flags.
+
+    Flags(cf, of, zf, sf) -> flags with given carry, overflow,
+                             zero and sign bits
+    Flags() -> all flags clear
+
+    There is exactly one instance for each of the 16 combinations.
+    """
+    cf: Bit
+    of: Bit
+    zf: Bit
+    sf: Bit
+    _code: int
+
+    __slots__ = ('cf', 'of', 'zf', 'sf', '_code')
+
+    # ----- Initialization Methods ----- #
+    def __new__(cls, cf=False, of=False, zf=False, sf=False, /):
+        'Create and return the shared instance for the given flags.'
+        code = (CF if cf else 0) | (OF if of else 0) | \
+            (ZF if zf else 0) | (SF if sf else 0)
+        return cls._from_code(code)
+
+    def __init__(self, cf=False, of=False, zf=False, sf=False, /):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        pass
+
+    @classmethod
+    def _from_code(cls, code, /):
+        'Return the shared instance for a flags table entry.'
+        self = _FLAGS[code]
+        if self is None:
+            self = super().__new__(cls)
+            for name, mask in (('cf', CF), ('of', OF), ('zf', ZF), ('sf', SF)):
+                super(Immutable, self).__setattr__(name, Bit(code & mask))
+            super(Immutable, self).__setattr__('_code', code)
+            _FLAGS[code] = self
+        return self
+
+    def __reduce__(self, /):
+        'Return state information for pickling.'
+        return Flags, (self.cf, self.of, self.zf, self.sf)
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return (f'Flags(CF={self.cf.value:d}, OF={self.of.value:d}, '
+                f'ZF={self.zf.value:d}, SF={self.sf.value:d})')
+
+    def __str__(self, /):
+        'Return str(self).'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return a raw representation of the flags.'
+        return ''.join(name if bit else '-' for name, bit in
+                       (('C', self.cf), ('O', self.of),
+                        ('Z', self.zf), ('S', self.sf)))
+
+    # ----- Transformation Methods ----- #
+    def __hash__(self, /):
+        'Return hash(self).'
+        return self._code
+
+    def __bool__(self, /):
+        'Return bool(self).'
+        return self._code != 0
+
+    def to_int(self, /):
+        'Return the flags packed as CF | OF << 1 | ZF << 2 | SF << 3.'
+        return self._code
+
+
+def _add_flags(a, b, carry, /):
+    'Return the flags code of a+b+carry.'
+    total = a + b + carry
+    result = total & 0xFF
+    return ((CF if total > 0xFF else 0) |
+            (OF if ~(a ^ b) & (a ^ result) & 0x80 else 0) |
+            (ZF if result == 0 else 0) |
+            (SF if result & 0x80 else 0))
+
+
+def _sub_flags(a, b, borrow, /):
+    'Return the flags code of a-b-borrow.'
+    result = (a - b - borrow) & 0xFF
+    return ((CF if a < b + borrow else 0) |
+            (OF if (a ^ b) & (a ^ result) & 0x80 else 0) |
+            (ZF if result == 0 else 0) |
+            (SF if result & 0x80 else 0))
+
+
+def _logic_flags(result, /):
+    'Return the flags code of a logical operation result.'
+    return (ZF if result == 0 else 0) | (SF if result & 0x80 else 0)
+
+
+def _build_adc():
+    'Return the result and flags tables of add with carry.'
+    return (
+        bytes((a + b + c) & 0xFF
+              for c in (0, 1) for a in range(256) for b in range(256)),
+        bytes(_add_flags(a, b, c)
+              for c in (0, 1) for a in range(256) for b in range(256)),
+    )
+
+
+def _build_sbb():
+    'Return the result and flags tables of subtract with borrow.'
+    return (
+        bytes((a - b - c) & 0xFF
+              for c in (0, 1) for a in range(256) for b in range(256)),
+        bytes(_sub_flags(a, b, c)
+              for c in (0, 1) for a in range(256) for b in range(256)),
+    )
+
+
+def _build_logic(operation):
+    'Return a function building the tables of a logical operation.'
+    def build():
+        results = bytes(operation(a, b)
+                        for a in range(256) for b in range(256))
+        flags = bytes(_logic_flags(result) for result in range(256))
+        return results, bytes(flags[result] for result in results)
+    return build
+
+
+_BUILDERS = {
+    'adc': _build_adc,
+    'sbb': _build_sbb,
+    'and': _build_logic(lambda a, b: a & b),
+    'or': _build_logic(lambda a, b: a | b),
+    'xor': _build_logic(lambda a, b: a ^ b),
+}
+_ALIASES = {'add': 'adc', 'sub': 'sbb', 'cmp': 'sbb'}
+_TABLES: Dict[str, Tuple[bytes, bytes]] = {}
+
+
+def _tables(operation, /):
+    'Return the result and flags tables of an operation, building them once.'
+    operation = _ALIASES.get(operation, operation)
+    tables = _TABLES.get(operation)
+    if tables is None:
+        try:
+            builder = _BUILDERS[operation]
+        except KeyError:
+            raise ValueError(f'unknown ALU operation {operation!r}') from None
+        tables = _TABLES[operation] = builder()
+    return tables
+
+
+def result_table(operation, /):
+    """
+    Return the result table of an 8-bit ALU operation.
+
+    The entry of a and b is at a << 8 | b; for adc and sbb the
+    entries with carry set follow at 1 << 16 | a << 8 | b.
+    """
+    return _tables(operation)[0]
+
+
+def flags_table(operation, /):
+    """
+    Return the flags table of an 8-bit ALU operation, indexed like
+    its result table.  Entries are codes of Flags.to_int().
+    """
+    return _tables(operation)[1]
+
+
+def _operands(a, b, /):
+    'Return the table index of two 8-bit operands.'
+    return (index(a) & 0xFF) << 8 | index(b) & 0xFF
+
+
+def add(a, b, /):
+    'Return the 8-bit sum of a and b and its flags.'
+    results, flags = _tables('adc')
+    key = _operands(a, b)
+    return results[key], Flags._from_code(flags[key])
+
+
+def adc(a, b, carry, /):
+    'Return the 8-bit sum of a, b and the carry and its flags.'
+    results, flags = _tables('adc')
+    key = (1 << 16 if carry else 0) | _operands(a, b)
+    return results[key], Flags._from_code(flags[key])
+
+
+def sub(a, b, /):
+    'Return the 8-bit difference of a and b and its flags.'
+    results, flags = _tables('sbb')
+    key = _operands(a, b)
+    return results[key], Flags._from_code(flags[key])
+
+
+def sbb(a, b, borrow, /):
+    'Return the 8-bit difference of a, b and the borrow and its flags.'
+    results, flags = _tables('sbb')
+    key = (1 << 16 if borrow else 0) | _operands(a, b)
+    return results[key], Flags._from_code(flags[key])
+
+
+def and_(a, b, /):
+    'Return the 8-bit bitwise and of a and b and its flags.'
+    results, flags = _tables('and')
+    key = _operands(a, b)
+    return results[key], Flags._from_code(flags[key])
+
+
+def or_(a, b, /):
+    'Return the 8-bit bitwise or of a and b and its flags.'
+    results, flags = _tables('or')
+    key = _operands(a, b)
+    return results[key], Flags._from_code(flags[key])
+
+
+def xor(a, b, /):
+    'Return the 8-bit bitwise exclusive or of a and b and its flags.'
+    results, flags = _tables('xor')
+    key = _operands(a, b)
+    return results[key], Flags._from_code(flags[key])
+
+
+def cmp(a, b, /):
+    'Return the flags of comparing a with b (the flags of a-b).'
+    return Flags._from_code(_tables('sbb')[1][_operands(a, b)])
@@ -0,0 +1,468 @@
+import numbers
+import operator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from obj import MutableIterable
+from bytes import Bytes, FrozenBytes
+from data import (
+    FixedWidthInteger,
+    Char, UnsignedChar,
+    Short, UnsignedShort,
+    Integer, UnsignedInteger,
+    Long, UnsignedLong,
+    LongLong, UnsignedLongLong,
+)
+
+__all__ = [
+    'TypedArray',
+    'CharArray',
+    'UnsignedCharArray',
+    'ShortArray',
+    'UnsignedShortArray',
+    'IntegerArray',
+    'UnsignedIntegerArray',
+    'LongArray',
+    'UnsignedLongArray',
+    'LongLongArray',
+    'UnsignedLongLongArray',
+]
+
+
+class TypedArray(MutableIterable):
+    """
+    Mutable array of typed values stored in a NumPy buffer.
+
+    TypedArray subclasses set the NumPy dtype and the scalar data type
+    of their elements.  Arithmetic and bitwise operators work
+    elementwise on the whole buffer with C wraparound semantics, their
+    integer operands wrapped to the element type.  Comparisons use the
+    unwrapped value, as after the C integer promotions.  Indexing
+    returns the scalar data type, and an integer assigned to a slice is
+    broadcast across it.
+
+    Requires NumPy.
+    """
+    dtype: str = None
+    scalar: type = None
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, value=0):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if numpy is None:
+            raise ImportError(f'{type(self).__name__} requires numpy')
+        if isinstance(value, int):
+            self._data = numpy.zeros(value, self.dtype)
+        elif isinstance(value, TypedArray):
+            self._data = value._data.astype(self.dtype)
+        elif isinstance(value, (Bytes, FrozenBytes)):
+            self._data = numpy.frombuffer(bytes(value._data),
+                                          self.dtype).copy()
+        elif isinstance(value, numpy.ndarray):
+            self._data = self._checked(value)
+        else:
+            self._data = self._checked(
+                [int(item) if isinstance(item, FixedWidthInteger) else item
+                 for item in value]
+            )
+
+    @classmethod
+    def _wrap(cls, data, /):
+        'Return an array using data as its buffer without copying.'
+        self = cls.__new__(cls)
+        self._data = data
+        return self
+
+    def _checked(self, data, /):
+        'Return data converted to the dtype, checking the value range.'
+        if len(data) and (numpy.min(data) < self.scalar.minimum or
+                          numpy.max(data) > self.scalar.maximum):
+            raise ValueError(f'{type(self).__name__} only accepts integers '
+                             f'from {self.scalar.minimum} '
+                             f'to {self.scalar.maximum}.')
+        return numpy.array(data, self.dtype)
+
+    def _operand(self, other, /):
+        'Return other as a NumPy operand of the dtype, or None.'
+        if isinstance(other, type(self)):
+            return other._data
+        elif isinstance(other, FixedWidthInteger):
+            other = other.to_int()
+        elif isinstance(other, numpy.ndarray):
+            return other.astype(self.dtype)
+        elif isinstance(other, numbers.Integral):
+            other = operator.index(other)
+        else:
+            return None
+        return numpy.array(other & self.scalar._mask,
+                           numpy.uint64).astype(self.dtype)
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return f'{type(self).__name__}({self.to_str()})'
+
+    def __str__(self, /):
+        'Return str(self).'
+        return f'{type(self).__name__}({self.to_str()})'
+
+    def to_str(self, /):
+        'Return a raw representation of the array.'
+        return numpy.array2string(self._data, separator=', ')
+
+    def to_mem(self, /):
+        'Return a hexadecimal representation of the array memory.'
+        return self._data.tobytes().hex(' ')
+
+    # ----- Transformation Methods ----- #
+    def __hash__(self, /):
+        'Return hash(self).'
+        raise TypeError(f"unhashable type: '{type(self).__name__}'")
+
+    def __bool__(self, /):
+        'Return bool(self).'
+        return len(self._data) != 0
+
+    def to_numpy(self, /):
+        'Return the NumPy buffer of the array.'
+        return self._data
+
+    def to_bytes(self, /):
+        'Return a byte group holding the memory of the array.'
+        return Bytes._wrap(bytearray(self._data.tobytes()))
+
+    def to_list(self, /):
+        'Return a list of python integers.'
+        return self._data.tolist()
+
+    # ----- Comparison Methods ----- #
+    def _compare(self, other, operation, /):
+        """
+        Return operation applied elementwise on self and other, comparing
+        the values as C does, without wrapping integer operands.
+        """
+        if isinstance(other, FixedWidthInteger):
+            other = other.to_int()
+        elif isinstance(other, numbers.Integral):
+            other = operator.index(other)
+        if isinstance(other, int):
+            if not self.scalar.minimum <= other <= self.scalar.maximum:
+                # Every element compares to other like the minimum does.
+                return numpy.full(len(self._data),
+                                  operation(self.scalar.minimum, other))
+            return operation(self._data, numpy.array(other, self.dtype))
+        elif isinstance(other, (TypedArray, numpy.ndarray)):
+            return operation(self._data, getattr(other, '_data', other))
+        return NotImplemented
+
+    def __lt__(self, other, /):
+        'Return self<other elementwise.'
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other, /):
+        'Return self<=other elementwise.'
+        return self._compare(other, operator.le)
+
+    def __eq__(self, other, /):
+        'Return self==other elementwise.'
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other, /):
+        'Return self!=other elementwise.'
+        return self._compare(other, operator.ne)
+
+    def __gt__(self, other, /):
+        'Return self>other elementwise.'
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other, /):
+        'Return self>=other elementwise.'
+        return self._compare(other, operator.ge)
+
+    # ----- Iterable Methods ----- #
+    def __len__(self, /):
+        'Return len(self).'
+        return len(self._data)
+
+    def __getitem__(self, key, /):
+        'Return self[key].'
+        if isinstance(key, int):
+            return self.scalar(int(self._data[key]))
+        elif isinstance(key, slice):
+            return self._wrap(self._data[key].copy())
+        else:
+            raise TypeError(f'array indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __setitem__(self, key, value, /):
+        'Set self[key] to value.'
+        if isinstance(key, int):
+            if isinstance(value, FixedWidthInteger):
+                value = value.to_int()
+            self._data[key] = self._checked([value])[0]
+        elif isinstance(key, slice):
+            length = len(range(*key.indices(len(self._data))))
+            if isinstance(value, FixedWidthInteger):
+                value = value.to_int()
+            if isinstance(value, int):
+                self._data[key] = self._checked([value])[0]
+                return
+            value = type(self)(value)._data
+            if len(value) != length:
+                raise ValueError(f'cannot assign {len(value)} items to a '
+                                 f'slice of {length} items.')
+            self._data[key] = value
+        else:
+            raise TypeError(f'array indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __delitem__(self, key, /):
+        'Delete self[key].'
+        if isinstance(key, (int, slice)):
+            self._data = numpy.delete(self._data, key)
+        else:
+            raise TypeError(f'array indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __iter__(self, /):
+        'Implement iter(self).'
+        return map(self.scalar, self._data.tolist())
+
+    def __reversed__(self, /):
+        'Return a reverse iterator over the object.'
+        return map(self.scalar, self._data[::-1].tolist())
+
+    def __contains__(self, item, /):
+        'Return item in self.'
+        return self.count(item) != 0
+
+    def clear(self, /):
+        'Remove all items from mutable.'
+        self._data = numpy.zeros(0, self.dtype)
+
+    def count(self, value, /):
+        'Return number of occurrences of value.'
+        if isinstance(value, FixedWidthInteger):
+            value = value.to_int()
+        elif not isinstance(value, int):
+            return 0
+        return int(numpy.count_nonzero(self._data == value))
+
+    def index(self, value, start=0, stop=9223372036854775807, /):
+        """
+        Return first index of value.
+
+        Raises ValueError if the value is not present.
+        """
+        if isinstance(value, FixedWidthInteger):
+            value = value.to_int()
+        if isinstance(value, int):
+            start, stop, _ = slice(start, stop).indices(len(self._data))
+            found = numpy.flatnonzero(self._data[start:stop] == value)
+            if len(found):
+                return start + int(found[0])
+        raise ValueError(f'{value!r} is not in array')
+
+    # ----- Calculation Methods ----- #
+    def _binary(self, other, operation, /):
+        'Return operation applied elementwise on self and other.'
+        other = self._operand(other)
+        if other is None:
+            return NotImplemented
+        return self._wrap(operation(self._data, other).astype(self.dtype))
+
+    def _reflected(self, other, operation, /):
+        'Return operation applied elementwise on other and self.'
+        other = self._operand(other)
+        if other is None:
+            return NotImplemented
+        return self._wrap(operation(other, self._data).astype(self.dtype))
+
+    def __add__(self, other, /):
+        'Return self+other.'
+        return self._binary(other, numpy.add)
+
+    def __radd__(self, other, /):
+        'Return other+self.'
+        return self._reflected(other, numpy.add)
+
+    def __sub__(self, other, /):
+        'Return self-other.'
+        return self._binary(other, numpy.subtract)
+
+    def __rsub__(self, other, /):
+        'Return other-self.'
+        return self._reflected(other, numpy.subtract)
+
+    def __mul__(self, other, /):
+        'Return self*other.'
+        return self._binary(other, numpy.multiply)
+
+    def __rmul__(self, other, /):
+        'Return other*self.'
+        return self._reflected(other, numpy.multiply)
+
+    def __lshift__(self, other, /):
+        'Return self<<other.'
+        return self._binary(other, numpy.left_shift)
+
+    def __rshift__(self, other, /):
+        'Return self>>other.'
+        return self._binary(other, numpy.right_shift)
+
+    def __and__(self, other, /):
+        'Return self&other.'
+        return self._binary(other, numpy.bitwise_and)
+
+    def __rand__(self, other, /):
+        'Return other&self.'
+        return self._reflected(other, numpy.bitwise_and)
+
+    def __xor__(self, other, /):
+        'Return self^other.'
+        return self._binary(other, numpy.bitwise_xor)
+
+    def __rxor__(self, other, /):
+        'Return other^self.'
+        return self._reflected(other, numpy.bitwise_xor)
+
+    def __or__(self, other, /):
+        'Return self|other.'
+        return self._binary(other, numpy.bitwise_or)
+
+    def __ror__(self, other, /):
+        'Return other|self.'
+        return self._reflected(other, numpy.bitwise_or)
+
+    def __neg__(self, /):
+        'Return -self.'
+        return self._wrap(numpy.negative(self._data))
+
+    def __invert__(self, /):
+        'Return ~self.'
+        return self._wrap(numpy.invert(self._data))
+
+    # ----- Mutational Methods ----- #
+    def copy(self, /):
+        'Return a copy of the array.'
+        return self._wrap(self._data.copy())
+
+
+class CharArray(TypedArray):
+    """
+    Mutable array of signed characters.
+
+    CharArray(iterable_of_chars) -> array initialized with given
+                                    signed characters or integers
+    CharArray(array) -> array converted from another typed array
+    CharArray(bytes) -> array read from the memory of a byte group
+    CharArray(int) -> array of size given by the parameter
+                      initialized with zeros
+    CharArray() -> empty array
+
+    Backed by a NumPy int8 buffer.
+    """
+    dtype = 'int8'
+    scalar = Char
+
+
+class UnsignedCharArray(TypedArray):
+    """
+    Mutable array of unsigned characters.
+
+    UnsignedCharArray(iterable_of_unsigned_chars) -> array initialized
+                                                     with given unsigned
+                                                     characters or integers
+    UnsignedCharArray(array) -> array converted from another typed array
+    UnsignedCharArray(bytes) -> array read from the memory of a byte group
+    UnsignedCharArray(int) -> array of size given by the parameter
+                              initialized with zeros
+    UnsignedCharArray() -> empty array
+
+    Backed by a NumPy uint8 buffer.
+    """
+    dtype = 'uint8'
+    scalar = UnsignedChar
+
+
+class ShortArray(TypedArray):
+    """
+    Mutable array of short integers.
+
+    Same constructors as CharArray.  Backed by a NumPy int16 buffer.
+    """
+    dtype = 'int16'
+    scalar = Short
+
+
+class UnsignedShortArray(TypedArray):
+    """
+    Mutable array of unsigned short integers.
+
+    Same constructors as CharArray.  Backed by a NumPy uint16 buffer.
+    """
+    dtype = 'uint16'
+    scalar = UnsignedShort
+
+
+class IntegerArray(TypedArray):
+    """
+    Mutable array of integers.
+
+    Same constructors as CharArray.  Backed by a NumPy int32 buffer.
+    """
+    dtype = 'int32'
+    scalar = Integer
+
+
+class UnsignedIntegerArray(TypedArray):
+    """
+    Mutable array of unsigned integers.
+
+    Same constructors as CharArray.  Backed by a NumPy uint32 buffer.
+    """
+    dtype = 'uint32'
+    scalar = UnsignedInteger
+
+
+class LongArray(TypedArray):
+    """
+    Mutable array of long integers.
+
+    Same constructors as CharArray.  Backed by a NumPy int64 buffer.
+    """
+    dtype = 'int64'
+    scalar = Long
+
+
+class UnsignedLongArray(TypedArray):
+    """
+    Mutable array of unsigned long integers.
+
+    Same constructors as CharArray.  Backed by a NumPy uint64 buffer.
+    """
+    dtype = 'uint64'
+    scalar = UnsignedLong
+
+
+class LongLongArray(TypedArray):
+    """
+    Mutable array of long long integers.
+
+    Same constructors as CharArray.  Backed by a NumPy int64 buffer.
+    """
+    dtype = 'int64'
+    scalar = LongLong
+
+
+class UnsignedLongLongArray(TypedArray):
+    """
+    Mutable array of unsigned long long integers.
+
+    Same constructors as CharArray.  Backed by a NumPy uint64 buffer.
+    """
+    dtype = 'uint64'
+    scalar = UnsignedLongLong
@@ -0,0 +1,377 @@
+from typing import Iterable, Iterator, Tuple
+
+from obj import MutableIterable
+from bits import Bit, true, false
+from bytes import Bytes, FrozenBytes, _BIT_MASKS
+
+__all__ = [
+    'BitArray',
+]
+
+_BYTE_BITS = tuple(tuple(true if value & mask else false
+                         for mask in _BIT_MASKS) for value in range(256))
+_REPR_LIMIT = 256
+_SCAN_BITS = 1 << 15
+
+
+class BitArray(MutableIterable):
+    """
+    Mutable array of bits packed eight to a byte.
+
+    BitArray(str) -> bit array of the 0 and 1 characters of the string
+    BitArray(bytes) -> bit array viewing the storage of the byte group
+    BitArray(frozen_bytes) -> bit array initialized with a copy of the
+                              bits of the frozen byte group
+    BitArray(iterable_of_bits) -> bit array initialized with given
+                                  bit-convertibles
+    BitArray(int) -> bit array of size given by the parameter
+                     initialized with zeros
+    BitArray() -> empty bit array
+
+    Construct a mutable bit array from:
+        - a string of 0 and 1, as returned by to_str()
+        - a byte group, a byte group view or a frozen byte group
+        - an iterable of bits
+        - an integer
+
+    Bits are numbered from the most significant bit of the first byte,
+    as in byte units.  A bit array of a byte group writes through to
+    its storage; view a range of it with BitArray(bytes.view(start,
+    stop)).  Range reads and writes, searches and counts work on whole
+    words of the packed storage, so no Bit object is created per bit.
+    The size of a bit array is fixed.
+    """
+    _data: bytearray
+    _length: int
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, value=0):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if isinstance(value, int):
+            self._data = bytearray(value + 7 >> 3)
+            self._length = value
+        elif isinstance(value, Bytes):
+            self._data = memoryview(value._data)
+            self._length = len(self._data) * 8
+        elif isinstance(value, (FrozenBytes, bytes, bytearray)):
+            self._data = bytearray(getattr(value, '_data', value))
+            self._length = len(self._data) * 8
+        elif isinstance(value, BitArray):
+            self._data = bytearray(value._data[:value._length + 7 >> 3])
+            self._length = value._length
+        elif isinstance(value, str):
+            if value.strip('01'):
+                raise ValueError(f'bit array strings may only contain 0 '
+                                 f'and 1, not {value!r}.')
+            self._length = len(value)
+            self._data = self._pack(int(value or '0', 2), self._length)
+        elif isinstance(value, Iterable):
+            bits = ''.join('1' if Bit(item) else '0' for item in value)
+            self._length = len(bits)
+            self._data = self._pack(int(bits or '0', 2), self._length)
+        else:
+            raise TypeError(f'cannot convert {type(value).__name__} '
+                            f'object to a bit array.')
+
+    @classmethod
+    def _wrap(cls, data: bytearray, length: int, /):
+        'Return a bit array using data as its storage without copying.'
+        self = cls.__new__(cls)
+        self._data = data
+        self._length = length
+        return self
+
+    @staticmethod
+    def _pack(value: int, length: int, /) -> bytearray:
+        'Return the packed storage of the first length bits of value.'
+        size = length + 7 >> 3
+        return bytearray((value << size * 8 - length).to_bytes(size, 'big'))
+
+    @classmethod
+    def from_int(cls, value, length, /):
+        'Return a bit array of length bits holding value, first bit high.'
+        if not 0 <= value < 1 << length:
+            raise ValueError(f'{value} does not fit in {length} bits.')
+        return cls._wrap(cls._pack(value, length), length)
+
+    # ----- Storage Methods ----- #
+    def _normalize_index(self, key: int, /) -> int:
+        'Return the non-negative position of index key.'
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError('bit array index out of range')
+        return key
+
+    def _bounds(self, start, stop, /) -> Tuple[int, int]:
+        'Return start and stop clamped like the bounds of a slice.'
+        start, stop, _ = slice(start, stop).indices(self._length)
+        return start, max(start, stop)
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self), truncated for large bit arrays.'
+        if self._length <= _REPR_LIMIT:
+            return f'BitArray({self.to_str()!r})'
+        bits = format(self.get_range(0, _REPR_LIMIT), f'0{_REPR_LIMIT}b')
+        return f'BitArray({bits!r}..., {self._length} bits)'
+
+    def __str__(self, /):
+        'Return str(self), truncated for large bit arrays.'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return the bits of the bit array as a string of 0 and 1.'
+        if not self._length:
+            return ''
+        return format(self.get_range(), f'0{self._length}b')
+
+    def to_mem(self, /):
+        'Return the memory representation of the bit array.'
+        return memoryview(self._data[:self._length + 7 >> 3]).hex(' ')
+
+    # ----- Comparison Methods ----- #
+    def __eq__(self, other, /):
+        'Return self==other.'
+        if isinstance(other, BitArray):
+            return (self._length == other._length and
+                    self.get_range() == other.get_range())
+        else:
+            return NotImplemented
+
+    def __ne__(self, other, /):
+        'Return self!=other.'
+        if isinstance(other, BitArray):
+            return not self.__eq__(other)
+        else:
+            return NotImplemented
+
+    # ----- Transformation Methods ----- #
+    def to_int(self, /):
+        'Return the bits as an integer, the first bit most significant.'
+        return self.get_range()
+
+    def to_bytes(self, /):
+        'Return a copy of the packed storage as bytes.'
+        return bytes(self._data[:self._length + 7 >> 3])
+
+    def __hash__(self, /):
+        'Return hash(self).'
+        raise TypeError("unhashable type: 'BitArray'")
+
+    def __bool__(self, /):
+        'Return bool(self).'
+        return self._length != 0
+
+    # ----- Bit Methods ----- #
+    def get(self, index, /):
+        'Return the bit at index.'
+        index = self._normalize_index(index)
+        return true if self._data[index >> 3] & _BIT_MASKS[index & 7] \
+            else false
+
+    def set(self, index, value=true, /):
+        'Set the bit at index to value, 1 by default.'
+        index = self._normalize_index(index)
+        if Bit(value):
+            self._data[index >> 3] |= _BIT_MASKS[index & 7]
+        else:
+            self._data[index >> 3] &= ~_BIT_MASKS[index & 7] & 0xFF
+
+    def reset(self, index, /):
+        'Set the bit at index to 0.'
+        self.set(index, false)
+
+    def flip(self, index, /):
+        'Invert the bit at index.'
+        index = self._normalize_index(index)
+        self._data[index >> 3] ^= _BIT_MASKS[index & 7]
+
+    def get_range(self, start=0, stop=None, /):
+        """
+        Return the bits of self[start:stop] as an integer,
+        the first bit most significant.
+        """
+        start, stop = self._bounds(start, stop)
+        if start == stop:
+            return 0
+        first, last = start >> 3, stop + 7 >> 3
+        word = int.from_bytes(self._data[first:last], 'big')
+        return word >> last * 8 - stop & (1 << stop - start) - 1
+
+    def set_range(self, start, stop, value, /):
+        """
+        Set the bits of self[start:stop] to the bits of integer value,
+        the first bit most significant.
+        """
+        start, stop = self._bounds(start, stop)
+        if not 0 <= value < 1 << stop - start:
+            raise ValueError(f'{value} does not fit in '
+                             f'{stop - start} bits.')
+        if start == stop:
+            return
+        first, last = start >> 3, stop + 7 >> 3
+        shift = last * 8 - stop
+        mask = (1 << stop - start) - 1 << shift
+        word = int.from_bytes(self._data[first:last], 'big')
+        word = word & ~mask | value << shift
+        self._data[first:last] = word.to_bytes(last - first, 'big')
+
+    def fill(self, value, start=0, stop=None, /):
+        'Set every bit of self[start:stop] to value.'
+        start, stop = self._bounds(start, stop)
+        value = 1 if Bit(value) else 0
+        head = min(stop, start + 7 & ~7)
+        tail = max(head, stop & ~7)
+        if start < head:
+            self.set_range(start, head, -value & (1 << head - start) - 1)
+        self._data[head >> 3:tail >> 3] = \
+            (b'\xff' if value else b'\x00') * (tail - head >> 3)
+        if tail < stop:
+            self.set_range(tail, stop, -value & (1 << stop - tail) - 1)
+
+    # ----- Search Methods ----- #
+    def _find(self, value, start, stop, /) -> int:
+        """
+        Return the lowest index of a bit equal to value in
+        self[start:stop].  Return -1 on failure.
+        """
+        start, stop = self._bounds(start, stop)
+        width = 64
+        while start < stop:
+            end = min(stop, start + width)
+            word = self.get_range(start, end)
+            if not value:
+                word ^= (1 << end - start) - 1
+            if word:
+                return end - word.bit_length()
+            start = end
+            width = min(width * 2, _SCAN_BITS)
+        return -1
+
+    def find_first_set(self, start=0, stop=None, /):
+        """
+        Return the lowest index of a set bit in self[start:stop].
+        Return -1 on failure.
+        """
+        return self._find(1, start, stop)
+
+    def find_first_clear(self, start=0, stop=None, /):
+        """
+        Return the lowest index of a clear bit in self[start:stop].
+        Return -1 on failure.
+        """
+        return self._find(0, start, stop)
+
+    def popcount(self, start=0, stop=None, /):
+        'Return the number of set bits in self[start:stop].'
+        return self.get_range(start, stop).bit_count()
+
+    def runs(self, start=0, stop=None, /) -> Iterator[Tuple[Bit, int, int]]:
+        """
+        Return an iterator of (bit, start, stop) for each run of equal
+        bits in self[start:stop].
+        """
+        start, stop = self._bounds(start, stop)
+        while start < stop:
+            bit = self.get(start)
+            end = self._find(not bit, start, stop)
+            if end == -1:
+                end = stop
+            yield bit, start, end
+            start = end
+
+    # ----- Iterable Methods ----- #
+    def __len__(self, /):
+        'Return len(self).'
+        return self._length
+
+    def __getitem__(self, key, /):
+        'Return self[key].'
+        if isinstance(key, int):
+            return self.get(key)
+        elif isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step == 1:
+                stop = max(start, stop)
+                return BitArray.from_int(self.get_range(start, stop),
+                                         stop - start)
+            return BitArray([self.get(index)
+                             for index in range(start, stop, step)])
+        else:
+            raise TypeError(f'bit array indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __setitem__(self, key, value, /):
+        'Set self[key] to value.'
+        if isinstance(key, int):
+            self.set(key, value)
+        elif isinstance(key, slice):
+            indices = range(*key.indices(self._length))
+            if not isinstance(value, BitArray):
+                value = BitArray(value)
+            if len(value) != len(indices):
+                raise ValueError('bit array memory size is fixed')
+            if indices.step == 1:
+                self.set_range(indices.start, indices.stop,
+                               value.get_range())
+            else:
+                for index, bit in zip(indices, value):
+                    self.set(index, bit)
+        else:
+            raise TypeError(f'bit array indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __delitem__(self, key, /):
+        'Delete self[key].'
+        if isinstance(key, (int, slice)):
+            raise ValueError('bit array memory size is fixed')
+        else:
+            raise TypeError(f'bit array indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __iter__(self, /):
+        'Implement iter(self).'
+        full, rest = divmod(self._length, 8)
+        for value in self._data[:full]:
+            yield from _BYTE_BITS[value]
+        if rest:
+            yield from _BYTE_BITS[self._data[full]][:rest]
+
+    def __reversed__(self, /):
+        'Return a reverse iterator over the object.'
+        full, rest = divmod(self._length, 8)
+        if rest:
+            yield from reversed(_BYTE_BITS[self._data[full]][:rest])
+        for value in reversed(self._data[:full]):
+            yield from reversed(_BYTE_BITS[value])
+
+    def __contains__(self, item, /):
+        'Return item in self.'
+        return self._find(Bit(item), 0, self._length) != -1
+
+    def clear(self, /):
+        'Remove all items from mutable.'
+        raise ValueError('bit array memory size is fixed')
+
+    def count(self, value, /):
+        'Return number of occurrences of value.'
+        ones = self.popcount()
+        return ones if Bit(value) else self._length - ones
+
+    def index(self, value, start=0, stop=9223372036854775807, /):
+        """
+        Return first index of value.
+
+        Raises ValueError if the value is not present.
+        """
+        index = self._find(Bit(value), start, stop)
+        if index == -1:
+            raise ValueError(f'{Bit(value)!r} is not in bit array')
+        return index
+
+    # ----- Mutational Methods ----- #
+    def copy(self, /):
+        'Return a bit array with a copy of the bits.'
+        return BitArray._wrap(bytearray(self._data[:self._length + 7 >> 3]),
+                              self._length)
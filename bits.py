@@ -6,6 +6,8 @@ __all__ = [
     'false',
 ]
 
+_INSTANCES = {}
+
 
 class Bit(Immutable):
     """
@@ -24,16 +26,34 @@ class Bit(Immutable):
     __slots__ = ('value',)
 
     # ----- Initialization Methods ----- #
-    def __init__(self, value=False, /):
-        'Initialize self.  See help(type(self)) for accurate signature.'
-        if isinstance(value, bool):
-            super(Immutable, self).__setattr__('value', value)
+    def __new__(cls, value=False, /):
+        'Create and return the shared instance for the truth of value.'
+        if isinstance(value, Bit):
+            return value
+        elif isinstance(value, bool):
+            pass
         elif hasattr(value, '__bool__'):
-            super(Immutable, self).__setattr__('value', value.__bool__())
+            value = value.__bool__()
         elif hasattr(value, '__len__'):
-            super(Immutable, self).__setattr__('value', len(value) != 0)
+            value = len(value) != 0
         else:
-            super(Immutable, self).__setattr__('value', True)
+            value = True
+
+        try:
+            return _INSTANCES[value]
+        except KeyError:
+            self = super().__new__(cls)
+            super(Immutable, self).__setattr__('value', value)
+            _INSTANCES[value] = self
+            return self
+
+    def __init__(self, value=False, /):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        pass
+
+    def __reduce__(self, /):
+        'Return state information for pickling.'
+        return Bit, (self.value,)
 
     # ----- Informal Methods ----- #
     def __repr__(self, /):
@@ -215,8 +235,8 @@ class Bit(Immutable):
 
     # ----- Custom Mutable Methods ----- #
     def copy(self, /):
-        'Return a copy of the binary digit.'
-        return Bit(self)
+        'Return a copy of the binary digit.  Bits are shared, so self.'
+        return self
 
 
 true = Bit(True)
@@ -1,13 +1,26 @@
-from typing import Iterable, List
+import mmap
+import os
+from itertools import islice
+from operator import and_, or_, xor
+from typing import Iterable, Iterator, List
 
-from obj import MutableIterable
+from obj import MutableIterable, Immutable, ImmutableIterable
 from bits import Bit, true, false
 
 __all__ = [
     'ByteUnit',
     'Bytes',
+    'FrozenByteUnit',
+    'FrozenBytes',
+    'MappedBytes',
+    'BytesView',
 ]
 
+_BIT_MASKS = tuple(0x80 >> i for i in range(8))
+_PRINTABLE = bytes(i if 0x20 <= i < 0x7f else 0x2e for i in range(256))
+_REPR_LIMIT = 64
+_COUNT_CHUNK = 1 << 20
+
 
 class ByteUnit(MutableIterable):
     """
@@ -21,6 +34,7 @@ class ByteUnit(MutableIterable):
     ByteUnit(iterable_of_bits) -> ByteUnit object initialized
                                     with given bits
     ByteUnit(byte_unit) -> mutable copy of the byte unit
+                           (or of a frozen byte unit)
     ByteUnit(int) -> ByteUnit object initialized with given value
     ByteUnit() -> empty ByteUnit object
 
@@ -29,13 +43,20 @@ class ByteUnit(MutableIterable):
         - an iterable of eight binary digits
         - a byte unit
         - an integer
+
+    The value is stored as a single integer; the bits are derived
+    from it by masking.
     """
 
+    _data: bytearray
+    _index: int
+
     # ----- Initialization Methods ----- #
     def __init__(self, *args):
         'Initialize self.  See help(type(self)) for accurate signature.'
+        self._index = 0
         if not args:
-            self.bits = [false for i in range(8)]
+            self._data = bytearray(1)
         elif len(args) == 1:
             arg = args[0]
 
@@ -43,29 +64,36 @@ class ByteUnit(MutableIterable):
                 if not 0 <= arg <= 255:
                     raise ValueError(f'a byte unit only accepts integer '
                                      f'from 0 to 255, not {arg}.')
-                self.bits = [false for i in range(8)]
-                for i in range(8):
-                    if arg & 2 ** i != 0:
-                        self.bits[7 - i] = true
+                self._data = bytearray((arg,))
             elif isinstance(arg, ByteUnit):
-                self.bits = [bit.copy() for bit in arg.bits]
+                self._data = bytearray((arg._data[arg._index],))
+            elif isinstance(arg, FrozenByteUnit):
+                self._data = bytearray((arg._value,))
             elif isinstance(arg, Iterable):
                 arg = [*arg]
                 if len(arg) != 8:
                     raise ValueError(f'a byte unit must have exactly '
                                      f'8 digits, not {len(arg)}.')
                 self._type_check(arg)
-                self.bits = [bit.copy() for bit in arg]
+                self._data = bytearray((self._from_bits(arg),))
             else:
                 raise TypeError(f'cannot convert {type(arg).__name__} object '
                                 f'to a byte unit.')
         elif len(args) == 8:
             self._type_check(args)
-            self.bits = [*args]
+            self._data = bytearray((self._from_bits(args),))
         else:
             raise ValueError(f'ByteUnit only takes 1, 8 or no arguments, '
                              f'not {len(args)}.')
 
+    @classmethod
+    def _view(cls, data: bytearray, index: int, /):
+        'Return a byte unit reading and writing data[index] in place.'
+        self = cls.__new__(cls)
+        self._data = data
+        self._index = index
+        return self
+
     # ----- Initialization Helper Methods ----- #
     @staticmethod
     def _type_check(iterable: Iterable):
@@ -75,7 +103,26 @@ class ByteUnit(MutableIterable):
                 raise TypeError(f'digits of a bit unit must be bits, '
                                 f'not {type(bit).__name__}.')
 
-    # ----- Informal Methods ----- #s
+    @staticmethod
+    def _from_bits(bits: Iterable, /) -> int:
+        'Return the integer value of bits, most significant first.'
+        value = 0
+        for bit in bits:
+            value = value << 1 | (1 if bit else 0)
+        return value
+
+    # ----- Storage Methods ----- #
+    @property
+    def bits(self, /) -> List[Bit]:
+        'The eight binary digits of the byte unit, most significant first.'
+        value = self._data[self._index]
+        return [true if value & mask else false for mask in _BIT_MASKS]
+
+    @bits.setter
+    def bits(self, bits: Iterable, /):
+        self._data[self._index] = self._from_bits(bits)
+
+    # ----- Informal Methods ----- #
     def __repr__(self, /):
         'Return repr(self).'
         return f'ByteUnit({self.to_str()!r})'
@@ -86,67 +133,61 @@ class ByteUnit(MutableIterable):
 
     def to_str(self, /):
         'Return a raw representation of the byte unit.'
-        return chr(self.to_int())
+        return chr(self._data[self._index])
 
     def to_mem(self, /):
         'Return a hexadecimal representation of the byte unit memory.'
-        return f'{self.to_int():0>2x}'
+        return f'{self._data[self._index]:0>2x}'
 
     # ----- Comparison Methods ----- #
     def __lt__(self, other, /):
         'Return self<other.'
         if isinstance(other, ByteUnit):
-            return self.bits < other.bits
+            return self._data[self._index] < other._data[other._index]
         else:
             return NotImplemented
 
     def __le__(self, other, /):
         'Return self<=other.'
         if isinstance(other, ByteUnit):
-            return self.bits <= other.bits
+            return self._data[self._index] <= other._data[other._index]
         else:
             return NotImplemented
 
     def __eq__(self, other, /):
         'Return self==other.'
         if isinstance(other, ByteUnit):
-            return self.bits == other.bits
+            return self._data[self._index] == other._data[other._index]
         elif isinstance(other, int):
-            char = 0
-            for i in range(8):
-                char += 2 ** (7 - i) * self.bits[i].value
-            return char == other
+            return self._data[self._index] == other
         else:
             return NotImplemented
 
     def __ne__(self, other, /):
         'Return self!=other.'
         if isinstance(other, ByteUnit):
-            return self.bits != other.bits
+            return self._data[self._index] != other._data[other._index]
         else:
             return NotImplemented
 
     def __gt__(self, other, /):
         'Return self>other.'
         if isinstance(other, ByteUnit):
-            return self.bits > other.bits
+            return self._data[self._index] > other._data[other._index]
         else:
             return NotImplemented
 
     def __ge__(self, other, /):
         'Return self>=other.'
         if isinstance(other, ByteUnit):
-            return self.bits >= other.bits
+            return self._data[self._index] >= other._data[other._index]
         else:
             return NotImplemented
 
     # ----- Transformation Methods ----- #
     def to_int(self, /):
         'Return a python integer translation of the byte unit.'
-        num = 0
-        for i in range(8):
-            num += 2 ** (7 - i) * self.bits[i].value
-        return num
+        return self._data[self._index]
 
     def __hash__(self, /):
         'Return hash(self).'
@@ -154,7 +195,7 @@ class ByteUnit(MutableIterable):
 
     def __bool__(self, /):
         'Return bool(self).'
-        return any(self.bits)
+        return self._data[self._index] != 0
 
     # ----- Iterable Methods ----- #
     def __len__(self, /):
@@ -163,8 +204,15 @@ class ByteUnit(MutableIterable):
 
     def __getitem__(self, key, /):
         'Return self[key].'
-        if isinstance(key, (int, slice)):
-            return self.bits[key]
+        if isinstance(key, int):
+            if not -8 <= key < 8:
+                raise IndexError('byte unit index out of range')
+            return true if self._data[self._index] & _BIT_MASKS[key] \
+                else false
+        elif isinstance(key, slice):
+            value = self._data[self._index]
+            return [true if value & mask else false
+                    for mask in _BIT_MASKS[key]]
         else:
             raise TypeError(f'byte unit indices must be integers or slices, '
                             f'not {type(key).__name__}')
@@ -172,11 +220,23 @@ class ByteUnit(MutableIterable):
     def __setitem__(self, key, value, /):
         'Set self[key] to value.'
         if isinstance(key, int):
-            self.bits[key] = Bit(value)
+            if not -8 <= key < 8:
+                raise IndexError('byte unit assignment index out of range')
+            if Bit(value):
+                self._data[self._index] |= _BIT_MASKS[key]
+            else:
+                self._data[self._index] &= ~_BIT_MASKS[key] & 0xFF
         elif isinstance(key, slice):
-            if len(value) != len(self.bits[key]):
+            masks = _BIT_MASKS[key]
+            if len(value) != len(masks):
                 raise ValueError('unmatched value length')
-            self.bits[key] = [Bit(bit) for bit in value]
+            byte = self._data[self._index]
+            for mask, bit in zip(masks, value):
+                if Bit(bit):
+                    byte |= mask
+                else:
+                    byte &= ~mask & 0xFF
+            self._data[self._index] = byte
         else:
             raise TypeError(f'byte unit indices must be integers or slices, '
                             f'not {type(key).__name__}')
@@ -199,7 +259,11 @@ class ByteUnit(MutableIterable):
 
     def count(self, value, /):
         'Return number of occurrences of value.'
-        return self.bits.count(value)
+        if isinstance(value, (Bit, bool)):
+            ones = self._data[self._index].bit_count()
+            return ones if value else 8 - ones
+        else:
+            return 0
 
     def index(self, value, start=0, stop=9223372036854775807, /):
         """
@@ -212,7 +276,125 @@ class ByteUnit(MutableIterable):
     # ----- Mutational Methods ----- #
     def copy(self, /):
         'Return a copy of the byte unit.'
-        return ByteUnit((bit.copy() for bit in self.bits))
+        return ByteUnit(self._data[self._index])
+
+
+def _byte_value(item, /) -> int:
+    'Return the integer value of a byte-unit-convertible object.'
+    if isinstance(item, int):
+        if not 0 <= item <= 255:
+            raise ValueError(f'a byte unit only accepts integer '
+                             f'from 0 to 255, not {item}.')
+        return item
+    elif isinstance(item, ByteUnit):
+        return item._data[item._index]
+    elif isinstance(item, FrozenByteUnit):
+        return item._value
+    else:
+        return ByteUnit(item)._data[0]
+
+
+def _data_repr(name, data, /):
+    'Return the repr of a byte group storage, truncated when large.'
+    if len(data) <= _REPR_LIMIT:
+        return f'{name}({str(data, "latin-1")!r})'
+    return (f'{name}({str(data[:_REPR_LIMIT], "latin-1")!r}..., '
+            f'{len(data)} bytes)')
+
+
+def _bulk_values(iterable, factory, /):
+    'Return factory applied to the values of byte-unit-convertibles.'
+    if isinstance(iterable, (list, tuple, range)):
+        try:
+            return factory(iterable)
+        except (TypeError, ValueError):
+            pass
+    return factory(_byte_value(item) for item in iterable)
+
+
+def _buffer(obj, /) -> memoryview:
+    'Return a flat unsigned byte memoryview of a bytes-like object.'
+    if isinstance(obj, (Bytes, FrozenBytes)):
+        obj = obj._data
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        raise TypeError(f'a bytes-like object is required, '
+                        f'not {type(obj).__name__}.') from None
+    return view.cast('B') if view.format != 'B' or view.ndim != 1 else view
+
+
+def _buffer_range(buffer, offset, length, /) -> memoryview:
+    'Return the memoryview of length bytes of a buffer from offset.'
+    view = _buffer(buffer)
+    if not 0 <= offset <= len(view):
+        raise ValueError(f'offset must be non-negative and no greater '
+                         f'than buffer length ({len(view)}), not {offset}.')
+    if length < 0:
+        return view[offset:]
+    if offset + length > len(view):
+        raise ValueError(f'buffer is smaller than requested size '
+                         f'({offset + length} bytes).')
+    return view[offset:offset + length]
+
+
+def _bitwise(data, other, operation, /):
+    """
+    Return the bytes of operation applied to the values of two buffers of
+    the same size as big-endian integers, or None for other operands.
+    """
+    if isinstance(other, (Bytes, FrozenBytes)):
+        other = other._data
+    elif isinstance(other, (bytes, bytearray, memoryview)):
+        other = _buffer(other)
+    else:
+        return None
+    if len(data) != len(other):
+        raise ValueError(f'byte groups must have the same size, '
+                         f'not {len(data)} and {len(other)}.')
+    value = operation(int.from_bytes(data, 'big'),
+                      int.from_bytes(other, 'big'))
+    return value.to_bytes(len(data), 'big')
+
+
+def _invert(data, /) -> bytes:
+    'Return the bytes of a buffer with every bit flipped.'
+    mask = (1 << len(data) * 8) - 1
+    return (int.from_bytes(data, 'big') ^ mask).to_bytes(len(data), 'big')
+
+
+def _shift(data, count, /) -> bytes:
+    """
+    Return the bytes of a buffer logically shifted by count bits, towards
+    the first byte when count is positive and towards the last otherwise.
+    """
+    size = len(data)
+    if abs(count) >= size * 8:
+        return bytes(size)
+    value = int.from_bytes(data, 'big')
+    if count >= 0:
+        value = value << count & (1 << size * 8) - 1
+    else:
+        value >>= -count
+    return value.to_bytes(size, 'big')
+
+
+def _rotate(data, count, /) -> bytes:
+    'Return the bytes of a buffer rotated left by count bits.'
+    bits = len(data) * 8
+    if not bits:
+        return b''
+    count %= bits
+    value = int.from_bytes(data, 'big')
+    value = (value << count | value >> bits - count) & (1 << bits) - 1
+    return value.to_bytes(len(data), 'big')
+
+
+def _shift_count(count, /) -> int:
+    'Return a shift count, rejecting negative ones.'
+    if count < 0:
+        raise ValueError('negative shift count')
+    return count
 
 
 class Bytes(MutableIterable):
@@ -222,6 +404,7 @@ class Bytes(MutableIterable):
     Bytes(iterable_of_byte_units) -> Bytes object initialized
                                      with given byte-unit-convertibles
     Bytes(bytes) -> mutable copy of the byte group
+                    (or of a frozen byte group)
     Bytes(int) -> byte group of size given by the parameter
                   initialized with empty byte units
     Bytes() -> empty byte group
@@ -230,102 +413,230 @@ class Bytes(MutableIterable):
         - an iterable of byte units
         - a byte group
         - an integer
+
+    The content is stored packed in a single bytearray.  Byte units
+    returned by indexing or iteration are views of that storage, so
+    setting their bits writes through to the byte group.
+
+    Byte groups export their storage through the buffer protocol of
+    PEP 688, which only Python 3.12 and later honour; on older versions
+    pass b.to_memoryview() to memoryview, struct, hashlib or file
+    writes instead of b.  b.view(start, stop) returns a byte group view
+    of a range without copying.  As for a bytearray, the size cannot
+    change while an exported buffer or a view is alive.
+
+    The bitwise operators treat a byte group as a single big-endian
+    integer, most significant bit first: &, | and ^ combine byte groups
+    of the same size, ~ flips every bit, and << and >> are logical
+    shifts that keep the size.
     """
-    bytes: List[ByteUnit]
+    _data: bytearray
 
     # ----- Initialization Methods ----- #
     def __init__(self, value=0):
         'Initialize self.  See help(type(self)) for accurate signature.'
         if isinstance(value, int):
-            self.bytes = [ByteUnit() for i in range(value)]
-        elif isinstance(value, Bytes):
-            self.bytes = [byte.copy() for byte in value.bytes]
+            self._data = bytearray(value)
+        elif isinstance(value, (Bytes, FrozenBytes)):
+            self._data = bytearray(value._data)
+        elif isinstance(value, (bytes, bytearray)):
+            self._data = bytearray(value)
         elif isinstance(value, Iterable):
-            self.bytes = [ByteUnit(item) for item in value]
+            self._data = _bulk_values(value, bytearray)
         else:
             raise TypeError(f'cannot convert {type(value).__name__} '
                             f'object to a byte group.')
 
+    @classmethod
+    def _wrap(cls, data: bytearray, /):
+        'Return a byte group using data as its storage without copying.'
+        self = cls.__new__(cls)
+        self._data = data
+        return self
+
+    @staticmethod
+    def from_bytes(data, /):
+        'Return a byte group copied from a bytes-like object.'
+        return Bytes._wrap(bytearray(_buffer(data)))
+
+    @staticmethod
+    def frombuffer(buffer, offset=0, length=-1, /):
+        """
+        Return a byte group copied from length bytes of a buffer,
+        starting at offset.  A negative length copies to the end.
+        """
+        return Bytes._wrap(bytearray(_buffer_range(buffer, offset, length)))
+
+    # ----- Storage Methods ----- #
+    @property
+    def bytes(self, /) -> List[ByteUnit]:
+        'A list of byte unit views of the byte group.'
+        return [*self]
+
+    def _normalize_index(self, key: int, /) -> int:
+        'Return the non-negative position of index key.'
+        length = len(self._data)
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError('byte group index out of range')
+        return key
+
     # ----- Informal Methods ----- #
     def __repr__(self, /):
-        'Return repr(self).'
-        return f'Bytes({self.to_str()!r})'
+        'Return repr(self), truncated for large byte groups.'
+        return _data_repr('Bytes', self._data)
 
     def __str__(self, /):
-        'Return str(self).'
-        return f'Bytes({self.to_str()!r})'
+        'Return str(self), truncated for large byte groups.'
+        return _data_repr('Bytes', self._data)
 
     def to_str(self, /):
         'Return a raw representation of the byte group.'
-        return ''.join(byte.to_str() for byte in self.bytes)
+        return self._data.decode('latin-1')
 
     def to_mem(self, /):
         'Return a hexadecimal representation of the byte group memory.'
-        return ' '.join(byte.to_mem() for byte in self.bytes)
+        return self._data.hex(' ')
+
+    def hexdump(self, start=0, stop=None, /, *,
+                width=16, collapse=True) -> Iterator[str]:
+        """
+        Generate the lines of a hexdump -C style dump of self[start:stop].
+
+        Each line holds the offset, width bytes in hexadecimal and an
+        ASCII gutter.  Runs of lines repeating the previous one are
+        collapsed to a single '*' line unless collapse is false.  The
+        last line is the end offset.  Only one line of the byte group
+        is copied at a time.
+        """
+        if width <= 0:
+            raise ValueError(f'hexdump width must be positive, not {width}.')
+        start, stop, _ = slice(start, stop).indices(len(self._data))
+        data = self._data
+        digits = max(8, len(f'{stop:x}'))
+        padding = 3 * width - 1 + (width - 1) // 8
+        previous = None
+        skipping = False
+        for offset in range(start, stop, width):
+            line = data[offset:min(offset + width, stop)]
+            if collapse and line == previous:
+                if not skipping:
+                    skipping = True
+                    yield '*'
+                continue
+            previous = line
+            skipping = False
+            columns = '  '.join(line[i:i + 8].hex(' ')
+                                for i in range(0, len(line), 8))
+            yield (f'{offset:0{digits}x}  {columns:<{padding}}  '
+                   f'|{bytes(line).translate(_PRINTABLE).decode()}|')
+        if stop > start:
+            yield f'{stop:0{digits}x}'
+
+    def write_hexdump(self, file, start=0, stop=None, /, *,
+                      width=16, collapse=True):
+        'Write the hexdump of self[start:stop] to a text file in chunks.'
+        lines = self.hexdump(start, stop, width=width, collapse=collapse)
+        while chunk := [*islice(lines, 4096)]:
+            file.write('\n'.join(chunk))
+            file.write('\n')
 
     # ----- Comparison Methods ----- #
     def __lt__(self, other, /):
         'Return self<other.'
         if isinstance(other, Bytes):
-            return self.bytes < other.bytes
+            return self._data < other._data
         else:
             return NotImplemented
 
     def __le__(self, other, /):
         'Return self<=other.'
         if isinstance(other, Bytes):
-            return self.bytes <= other.bytes
+            return self._data <= other._data
         else:
             return NotImplemented
 
     def __eq__(self, other, /):
         'Return self==other.'
         if isinstance(other, Bytes):
-            return self.bytes == other.bytes
+            return self._data == other._data
         else:
             return NotImplemented
 
     def __ne__(self, other, /):
         'Return self!=other.'
         if isinstance(other, Bytes):
-            return self.bytes != other.bytes
+            return self._data != other._data
         else:
             return NotImplemented
 
     def __gt__(self, other, /):
         'Return self>other.'
         if isinstance(other, Bytes):
-            return self.bytes > other.bytes
+            return self._data > other._data
         else:
             return NotImplemented
 
     def __ge__(self, other, /):
         'Return self>=other.'
         if isinstance(other, Bytes):
-            return self.bytes >= other.bytes
+            return self._data >= other._data
         else:
             return NotImplemented
 
     # ----- Transformation Methods ----- #
     def __hash__(self, /):
         'Return hash(self).'
-        return hash(self.bytes)
+        return hash(self._data)
 
     def __bool__(self, /):
         'Return bool(self).'
-        return len(self.bytes) != 0
+        return len(self._data) != 0
+
+    def to_memoryview(self, /):
+        'Return a memoryview of the storage without copying.'
+        return memoryview(self._data)
+
+    def to_bytes(self, /):
+        'Return a python bytes copy of the byte group.'
+        return bytes(self._data)
+
+    def readinto(self, buffer, /):
+        """
+        Copy the byte group to the start of a writable buffer.
+
+        Return the number of bytes copied, at most the buffer size.
+        """
+        view = _buffer(buffer)
+        size = min(len(view), len(self._data))
+        view[:size] = memoryview(self._data)[:size]
+        return size
+
+    def view(self, start=0, stop=None, /):
+        'Return a view sharing the storage of self[start:stop].'
+        return BytesView(self, start, stop)
+
+    # ----- Buffer Methods ----- #
+    def __buffer__(self, flags, /):
+        'Return a buffer object that exposes the underlying memory.'
+        return memoryview(self._data)
+
+    def __release_buffer__(self, buffer, /):
+        'Release the buffer object that exposes the underlying memory.'
+        buffer.release()
 
     # ----- Iterable Methods ----- #
     def __len__(self, /):
         'Return len(self).'
-        return len(self.bytes)
+        return len(self._data)
 
     def __getitem__(self, key, /):
         'Return self[key].'
         if isinstance(key, int):
-            return self.bytes[key]
+            return ByteUnit._view(self._data, self._normalize_index(key))
         elif isinstance(key, slice):
-            return Bytes(self.bytes[key])
+            return Bytes._wrap(self._data[key])
         else:
             raise TypeError(f'byte group indices must be integers or slices, '
                             f'not {type(key).__name__}')
@@ -333,9 +644,9 @@ class Bytes(MutableIterable):
     def __setitem__(self, key, value, /):
         'Set self[key] to value.'
         if isinstance(key, int):
-            self.bytes[key] = ByteUnit(value)
+            self._data[self._normalize_index(key)] = _byte_value(value)
         elif isinstance(key, slice):
-            self.bytes[key] = Bytes(value).bytes
+            self._data[key] = Bytes(value)._data
         else:
             raise TypeError(f'byte group indices must be integers or slices, '
                             f'not {type(key).__name__}')
@@ -343,42 +654,49 @@ class Bytes(MutableIterable):
     def __delitem__(self, key, /):
         'Delete self[key].'
         if isinstance(key, (int, slice)):
-            del self.bytes[key]
+            del self._data[key]
         else:
             raise TypeError(f'byte group indices must be integers or slices, '
                             f'not {type(key).__name__}')
 
     def __iter__(self, /):
         'Implement iter(self).'
-        return iter(self.bytes)
+        data = self._data
+        return (ByteUnit._view(data, i) for i in range(len(data)))
 
     def __reversed__(self, /):
         'Return a reverse iterator over the object.'
-        return reversed(self.bytes)
+        data = self._data
+        return (ByteUnit._view(data, i) for i in reversed(range(len(data))))
 
     def __contains__(self, item, /):
         'Return item in self.'
-        if isinstance(item, (ByteUnit, int)):
-            return item in self.bytes
-        elif isinstance(item, Bytes):
-            if len(item) > len(self):
-                return False
-            item_len = len(item)
-            for i in range(len(self) - item_len + 1):
-                if item == self[i:i + item_len]:
-                    return True
-            else:
-                return False
+        if isinstance(item, (ByteUnit, FrozenByteUnit, int)):
+            return self.count(item) != 0
+        elif isinstance(item, (Bytes, FrozenBytes, bytes, bytearray)):
+            return self._data.find(self._search_key(item)) != -1
         else:
             return NotImplemented
 
     def clear(self, /):
         'Remove all items from mutable.'
-        self.bytes.clear()
+        self._data.clear()
+
+    def fill(self, value, start=0, stop=None, /):
+        'Set every byte of self[start:stop] to value.'
+        start, stop, _ = slice(start, stop).indices(len(self._data))
+        if stop > start:
+            self._data[start:stop] = bytes((_byte_value(value),)) * \
+                (stop - start)
 
     def count(self, value, /):
         'Return number of occurrences of value.'
-        return self.bytes.count(value)
+        if isinstance(value, (ByteUnit, FrozenByteUnit)):
+            return self._data.count(value.to_int())
+        elif isinstance(value, int) and 0 <= value <= 255:
+            return self._data.count(value)
+        else:
+            return 0
 
     def index(self, value, start=0, stop=9223372036854775807, /):
         """
@@ -386,15 +704,73 @@ class Bytes(MutableIterable):
 
         Raises ValueError if the value is not present.
         """
-        return self.bytes.index(value, start, stop)
+        if isinstance(value, (ByteUnit, FrozenByteUnit)):
+            return self._data.index(value.to_int(), start, stop)
+        elif isinstance(value, int) and 0 <= value <= 255:
+            return self._data.index(value, start, stop)
+        else:
+            raise ValueError(f'{value!r} is not in byte group')
+
+    # ----- Search Methods ----- #
+    @staticmethod
+    def _search_key(sub, /):
+        'Return sub as an argument of the bytearray search methods.'
+        if isinstance(sub, (Bytes, FrozenBytes)):
+            return sub._data
+        elif isinstance(sub, (ByteUnit, FrozenByteUnit)):
+            return sub.to_int()
+        elif isinstance(sub, (int, bytes, bytearray)):
+            return sub
+        else:
+            raise TypeError(f'cannot search for {type(sub).__name__} '
+                            f'in a byte group')
+
+    def find(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return the lowest index where subsection sub is found,
+        such that sub is contained within self[start:stop].
+
+        Return -1 on failure.
+        """
+        return self._data.find(self._search_key(sub), start, stop)
+
+    def rfind(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return the highest index where subsection sub is found,
+        such that sub is contained within self[start:stop].
+
+        Return -1 on failure.
+        """
+        return self._data.rfind(self._search_key(sub), start, stop)
+
+    def finditer(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return an iterator over the indices of the non-overlapping
+        occurrences of subsection sub in self[start:stop].
+        """
+        data = self._data
+        key = self._search_key(sub)
+        step = 1 if isinstance(key, int) else max(len(key), 1)
+        start, stop, _ = slice(start, stop).indices(len(data))
+        index = data.find(key, start, stop)
+        while index != -1:
+            yield index
+            index = data.find(key, index + step, stop)
+
+    def count_subsequence(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return the number of non-overlapping occurrences of
+        subsection sub in self[start:stop].
+        """
+        return self._data.count(self._search_key(sub), start, stop)
 
     # ----- Calculation Methods ----- #
     def __add__(self, other, /):
         'Return self+other.'
-        if isinstance(other, Bytes):
-            return Bytes(self.bytes + other.bytes)
+        if isinstance(other, (Bytes, FrozenBytes)):
+            return Bytes._wrap(self._data + other._data)
         elif isinstance(other, bytes):
-            return Bytes(self.bytes + Bytes(other).bytes)
+            return Bytes._wrap(self._data + other)
         else:
             raise TypeError(f"can't concat {type(other).__name__}"
                             f" to byte groups")
@@ -402,7 +778,7 @@ class Bytes(MutableIterable):
     def __mul__(self, other, /):
         'Return self*other.'
         if isinstance(other, int):
-            return Bytes(self.bytes * other)
+            return Bytes._wrap(self._data * other)
         else:
             raise TypeError(f"can't multiply sequence by non-int of "
                             f"type '{type(other).__name__}'")
@@ -410,12 +786,969 @@ class Bytes(MutableIterable):
     def __rmul__(self, other, /):
         'Return other*self.'
         if isinstance(other, int):
-            return Bytes(self.bytes * other)
+            return Bytes._wrap(self._data * other)
         else:
             raise TypeError(f"can't multiply sequence by non-int of "
                             f"type '{type(other).__name__}'")
 
+    # ----- Bitwise Calculation Methods ----- #
+    def __and__(self, other, /):
+        'Return self&other.'
+        result = _bitwise(self._data, other, and_)
+        return NotImplemented if result is None else Bytes(result)
+
+    def __rand__(self, other, /):
+        'Return other&self.'
+        result = _bitwise(self._data, other, and_)
+        return NotImplemented if result is None else Bytes(result)
+
+    def __xor__(self, other, /):
+        'Return self^other.'
+        result = _bitwise(self._data, other, xor)
+        return NotImplemented if result is None else Bytes(result)
+
+    def __rxor__(self, other, /):
+        'Return other^self.'
+        result = _bitwise(self._data, other, xor)
+        return NotImplemented if result is None else Bytes(result)
+
+    def __or__(self, other, /):
+        'Return self|other.'
+        result = _bitwise(self._data, other, or_)
+        return NotImplemented if result is None else Bytes(result)
+
+    def __ror__(self, other, /):
+        'Return other|self.'
+        result = _bitwise(self._data, other, or_)
+        return NotImplemented if result is None else Bytes(result)
+
+    def __invert__(self, /):
+        'Return ~self.'
+        return Bytes(_invert(self._data))
+
+    def __lshift__(self, other, /):
+        'Return self<<other.'
+        if isinstance(other, int):
+            return Bytes(_shift(self._data, _shift_count(other)))
+        else:
+            return NotImplemented
+
+    def __rshift__(self, other, /):
+        'Return self>>other.'
+        if isinstance(other, int):
+            return Bytes(_shift(self._data, -_shift_count(other)))
+        else:
+            return NotImplemented
+
+    def rotate_left(self, count, /):
+        'Return the byte group rotated left by count bits.'
+        return Bytes(_rotate(self._data, count))
+
+    def rotate_right(self, count, /):
+        'Return the byte group rotated right by count bits.'
+        return Bytes(_rotate(self._data, -count))
+
+    def popcount(self, start=0, stop=None, /):
+        'Return the number of set bits in self[start:stop].'
+        return int.from_bytes(self._data[start:stop], 'big').bit_count()
+
+    # ----- In-place Calculation Methods ----- #
+    def _assign(self, result, /):
+        'Store the content of result in self, keeping its size.'
+        if result is NotImplemented:
+            return NotImplemented
+        self._data[:] = result._data
+        return self
+
+    def __iand__(self, other, /):
+        'Implement self&=other.'
+        return self._assign(self.__and__(other))
+
+    def __ixor__(self, other, /):
+        'Implement self^=other.'
+        return self._assign(self.__xor__(other))
+
+    def __ior__(self, other, /):
+        'Implement self|=other.'
+        return self._assign(self.__or__(other))
+
+    def __ilshift__(self, other, /):
+        'Implement self<<=other.'
+        return self._assign(self.__lshift__(other))
+
+    def __irshift__(self, other, /):
+        'Implement self>>=other.'
+        return self._assign(self.__rshift__(other))
+
     # ----- Mutational Methods ----- #
     def copy(self, /):
         'Return a copy of the byte group.'
-        return Bytes((byte.copy() for byte in self.bytes))
+        return Bytes._wrap(bytearray(self._data))
+
+
+_FROZEN_BYTE_UNITS = [None] * 256
+
+
+class FrozenByteUnit(ImmutableIterable):
+    """
+    Immutable byte unit (containing data of one byte).
+    Mostly used indirectly by frozen byte groups.
+    The value can be from 0 to 255.
+
+    FrozenByteUnit(Bit, Bit, Bit, Bit,
+                   Bit, Bit, Bit, Bit) -> FrozenByteUnit object initialized
+                                          with given bits
+    FrozenByteUnit(iterable_of_bits) -> FrozenByteUnit object initialized
+                                        with given bits
+    FrozenByteUnit(byte_unit) -> frozen copy of the byte unit
+    FrozenByteUnit(int) -> FrozenByteUnit object initialized with given value
+    FrozenByteUnit() -> empty FrozenByteUnit object
+
+    Construct an immutable byte unit from:
+        - eight binary digits
+        - an iterable of eight binary digits
+        - a byte unit or a frozen byte unit
+        - an integer
+
+    There is exactly one instance for each of the 256 values, so
+    frozen byte units are hashable and cheap to create.
+    """
+    _value: int
+    _hash: int
+
+    __slots__ = ('_value', '_hash')
+
+    # ----- Initialization Methods ----- #
+    def __new__(cls, *args):
+        'Create and return the shared instance for the given value.'
+        if len(args) == 1 and isinstance(args[0], FrozenByteUnit):
+            return args[0]
+        elif len(args) == 1 and isinstance(args[0], int):
+            value = args[0]
+            if not 0 <= value <= 255:
+                raise ValueError(f'a byte unit only accepts integer '
+                                 f'from 0 to 255, not {value}.')
+        elif len(args) == 1 and isinstance(args[0], ByteUnit):
+            value = args[0].to_int()
+        else:
+            value = ByteUnit(*args).to_int()
+
+        self = _FROZEN_BYTE_UNITS[value]
+        if self is None:
+            self = super().__new__(cls)
+            super(Immutable, self).__setattr__('_value', value)
+            super(Immutable, self).__setattr__('_hash', hash(value))
+            _FROZEN_BYTE_UNITS[value] = self
+        return self
+
+    def __init__(self, *args):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        pass
+
+    def __reduce__(self, /):
+        'Return state information for pickling.'
+        return FrozenByteUnit, (self._value,)
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return f'FrozenByteUnit({self.to_str()!r})'
+
+    def __str__(self, /):
+        'Return str(self).'
+        return f'FrozenByteUnit({self.to_str()!r})'
+
+    def to_str(self, /):
+        'Return a raw representation of the byte unit.'
+        return chr(self._value)
+
+    def to_mem(self, /):
+        'Return a hexadecimal representation of the byte unit memory.'
+        return f'{self._value:0>2x}'
+
+    # ----- Comparison Methods ----- #
+    def __lt__(self, other, /):
+        'Return self<other.'
+        if isinstance(other, (ByteUnit, FrozenByteUnit)):
+            return self._value < other.to_int()
+        else:
+            return NotImplemented
+
+    def __le__(self, other, /):
+        'Return self<=other.'
+        if isinstance(other, (ByteUnit, FrozenByteUnit)):
+            return self._value <= other.to_int()
+        else:
+            return NotImplemented
+
+    def __eq__(self, other, /):
+        'Return self==other.'
+        if isinstance(other, (ByteUnit, FrozenByteUnit)):
+            return self._value == other.to_int()
+        elif isinstance(other, int):
+            return self._value == other
+        else:
+            return NotImplemented
+
+    def __ne__(self, other, /):
+        'Return self!=other.'
+        if isinstance(other, (ByteUnit, FrozenByteUnit)):
+            return self._value != other.to_int()
+        elif isinstance(other, int):
+            return self._value != other
+        else:
+            return NotImplemented
+
+    def __gt__(self, other, /):
+        'Return self>other.'
+        if isinstance(other, (ByteUnit, FrozenByteUnit)):
+            return self._value > other.to_int()
+        else:
+            return NotImplemented
+
+    def __ge__(self, other, /):
+        'Return self>=other.'
+        if isinstance(other, (ByteUnit, FrozenByteUnit)):
+            return self._value >= other.to_int()
+        else:
+            return NotImplemented
+
+    # ----- Transformation Methods ----- #
+    def to_int(self, /):
+        'Return a python integer translation of the byte unit.'
+        return self._value
+
+    def __hash__(self, /):
+        'Return hash(self).'
+        return self._hash
+
+    def __bool__(self, /):
+        'Return bool(self).'
+        return self._value != 0
+
+    # ----- Iterable Methods ----- #
+    def __len__(self, /):
+        'Return len(self).'
+        return 8
+
+    def __getitem__(self, key, /):
+        'Return self[key].'
+        if isinstance(key, int):
+            if not -8 <= key < 8:
+                raise IndexError('byte unit index out of range')
+            return true if self._value & _BIT_MASKS[key] else false
+        elif isinstance(key, slice):
+            return [true if self._value & mask else false
+                    for mask in _BIT_MASKS[key]]
+        else:
+            raise TypeError(f'byte unit indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __iter__(self, /):
+        'Implement iter(self).'
+        return iter(self[:])
+
+    def __reversed__(self, /):
+        'Return a reverse iterator over the object.'
+        return reversed(self[:])
+
+    def __contains__(self, item, /):
+        'Return item in self.'
+        return self.count(item) != 0
+
+    def count(self, value, /):
+        'Return number of occurrences of value.'
+        if isinstance(value, (Bit, bool)):
+            ones = self._value.bit_count()
+            return ones if value else 8 - ones
+        else:
+            return 0
+
+    def index(self, value, start=0, stop=9223372036854775807, /):
+        """
+        Return first index of value.
+
+        Raises ValueError if the value is not present.
+        """
+        return self[:].index(value, start, stop)
+
+    # ----- Custom Mutable Methods ----- #
+    def copy(self, /):
+        'Return a copy of the byte unit.  Frozen byte units are shared.'
+        return self
+
+
+class FrozenBytes(ImmutableIterable):
+    """
+    Immutable byte group (multiple bytes).
+
+    FrozenBytes(iterable_of_byte_units) -> FrozenBytes object initialized
+                                           with given byte-unit-convertibles
+    FrozenBytes(bytes) -> frozen copy of the byte group
+    FrozenBytes(int) -> frozen byte group of size given by the parameter
+                        initialized with empty byte units
+    FrozenBytes() -> empty frozen byte group
+
+    Construct an immutable byte group from:
+        - an iterable of byte units
+        - a byte group or a frozen byte group
+        - an integer
+
+    Frozen byte groups are hashable; the hash is computed on first use
+    and cached.  They export read-only buffers and support the bitwise
+    operators of byte groups.
+    """
+    _data: bytes
+    _hash: int
+
+    __slots__ = ('_data', '_hash')
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, value=0):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if isinstance(value, FrozenBytes):
+            data = value._data
+        elif isinstance(value, Bytes):
+            data = bytes(value._data)
+        elif isinstance(value, (int, bytes, bytearray)):
+            data = bytes(value)
+        elif isinstance(value, Iterable):
+            data = _bulk_values(value, bytes)
+        else:
+            raise TypeError(f'cannot convert {type(value).__name__} '
+                            f'object to a frozen byte group.')
+        super(Immutable, self).__setattr__('_data', data)
+        super(Immutable, self).__setattr__('_hash', None)
+
+    @classmethod
+    def _wrap(cls, data: bytes, /):
+        'Return a frozen byte group using data as its storage.'
+        self = cls.__new__(cls)
+        super(Immutable, self).__setattr__('_data', data)
+        super(Immutable, self).__setattr__('_hash', None)
+        return self
+
+    @staticmethod
+    def from_bytes(data, /):
+        'Return a frozen byte group copied from a bytes-like object.'
+        return FrozenBytes._wrap(bytes(_buffer(data)))
+
+    @staticmethod
+    def frombuffer(buffer, offset=0, length=-1, /):
+        """
+        Return a frozen byte group copied from length bytes of a buffer,
+        starting at offset.  A negative length copies to the end.
+        """
+        return FrozenBytes._wrap(bytes(_buffer_range(buffer, offset,
+                                                     length)))
+
+    def __reduce__(self, /):
+        'Return state information for pickling.'
+        return FrozenBytes, (self._data,)
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self), truncated for large byte groups.'
+        return _data_repr('FrozenBytes', self._data)
+
+    def __str__(self, /):
+        'Return str(self), truncated for large byte groups.'
+        return _data_repr('FrozenBytes', self._data)
+
+    def to_str(self, /):
+        'Return a raw representation of the byte group.'
+        return self._data.decode('latin-1')
+
+    def to_mem(self, /):
+        'Return a hexadecimal representation of the byte group memory.'
+        return self._data.hex(' ')
+
+    hexdump = Bytes.hexdump
+    write_hexdump = Bytes.write_hexdump
+
+    # ----- Comparison Methods ----- #
+    def __lt__(self, other, /):
+        'Return self<other.'
+        if isinstance(other, (Bytes, FrozenBytes)):
+            return self._data < other._data
+        else:
+            return NotImplemented
+
+    def __le__(self, other, /):
+        'Return self<=other.'
+        if isinstance(other, (Bytes, FrozenBytes)):
+            return self._data <= other._data
+        else:
+            return NotImplemented
+
+    def __eq__(self, other, /):
+        'Return self==other.'
+        if isinstance(other, (Bytes, FrozenBytes)):
+            return self._data == other._data
+        else:
+            return NotImplemented
+
+    def __ne__(self, other, /):
+        'Return self!=other.'
+        if isinstance(other, (Bytes, FrozenBytes)):
+            return self._data != other._data
+        else:
+            return NotImplemented
+
+    def __gt__(self, other, /):
+        'Return self>other.'
+        if isinstance(other, (Bytes, FrozenBytes)):
+            return self._data > other._data
+        else:
+            return NotImplemented
+
+    def __ge__(self, other, /):
+        'Return self>=other.'
+        if isinstance(other, (Bytes, FrozenBytes)):
+            return self._data >= other._data
+        else:
+            return NotImplemented
+
+    # ----- Transformation Methods ----- #
+    def __hash__(self, /):
+        'Return hash(self).'
+        result = self._hash
+        if result is None:
+            result = hash(self._data)
+            super(Immutable, self).__setattr__('_hash', result)
+        return result
+
+    def __bool__(self, /):
+        'Return bool(self).'
+        return len(self._data) != 0
+
+    to_memoryview = Bytes.to_memoryview
+    readinto = Bytes.readinto
+
+    def to_bytes(self, /):
+        'Return the python bytes of the frozen byte group.'
+        return self._data
+
+    # ----- Buffer Methods ----- #
+    __buffer__ = Bytes.__buffer__
+    __release_buffer__ = Bytes.__release_buffer__
+
+    # ----- Iterable Methods ----- #
+    def __len__(self, /):
+        'Return len(self).'
+        return len(self._data)
+
+    def __getitem__(self, key, /):
+        'Return self[key].'
+        if isinstance(key, int):
+            return FrozenByteUnit(self._data[key])
+        elif isinstance(key, slice):
+            return FrozenBytes._wrap(self._data[key])
+        else:
+            raise TypeError(f'byte group indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __iter__(self, /):
+        'Implement iter(self).'
+        return map(FrozenByteUnit, self._data)
+
+    def __reversed__(self, /):
+        'Return a reverse iterator over the object.'
+        return map(FrozenByteUnit, reversed(self._data))
+
+    __contains__ = Bytes.__contains__
+    count = Bytes.count
+    index = Bytes.index
+
+    # ----- Search Methods ----- #
+    _search_key = staticmethod(Bytes._search_key)
+    find = Bytes.find
+    rfind = Bytes.rfind
+    finditer = Bytes.finditer
+    count_subsequence = Bytes.count_subsequence
+
+    # ----- Calculation Methods ----- #
+    def __add__(self, other, /):
+        'Return self+other.'
+        if isinstance(other, (Bytes, FrozenBytes)):
+            return FrozenBytes._wrap(self._data + other._data)
+        elif isinstance(other, bytes):
+            return FrozenBytes._wrap(self._data + other)
+        else:
+            raise TypeError(f"can't concat {type(other).__name__}"
+                            f" to frozen byte groups")
+
+    def __mul__(self, other, /):
+        'Return self*other.'
+        if isinstance(other, int):
+            return FrozenBytes._wrap(self._data * other)
+        else:
+            raise TypeError(f"can't multiply sequence by non-int of "
+                            f"type '{type(other).__name__}'")
+
+    def __rmul__(self, other, /):
+        'Return other*self.'
+        if isinstance(other, int):
+            return FrozenBytes._wrap(self._data * other)
+        else:
+            raise TypeError(f"can't multiply sequence by non-int of "
+                            f"type '{type(other).__name__}'")
+
+    # ----- Bitwise Calculation Methods ----- #
+    def __and__(self, other, /):
+        'Return self&other.'
+        result = _bitwise(self._data, other, and_)
+        return NotImplemented if result is None else FrozenBytes._wrap(result)
+
+    def __rand__(self, other, /):
+        'Return other&self.'
+        result = _bitwise(self._data, other, and_)
+        return NotImplemented if result is None else FrozenBytes._wrap(result)
+
+    def __xor__(self, other, /):
+        'Return self^other.'
+        result = _bitwise(self._data, other, xor)
+        return NotImplemented if result is None else FrozenBytes._wrap(result)
+
+    def __rxor__(self, other, /):
+        'Return other^self.'
+        result = _bitwise(self._data, other, xor)
+        return NotImplemented if result is None else FrozenBytes._wrap(result)
+
+    def __or__(self, other, /):
+        'Return self|other.'
+        result = _bitwise(self._data, other, or_)
+        return NotImplemented if result is None else FrozenBytes._wrap(result)
+
+    def __ror__(self, other, /):
+        'Return other|self.'
+        result = _bitwise(self._data, other, or_)
+        return NotImplemented if result is None else FrozenBytes._wrap(result)
+
+    def __invert__(self, /):
+        'Return ~self.'
+        return FrozenBytes._wrap(_invert(self._data))
+
+    def __lshift__(self, other, /):
+        'Return self<<other.'
+        if isinstance(other, int):
+            return FrozenBytes._wrap(_shift(self._data, _shift_count(other)))
+        else:
+            return NotImplemented
+
+    def __rshift__(self, other, /):
+        'Return self>>other.'
+        if isinstance(other, int):
+            return FrozenBytes._wrap(_shift(self._data,
+                                            -_shift_count(other)))
+        else:
+            return NotImplemented
+
+    def rotate_left(self, count, /):
+        'Return the byte group rotated left by count bits.'
+        return FrozenBytes._wrap(_rotate(self._data, count))
+
+    def rotate_right(self, count, /):
+        'Return the byte group rotated right by count bits.'
+        return FrozenBytes._wrap(_rotate(self._data, -count))
+
+    popcount = Bytes.popcount
+
+    # ----- Custom Mutable Methods ----- #
+    def copy(self, /):
+        'Return a copy of the byte group.  Frozen byte groups are shared.'
+        return self
+
+
+class MappedBytes(Bytes):
+    """
+    Mutable byte group backed by a memory-mapped file.
+
+    MappedBytes(file, length, offset, writable) -> byte group mapping
+        length bytes of file from offset (the whole rest of the file
+        when length is 0), writable or read-only
+    MappedBytes(file) -> writable byte group mapping the whole file
+
+    The file can be a path or an open binary file.  Loads and stores
+    go straight to the mapped buffer and the operating system reads
+    the file in lazily, page by page.  Changes reach the file on
+    flush() or close().  The size of a mapped byte group is fixed.
+    """
+    _file: object
+    _own_file: bool
+    _writable: bool
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, file, length=0, offset=0, writable=True):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if isinstance(file, (str, bytes, os.PathLike)):
+            file = open(file, 'r+b' if writable else 'rb')
+            self._own_file = True
+        elif hasattr(file, 'fileno'):
+            self._own_file = False
+        else:
+            raise TypeError(f'cannot map {type(file).__name__} object '
+                            f'to a byte group.')
+        if offset % mmap.ALLOCATIONGRANULARITY:
+            raise ValueError(f'mapping offset must be a multiple of '
+                             f'{mmap.ALLOCATIONGRANULARITY}, not {offset}.')
+        self._file = file
+        self._writable = writable
+        self._data = mmap.mmap(
+            file.fileno(), length, offset=offset,
+            access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+        )
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self), truncated for large byte groups.'
+        return _data_repr('MappedBytes', self._data)
+
+    def __str__(self, /):
+        'Return str(self), truncated for large byte groups.'
+        return _data_repr('MappedBytes', self._data)
+
+    def to_str(self, /):
+        'Return a raw representation of the byte group.'
+        return str(self._data, 'latin-1')
+
+    def to_mem(self, /):
+        'Return a hexadecimal representation of the byte group memory.'
+        return memoryview(self._data).hex(' ')
+
+    # ----- Transformation Methods ----- #
+    def __hash__(self, /):
+        'Return hash(self).'
+        raise TypeError("unhashable type: 'MappedBytes'")
+
+    # ----- Iterable Methods ----- #
+    def __getitem__(self, key, /):
+        'Return self[key].'
+        if isinstance(key, slice):
+            return Bytes._wrap(bytearray(self._data[key]))
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value, /):
+        'Set self[key] to value.'
+        if isinstance(key, slice):
+            value = Bytes(value)._data
+            if len(value) != len(range(*key.indices(len(self._data)))):
+                raise ValueError('mapped byte group memory size is fixed')
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key, /):
+        'Delete self[key].'
+        if isinstance(key, (int, slice)):
+            raise ValueError('mapped byte group memory size is fixed')
+        else:
+            raise TypeError(f'byte group indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def clear(self, /):
+        'Remove all items from mutable.'
+        raise ValueError('mapped byte group memory size is fixed')
+
+    def count(self, value, /):
+        'Return number of occurrences of value.'
+        if isinstance(value, (ByteUnit, FrozenByteUnit)) or \
+                isinstance(value, int) and 0 <= value <= 255:
+            return self.count_subsequence(value)
+        else:
+            return 0
+
+    def index(self, value, start=0, stop=9223372036854775807, /):
+        """
+        Return first index of value.
+
+        Raises ValueError if the value is not present.
+        """
+        if isinstance(value, (ByteUnit, FrozenByteUnit)) or \
+                isinstance(value, int) and 0 <= value <= 255:
+            index = self.find(value, start, stop)
+            if index != -1:
+                return index
+        raise ValueError(f'{value!r} is not in byte group')
+
+    # ----- Search Methods ----- #
+    @staticmethod
+    def _search_key(sub, /):
+        'Return sub as an argument of the mmap search methods.'
+        key = Bytes._search_key(sub)
+        return bytes((key,)) if isinstance(key, int) else key
+
+    def count_subsequence(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return the number of non-overlapping occurrences of
+        subsection sub in self[start:stop].
+        """
+        key = self._search_key(sub)
+        size = len(key)
+        if size == 0:
+            if start > len(self._data):
+                return 0
+            start, stop, _ = slice(start, stop).indices(len(self._data))
+            return max(stop - start + 1, 0)
+        start, stop, _ = slice(start, stop).indices(len(self._data))
+        chunk_size = max(_COUNT_CHUNK, 2 * size)
+        count = 0
+        with memoryview(self._data) as view:
+            while stop - start >= size:
+                chunk = bytes(view[start:min(start + chunk_size, stop)])
+                found = chunk.count(key)
+                count += found
+                if start + len(chunk) == stop:
+                    break
+                # resume after the last counted occurrence, or early
+                # enough to catch an occurrence across the chunk end
+                step = len(chunk) - size + 1
+                if found and size > 1:
+                    last = chunk.find(key, max(chunk.rfind(key) - size + 1, 0))
+                    while chunk.count(key, 0, last + size) != found:
+                        last = chunk.find(key, last + 1)
+                    step = max(step, last + size)
+                start += step
+        return count
+
+    # ----- Calculation Methods ----- #
+    def __add__(self, other, /):
+        'Return self+other.'
+        return Bytes(self) + other
+
+    def __mul__(self, other, /):
+        'Return self*other.'
+        return Bytes(self) * other
+
+    def __rmul__(self, other, /):
+        'Return other*self.'
+        return Bytes(self) * other
+
+    # ----- Mapping Methods ----- #
+    def flush(self, start=0, stop=None, /):
+        'Write the changes in self[start:stop] back to the file.'
+        start, stop, _ = slice(start, stop).indices(len(self._data))
+        start -= start % mmap.ALLOCATIONGRANULARITY
+        if stop > start:
+            self._data.flush(start, stop - start)
+
+    def close(self, /):
+        'Flush the changes and unmap the file.'
+        if self._data.closed:
+            return
+        if self._writable:
+            self._data.flush()
+        self._data.close()
+        if self._own_file:
+            self._file.close()
+
+    def __enter__(self, /):
+        'Return self.'
+        return self
+
+    def __exit__(self, *args):
+        'Close the mapping.'
+        self.close()
+
+    # ----- Mutational Methods ----- #
+    def copy(self, /):
+        'Return an in-memory copy of the byte group.'
+        return Bytes(self)
+
+
+class BytesView(Bytes):
+    """
+    Mutable view of a range of a byte group, sharing its storage.
+
+    BytesView(bytes, start, stop) -> view of bytes[start:stop]
+    BytesView(bytes) -> view of the whole byte group
+
+    Reads and writes go straight to the storage of the viewed byte
+    group; views of views share the same storage.  Slicing a view with
+    step 1 returns a view, other slices return copies.  The size of a
+    view is fixed, and the viewed byte group cannot change its size
+    while the view is alive.
+    """
+    _base: Bytes
+    _offset: int
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, value, start=0, stop=None):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if not isinstance(value, Bytes):
+            raise TypeError(f'cannot view {type(value).__name__} object '
+                            f'as a byte group.')
+        start, stop, _ = slice(start, stop).indices(len(value._data))
+        stop = max(start, stop)
+        if isinstance(value, BytesView):
+            start += value._offset
+            stop += value._offset
+            value = value._base
+        self._base = value
+        self._offset = start
+        self._data = memoryview(value._data)[start:stop]
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self), truncated for large byte groups.'
+        return _data_repr('BytesView', self._data)
+
+    def __str__(self, /):
+        'Return str(self), truncated for large byte groups.'
+        return _data_repr('BytesView', self._data)
+
+    def to_str(self, /):
+        'Return a raw representation of the byte group.'
+        return str(self._data, 'latin-1')
+
+    # ----- Comparison Methods ----- #
+    def __lt__(self, other, /):
+        'Return self<other.'
+        if isinstance(other, Bytes):
+            return bytearray(self._data) < other._data
+        else:
+            return NotImplemented
+
+    def __le__(self, other, /):
+        'Return self<=other.'
+        if isinstance(other, Bytes):
+            return bytearray(self._data) <= other._data
+        else:
+            return NotImplemented
+
+    def __gt__(self, other, /):
+        'Return self>other.'
+        if isinstance(other, Bytes):
+            return bytearray(self._data) > other._data
+        else:
+            return NotImplemented
+
+    def __ge__(self, other, /):
+        'Return self>=other.'
+        if isinstance(other, Bytes):
+            return bytearray(self._data) >= other._data
+        else:
+            return NotImplemented
+
+    # ----- Transformation Methods ----- #
+    def __hash__(self, /):
+        'Return hash(self).'
+        raise TypeError("unhashable type: 'BytesView'")
+
+    # ----- Iterable Methods ----- #
+    def __getitem__(self, key, /):
+        'Return self[key].'
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self._data))
+            if step == 1:
+                return BytesView(self, start, stop)
+            return Bytes._wrap(bytearray(self._data[key]))
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value, /):
+        'Set self[key] to value.'
+        if isinstance(key, slice):
+            value = Bytes(value)._data
+            if len(value) != len(range(*key.indices(len(self._data)))):
+                raise ValueError('byte group view memory size is fixed')
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key, /):
+        'Delete self[key].'
+        if isinstance(key, (int, slice)):
+            raise ValueError('byte group view memory size is fixed')
+        else:
+            raise TypeError(f'byte group indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __contains__(self, item, /):
+        'Return item in self.'
+        if isinstance(item, (ByteUnit, FrozenByteUnit, int)):
+            return self.count(item) != 0
+        elif isinstance(item, (Bytes, FrozenBytes, bytes, bytearray)):
+            return self.find(item) != -1
+        else:
+            return NotImplemented
+
+    def clear(self, /):
+        'Remove all items from mutable.'
+        raise ValueError('byte group view memory size is fixed')
+
+    def count(self, value, /):
+        'Return number of occurrences of value.'
+        if isinstance(value, (ByteUnit, FrozenByteUnit)) or \
+                isinstance(value, int) and 0 <= value <= 255:
+            return self.count_subsequence(value)
+        else:
+            return 0
+
+    def index(self, value, start=0, stop=9223372036854775807, /):
+        """
+        Return first index of value.
+
+        Raises ValueError if the value is not present.
+        """
+        start, stop = self._base_range(start, stop)
+        try:
+            return self._base.index(value, start, stop) - self._offset
+        except ValueError:
+            raise ValueError(f'{value!r} is not in byte group') from None
+
+    # ----- Search Methods ----- #
+    def _base_range(self, start, stop, /):
+        'Return the viewed byte group range of self[start:stop].'
+        start, stop, _ = slice(start, stop).indices(len(self._data))
+        return self._offset + start, self._offset + max(start, stop)
+
+    def find(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return the lowest index where subsection sub is found,
+        such that sub is contained within self[start:stop].
+
+        Return -1 on failure.
+        """
+        index = self._base.find(sub, *self._base_range(start, stop))
+        return -1 if index == -1 else index - self._offset
+
+    def rfind(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return the highest index where subsection sub is found,
+        such that sub is contained within self[start:stop].
+
+        Return -1 on failure.
+        """
+        index = self._base.rfind(sub, *self._base_range(start, stop))
+        return -1 if index == -1 else index - self._offset
+
+    def finditer(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return an iterator over the indices of the non-overlapping
+        occurrences of subsection sub in self[start:stop].
+        """
+        offset = self._offset
+        return (index - offset for index in
+                self._base.finditer(sub, *self._base_range(start, stop)))
+
+    def count_subsequence(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return the number of non-overlapping occurrences of
+        subsection sub in self[start:stop].
+        """
+        return self._base.count_subsequence(sub,
+                                            *self._base_range(start, stop))
+
+    # ----- Calculation Methods ----- #
+    def __add__(self, other, /):
+        'Return self+other.'
+        return Bytes(self) + other
+
+    def __mul__(self, other, /):
+        'Return self*other.'
+        return Bytes(self) * other
+
+    def __rmul__(self, other, /):
+        'Return other*self.'
+        return Bytes(self) * other
+
+    # ----- Mutational Methods ----- #
+    def release(self, /):
+        'Release the storage, letting the viewed byte group resize again.'
+        self._data.release()
@@ -0,0 +1,405 @@
+from array import array
+from random import Random
+from typing import Dict, List
+
+from obj import Mutable
+
+__all__ = [
+    'CacheLevel',
+    'CacheHierarchy',
+]
+
+REPLACEMENT_POLICIES = ('lru', 'plru', 'random')
+WRITE_POLICIES = ('write-back', 'write-through')
+EMPTY = -1
+
+
+class _Memory:
+    'Backing memory at the bottom of a cache hierarchy.'
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.reads = 0
+        self.writes = 0
+
+    def access(self, address, write, /):
+        'Count a line transfer and return its cycles.'
+        if write:
+            self.writes += 1
+        else:
+            self.reads += 1
+        return self.latency
+
+
+class CacheLevel(Mutable):
+    """
+    Mutable set-associative cache level.
+
+    CacheLevel(size, line_size, ways, policy, write_policy, latency, seed)
+        -> cache of size bytes in lines of line_size bytes with ways
+           lines per set, evicting with policy ('lru', 'plru' or
+           'random'), handling writes with write_policy ('write-back'
+           or 'write-through') and costing latency cycles per access
+    CacheLevel(size) -> 8-way write-back LRU cache of 64-byte lines
+                        with a latency of 4 cycles
+
+    The tag store is a flat array of line numbers, ways entries per
+    set, with a parallel array of dirty flags and one of LRU stamps or
+    a tree of pseudo-LRU bits per set.  A lookup is an array search in
+    the slice of the set.
+
+    A write-back level allocates a line on a write miss and marks it
+    dirty; dirty lines are written to the next level when evicted.  A
+    write-through level passes every write to the next level and does
+    not allocate on a write miss.
+
+    Levels are chained by a CacheHierarchy, which counts the cycles.
+    """
+    size: int
+    line_size: int
+    ways: int
+    sets: int
+    policy: str
+    write_policy: str
+    latency: int
+    seed: object
+    hits: int
+    misses: int
+    evictions: int
+    writebacks: int
+    reads: int
+    writes: int
+    _line_shift: int
+    _tags: array
+    _dirty: bytearray
+    _stamps: array
+    _trees: array
+    _clock: int
+    _random: Random
+    _next: object
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, size, line_size=64, ways=8, policy='lru',
+                 write_policy='write-back', latency=4, seed=None):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if line_size <= 0 or line_size & (line_size - 1):
+            raise ValueError(f'line size must be a power of 2, '
+                             f'not {line_size}.')
+        if ways <= 0 or size <= 0 or size % (line_size * ways):
+            raise ValueError(f'cache size must be a positive multiple of '
+                             f'{line_size * ways}, not {size}.')
+        if policy not in REPLACEMENT_POLICIES:
+            raise ValueError(f'replacement policy must be one of '
+                             f'{REPLACEMENT_POLICIES}, not {policy!r}.')
+        if policy == 'plru' and ways & (ways - 1):
+            raise ValueError(f'pseudo-LRU needs a power of 2 of ways, '
+                             f'not {ways}.')
+        if write_policy not in WRITE_POLICIES:
+            raise ValueError(f'write policy must be one of '
+                             f'{WRITE_POLICIES}, not {write_policy!r}.')
+        self.size = size
+        self.line_size = line_size
+        self.ways = ways
+        self.sets = size // (line_size * ways)
+        self.policy = policy
+        self.write_policy = write_policy
+        self.latency = latency
+        self.seed = seed
+        self._line_shift = line_size.bit_length() - 1
+        self._random = Random(seed)
+        self._next = _Memory(0)
+        self._reset()
+        self.reset_stats()
+
+    def _reset(self, /):
+        'Empty the tag store.'
+        slots = self.sets * self.ways
+        self._tags = array('q', [EMPTY]) * slots
+        self._dirty = bytearray(slots)
+        self._stamps = array('Q', bytes(8 * slots)) \
+            if self.policy == 'lru' else array('Q')
+        self._trees = array('Q', bytes(8 * self.sets)) \
+            if self.policy == 'plru' else array('Q')
+        self._clock = 0
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return (f'CacheLevel(size={self.size}, line_size={self.line_size}, '
+                f'ways={self.ways}, policy={self.policy!r}, '
+                f'write_policy={self.write_policy!r}, '
+                f'latency={self.latency})')
+
+    def __str__(self, /):
+        'Return str(self).'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return a raw representation of the cache level.'
+        return self.__repr__()
+
+    # ----- Replacement Methods ----- #
+    def _touch(self, set_index: int, way: int, /):
+        'Record a use of a way for the replacement policy.'
+        if self.policy == 'lru':
+            self._clock += 1
+            self._stamps[set_index * self.ways + way] = self._clock
+        elif self.policy == 'plru':
+            # Each node of the tree points away from its last used half.
+            tree = self._trees[set_index]
+            node = 1
+            level = self.ways >> 1
+            while level:
+                bit = 1 if way & level else 0
+                if bit:
+                    tree &= ~(1 << node)
+                else:
+                    tree |= 1 << node
+                node = node * 2 + bit
+                level >>= 1
+            self._trees[set_index] = tree
+
+    def _victim(self, set_index: int, /) -> int:
+        'Return the way to replace in a full set.'
+        if self.policy == 'lru':
+            base = set_index * self.ways
+            stamps = self._stamps[base:base + self.ways]
+            return stamps.index(min(stamps))
+        elif self.policy == 'plru':
+            tree = self._trees[set_index]
+            node = 1
+            way = 0
+            level = self.ways >> 1
+            while level:
+                bit = tree >> node & 1
+                way |= level if bit else 0
+                node = node * 2 + bit
+                level >>= 1
+            return way
+        return self._random.randrange(self.ways)
+
+    # ----- Access Methods ----- #
+    def access(self, address, write=False, /):
+        """
+        Access the line holding address, reading it from the next level
+        on a miss.  Return the cycles spent in this and lower levels.
+        """
+        line = address >> self._line_shift
+        set_index = line % self.sets
+        base = set_index * self.ways
+        tags = self._tags
+        cycles = self.latency
+        if write:
+            self.writes += 1
+        else:
+            self.reads += 1
+        try:
+            slot = tags.index(line, base, base + self.ways)
+        except ValueError:
+            slot = -1
+        if slot >= 0:
+            self.hits += 1
+            self._touch(set_index, slot - base)
+            if write:
+                if self.write_policy == 'write-back':
+                    self._dirty[slot] = 1
+                else:
+                    cycles += self._next.access(address, True)
+            return cycles
+        self.misses += 1
+        if write and self.write_policy == 'write-through':
+            return cycles + self._next.access(address, True)
+        cycles += self._next.access(address, False)
+        try:
+            slot = tags.index(EMPTY, base, base + self.ways)
+        except ValueError:
+            slot = base + self._victim(set_index)
+            self.evictions += 1
+            if self._dirty[slot]:
+                self.writebacks += 1
+                cycles += self._next.access(tags[slot] << self._line_shift,
+                                            True)
+        tags[slot] = line
+        self._dirty[slot] = write and self.write_policy == 'write-back'
+        self._touch(set_index, slot - base)
+        return cycles
+
+    def contains(self, address, /):
+        'Return whether the line holding address is cached.'
+        line = address >> self._line_shift
+        base = line % self.sets * self.ways
+        return line in self._tags[base:base + self.ways]
+
+    def flush(self, /):
+        """
+        Write the dirty lines to the next level and empty the cache.
+        Return the cycles spent.
+        """
+        cycles = 0
+        for slot, dirty in enumerate(self._dirty):
+            if dirty:
+                self.writebacks += 1
+                cycles += self._next.access(
+                    self._tags[slot] << self._line_shift, True)
+        self._reset()
+        return cycles
+
+    # ----- Statistics Methods ----- #
+    def __len__(self, /):
+        'Return the number of cached lines.'
+        return len(self._tags) - self._tags.count(EMPTY)
+
+    def stats(self, /) -> Dict[str, float]:
+        'Return the hit, miss and writeback counters as a dictionary.'
+        accesses = self.hits + self.misses
+        return {
+            'reads': self.reads,
+            'writes': self.writes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'writebacks': self.writebacks,
+            'hit_rate': self.hits / accesses if accesses else 0.0,
+        }
+
+    def reset_stats(self, /):
+        'Set every counter to zero.'
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writebacks = 0
+        self.reads = 0
+        self.writes = 0
+
+    # ----- Mutable Methods ----- #
+    def copy(self, /):
+        'Return an empty cache level with the same configuration and seed.'
+        return CacheLevel(self.size, self.line_size, self.ways, self.policy,
+                          self.write_policy, self.latency, self.seed)
+
+
+class CacheHierarchy(Mutable):
+    """
+    Mutable hierarchy of cache levels in front of memory.
+
+    CacheHierarchy(levels, memory_latency) -> hierarchy of the cache
+                                              levels, first level
+                                              closest to the processor,
+                                              over a memory costing
+                                              memory_latency cycles per
+                                              line transfer
+    CacheHierarchy(levels) -> hierarchy over a 100-cycle memory
+    CacheHierarchy() -> 32 KiB 8-way L1 (4 cycles), 256 KiB 8-way L2
+                        (12 cycles) and 8 MiB 16-way L3 (40 cycles),
+                        all write-back LRU with 64-byte lines
+
+    The levels are neither inclusive nor exclusive: a miss fills the
+    line in every level it went through, and an eviction only writes
+    back to the level below.  The cycles of an access are the
+    latencies of every level and memory transfer it caused.
+
+    Given to an AddressSpace, the hierarchy sees each typed load and
+    store; an access covering several lines of the first level counts
+    once per line.
+    """
+    levels: List[CacheLevel]
+    memory_latency: int
+    accesses: int
+    cycles: int
+    _memory: _Memory
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, levels=None, memory_latency=100):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if levels is None:
+            levels = [CacheLevel(32 << 10, 64, 8, latency=4),
+                      CacheLevel(256 << 10, 64, 8, latency=12),
+                      CacheLevel(8 << 20, 64, 16, latency=40)]
+        levels = list(levels)
+        if not levels:
+            raise ValueError('a cache hierarchy needs at least one level.')
+        for level in levels:
+            if not isinstance(level, CacheLevel):
+                raise TypeError(f'levels must be cache levels, '
+                                f'not {type(level).__name__}')
+        self.levels = levels
+        self.memory_latency = memory_latency
+        self._memory = _Memory(memory_latency)
+        for level, below in zip(levels, levels[1:] + [self._memory]):
+            level._next = below
+        self.reset_stats()
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return (f'CacheHierarchy({self.levels!r}, '
+                f'memory_latency={self.memory_latency})')
+
+    def __str__(self, /):
+        'Return str(self).'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return a table of the levels and their counters.'
+        lines = ['level  size      line  ways  policy  write          '
+                 'hits      misses    writebacks']
+        for index, level in enumerate(self.levels, 1):
+            lines.append(f'L{index:<5} {level.size:<9} {level.line_size:<5} '
+                         f'{level.ways:<5} {level.policy:<7} '
+                         f'{level.write_policy:<14} {level.hits:<9} '
+                         f'{level.misses:<9} {level.writebacks}')
+        return '\n'.join(lines)
+
+    # ----- Access Methods ----- #
+    def access(self, address, size=1, write=False, /):
+        """
+        Access size bytes at address through the hierarchy.  Return the
+        cycles spent.
+        """
+        first = self.levels[0]
+        shift = first._line_shift
+        cycles = 0
+        for line in range(address >> shift,
+                          (address + max(size, 1) - 1 >> shift) + 1):
+            cycles += first.access(line << shift, write)
+        self.accesses += 1
+        self.cycles += cycles
+        return cycles
+
+    def flush(self, /):
+        'Write every dirty line back to memory and empty the levels.'
+        for level in self.levels:
+            self.cycles += level.flush()
+
+    # ----- Statistics Methods ----- #
+    def stats(self, /) -> Dict[str, object]:
+        """
+        Return the access, cycle and memory counters and the counters
+        of each level by name (L1, L2, ...) as a dictionary.
+        """
+        result = {
+            'accesses': self.accesses,
+            'cycles': self.cycles,
+            'cycles_per_access':
+                self.cycles / self.accesses if self.accesses else 0.0,
+            'memory_reads': self._memory.reads,
+            'memory_writes': self._memory.writes,
+        }
+        for index, level in enumerate(self.levels, 1):
+            result[f'L{index}'] = level.stats()
+        return result
+
+    def reset_stats(self, /):
+        'Set every counter of the hierarchy and its levels to zero.'
+        self.accesses = 0
+        self.cycles = 0
+        self._memory.reads = 0
+        self._memory.writes = 0
+        for level in self.levels:
+            level.reset_stats()
+
+    # ----- Mutable Methods ----- #
+    def copy(self, /):
+        'Return an empty hierarchy with the same configuration.'
+        return CacheHierarchy([level.copy() for level in self.levels],
+                              self.memory_latency)
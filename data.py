@@ -1,8 +1,15 @@
-from obj import Mutable, MutableIterable
+import sys
+from array import array
+from fractions import Fraction
+from struct import Struct
+
+from obj import MutableIterable
 from bits import Bit, true, false
-from bytes import Bytes
+from bytes import Bytes, FrozenBytes
+from alu import result_table
 
 __all__ = [
+    'FixedWidthInteger',
     'Char',
     'UnsignedChar',
     'Short',
@@ -13,65 +20,185 @@ __all__ = [
     'UnsignedLong',
     'LongLong',
     'UnsignedLongLong',
+    'FloatingPoint',
     'Float',
     'Double',
     'LongDouble',
     'null',
 
     'DATA_TYPES',
+    'INTEGER_TYPES',
+    'FLOAT_TYPES',
 ]
 
+ROUNDING_MODES = ('nearest', 'zero', 'up', 'down')
+
 
-class Char(MutableIterable):
+class FixedWidthInteger(MutableIterable):
     """
-    Mutable signed character.
-    Same as signed 8-bit integer.
-    The value can be from -128 to 127.
+    Mutable fixed-width integer.
+    Base of the integer data types, parametrised by the class
+    attributes size (in bytes) and signed.
+
+    FixedWidthInteger(integer) -> mutable copy of the integer
+    FixedWidthInteger(int) -> integer initialized with given value
+    FixedWidthInteger(bytes) -> integer read from a byte group of
+                                its size, least significant byte first
+    FixedWidthInteger() -> Empty integer
+
+    Construct a mutable fixed-width integer from:
+        - an integer object in range
+        - a python integer in range
+        - a byte group holding its memory
+        - nothing
 
-    Char(char) -> mutable copy of the signed character
-    Char(int) -> signed character initialized with given value
-    Char() -> Empty signed character
+    The value is stored as a masked python integer.  Arithmetic wraps
+    around like C arithmetic.  Operations between two integer types
+    give the wider type, or the unsigned one for equal widths; python
+    integer operands take the type of the other operand.
 
-    Construct a mutable signed character from:
-        - a signed character object
-        - an integer from -128 to 127
-        - nothing
+    Additions and subtractions use python integer arithmetic unless
+    the class attribute adder of the result type holds a gate-level
+    adder.  Set it on one type, or on FixedWidthInteger for every type
+    (see gates.gate_level).
     """
+    size: int = 0
+    signed: bool = True
+    description: str = 'an integer'
+    adder = None
+    minimum: int
+    maximum: int
+    _bits: int
+    _mask: int
+    _half: int
+    _value: int
+
+    def __init_subclass__(cls, /, **kwargs):
+        'Derive the value range of the subclass from its size.'
+        super().__init_subclass__(**kwargs)
+        cls._bits = 8 * cls.size
+        cls._mask = (1 << cls._bits) - 1
+        cls._half = 1 << cls._bits - 1 if cls._bits else 0
+        if cls.signed:
+            cls.minimum = -cls._half
+            cls.maximum = cls._half - 1
+        else:
+            cls.minimum = 0
+            cls.maximum = cls._mask
 
     # ----- Initialization Methods ----- #
     def __init__(self, value=0):
-        if isinstance(value, Char):
-            self.value = value.value.copy()
-        elif isinstance(value, int):
-            if not -128 <= value <= 127:
-                raise ValueError(f'a signed character only accepts integer '
-                                 f'from -128 to 127, not {value}.')
-            self.value = Bytes(1)
-            for i in range(7):
-                if value & 2 ** i != 0:
-                    self[7 - i] = true
-        else:
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if isinstance(value, FixedWidthInteger):
+            value = value.to_int()
+        elif isinstance(value, (Bytes, FrozenBytes)):
+            if len(value) != self.size:
+                raise ValueError(f'{self.description} takes {self.size} '
+                                 f'bytes, not {len(value)}.')
+            self._value = int.from_bytes(value._data, 'little')
+            return
+        elif not isinstance(value, int):
             raise TypeError(f'cannot convert {type(value).__name__} '
-                            f'object to a signed character.')
+                            f'object to {self.description}.')
+        if not self.minimum <= value <= self.maximum:
+            raise ValueError(f'{self.description} only accepts integer '
+                             f'from {self.minimum} to {self.maximum}, '
+                             f'not {value}.')
+        self._value = value & self._mask
+
+    @classmethod
+    def _from_raw(cls, raw, /):
+        'Return an integer of the class holding the raw bit pattern.'
+        self = cls.__new__(cls)
+        self._value = raw & cls._mask
+        return self
+
+    @classmethod
+    def wrap(cls, value, /):
+        'Return value converted to the class with C wraparound.'
+        if isinstance(value, FixedWidthInteger):
+            value = value.to_int()
+        elif not isinstance(value, int):
+            raise TypeError(f'cannot convert {type(value).__name__} '
+                            f'object to {cls.description}.')
+        return cls._from_raw(value)
+
+    # ----- Memory Methods ----- #
+    @property
+    def value(self, /):
+        """
+        A frozen byte group of the memory, least significant byte
+        first.  Assign a byte group to change the memory.
+        """
+        return FrozenBytes._wrap(self._value.to_bytes(self.size, 'little'))
+
+    @value.setter
+    def value(self, value, /):
+        if not isinstance(value, (Bytes, FrozenBytes)) or \
+                len(value) != self.size:
+            raise ValueError(f'{self.description} takes a byte group '
+                             f'of {self.size} bytes.')
+        self._value = int.from_bytes(value._data, 'little')
 
     # ----- Informal Methods ----- #
     def __repr__(self, /):
         'Return repr(self).'
-        return f'{type(self).__name__}({self.to_str()!r})'
+        return f'{type(self).__name__}({self.to_str()})'
 
     def __str__(self, /):
         'Return str(self).'
-        return f'{type(self).__name__}({self.to_str()!r})'
+        return f'{type(self).__name__}({self.to_str()})'
 
     def to_str(self, /):
-        'Return a raw representation of the signed character.'
-        return chr(self.to_int())
+        'Return a raw representation of the integer.'
+        return str(self.to_int())
 
     def to_mem(self, /):
-        'Return a hexadecimal representation of the signed character memory.'
-        return f'{self.to_int():0>2x}'
+        'Return a hexadecimal representation of the integer memory.'
+        return self._value.to_bytes(self.size, 'little').hex(' ')
 
     # ----- Comparison Methods ----- #
+    def __lt__(self, other, /):
+        'Return self<other.'
+        if isinstance(other, (FixedWidthInteger, int)):
+            return self.to_int() < int(other)
+        else:
+            return NotImplemented
+
+    def __le__(self, other, /):
+        'Return self<=other.'
+        if isinstance(other, (FixedWidthInteger, int)):
+            return self.to_int() <= int(other)
+        else:
+            return NotImplemented
+
+    def __eq__(self, other, /):
+        'Return self==other.'
+        if isinstance(other, (FixedWidthInteger, int)):
+            return self.to_int() == int(other)
+        else:
+            return NotImplemented
+
+    def __ne__(self, other, /):
+        'Return self!=other.'
+        if isinstance(other, (FixedWidthInteger, int)):
+            return self.to_int() != int(other)
+        else:
+            return NotImplemented
+
+    def __gt__(self, other, /):
+        'Return self>other.'
+        if isinstance(other, (FixedWidthInteger, int)):
+            return self.to_int() > int(other)
+        else:
+            return NotImplemented
+
+    def __ge__(self, other, /):
+        'Return self>=other.'
+        if isinstance(other, (FixedWidthInteger, int)):
+            return self.to_int() >= int(other)
+        else:
+            return NotImplemented
 
     # ----- Transformation Methods ----- #
     def __hash__(self, /):
@@ -80,77 +207,364 @@ class Char(MutableIterable):
 
     def __bool__(self, /):
         'Return bool(self).'
-        return any(self.value)
+        return self._value != 0
+
+    def __int__(self, /):
+        'Return int(self).'
+        return self.to_int()
+
+    def __index__(self, /):
+        'Return self converted to an integer for use as an index.'
+        return self.to_int()
 
     def to_int(self, /):
-        'Return a python integer translation of the signed character.'
-        return self.value[0].to_int()
+        'Return a python integer translation of the integer.'
+        value = self._value
+        if self.signed and value >= self._half:
+            return value - (self._mask + 1)
+        return value
 
     # ----- Iterable Methods ----- #
     def __len__(self, /):
         'Return len(self).'
-        return 8
+        return self._bits
 
     def __getitem__(self, key, /):
         'Return self[key].'
-        return self.value[0][key]
+        if isinstance(key, int):
+            if not -self._bits <= key < self._bits:
+                raise IndexError(f'{type(self).__name__} index out of range')
+            return true if self._value >> (-key - 1 if key < 0
+                                           else self._bits - 1 - key) & 1 \
+                else false
+        elif isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(self._bits))]
+        else:
+            raise TypeError(f'{type(self).__name__} indices must be '
+                            f'integers or slices, not {type(key).__name__}')
 
     def __setitem__(self, key, value, /):
         'Set self[key] to value.'
-        self.value[0][key] = value
+        if isinstance(key, int):
+            if not -self._bits <= key < self._bits:
+                raise IndexError(f'{type(self).__name__} assignment index '
+                                 f'out of range')
+            mask = 1 << (-key - 1 if key < 0 else self._bits - 1 - key)
+            if Bit(value):
+                self._value |= mask
+            else:
+                self._value &= ~mask
+        elif isinstance(key, slice):
+            indices = range(*key.indices(self._bits))
+            if len(value) != len(indices):
+                raise ValueError('unmatched value length')
+            for i, bit in zip(indices, value):
+                self[i] = bit
+        else:
+            raise TypeError(f'{type(self).__name__} indices must be '
+                            f'integers or slices, not {type(key).__name__}')
 
     def __delitem__(self, key, /):
         'Delete self[key].'
         if isinstance(key, (int, slice)):
-            raise ValueError('signed character memory size is fixed')
+            raise ValueError(f'{type(self).__name__} memory size is fixed')
         else:
-            raise TypeError(f'signed character indices must be '
+            raise TypeError(f'{type(self).__name__} indices must be '
                             f'integers or slices, not {type(key).__name__}')
 
     def __iter__(self, /):
         'Implement iter(self).'
-        return iter(self.value[0])
+        return iter(self[:])
 
     def __reversed__(self, /):
         'Return a reverse iterator over the object.'
-        return reversed(self.value[0])
+        return reversed(self[:])
+
+    # ----- Calculation Helper Methods ----- #
+    def _operands(self, other, /):
+        'Return the result type and the python integers of both operands.'
+        if isinstance(other, FixedWidthInteger):
+            return (_common_type(type(self), type(other)),
+                    self.to_int(), other.to_int())
+        elif isinstance(other, int):
+            return type(self), self.to_int(), other
+        else:
+            return None, None, None
+
+    @staticmethod
+    def _sum(cls, a, b, carry=0, /):
+        'Return a+b+carry of type cls, through the adder if one is set.'
+        adder = cls.adder
+        if adder is None:
+            return cls._from_raw(a + b + carry)
+        return cls._from_raw(
+            adder.add(a & cls._mask, b & cls._mask, cls._bits, carry)[0])
 
     # ----- Calculation Methods ----- #
     def __add__(self, other, /):
         'Return self+other.'
-        if isinstance(other, Char):
-            carry = false
-            result = Char()
-            for i in range(8):
-                last_carry = carry
-                carry = false
-                digit = false
-                for value in (self[7 - i], other[7 - i], last_carry):
-                    if value:
-                        if digit:
-                            carry = true
-                            digit = false
-                        else:
-                            digit = true
-                result.value[0][7 - i] = digit
-            return result
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else self._sum(cls, a, b)
+
+    def __radd__(self, other, /):
+        'Return other+self.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else self._sum(cls, b, a)
+
+    def __sub__(self, other, /):
+        'Return self-other.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else self._sum(cls, a, ~b, 1)
+
+    def __rsub__(self, other, /):
+        'Return other-self.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else self._sum(cls, b, ~a, 1)
+
+    def __mul__(self, other, /):
+        'Return self*other.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else cls._from_raw(a * b)
+
+    def __rmul__(self, other, /):
+        'Return other*self.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else cls._from_raw(b * a)
+
+    def __truediv__(self, other, /):
+        'Return self/other, truncated toward zero as in C.'
+        cls, a, b = self._operands(other)
+        if cls is None:
+            return NotImplemented
+        a, b = cls.wrap(a).to_int(), cls.wrap(b).to_int()
+        return cls._from_raw(_c_div(a, b))
+
+    def __rtruediv__(self, other, /):
+        'Return other/self, truncated toward zero as in C.'
+        cls, a, b = self._operands(other)
+        if cls is None:
+            return NotImplemented
+        a, b = cls.wrap(a).to_int(), cls.wrap(b).to_int()
+        return cls._from_raw(_c_div(b, a))
+
+    __floordiv__ = __truediv__
+    __rfloordiv__ = __rtruediv__
+
+    def __mod__(self, other, /):
+        'Return self%other, with the sign of self as in C.'
+        cls, a, b = self._operands(other)
+        if cls is None:
+            return NotImplemented
+        a, b = cls.wrap(a).to_int(), cls.wrap(b).to_int()
+        return cls._from_raw(a - b * _c_div(a, b))
+
+    def __rmod__(self, other, /):
+        'Return other%self, with the sign of other as in C.'
+        cls, a, b = self._operands(other)
+        if cls is None:
+            return NotImplemented
+        a, b = cls.wrap(a).to_int(), cls.wrap(b).to_int()
+        return cls._from_raw(b - a * _c_div(b, a))
+
+    def __lshift__(self, other, /):
+        'Return self<<other.'
+        if isinstance(other, (FixedWidthInteger, int)):
+            return type(self)._from_raw(self._value << _shift_count(other))
         else:
             return NotImplemented
 
-    def __iadd__(self, other, /):
-        'Implement self+=other.'
-        if isinstance(other, Char):
-            self.value = (self + other).value
+    def __rshift__(self, other, /):
+        'Return self>>other, arithmetic for signed integers.'
+        if isinstance(other, (FixedWidthInteger, int)):
+            return type(self)._from_raw(self.to_int() >> _shift_count(other))
         else:
             return NotImplemented
 
+    def __neg__(self, /):
+        'Return -self.'
+        return type(self)._from_raw(-self._value)
+
+    def __pos__(self, /):
+        'Return +self.'
+        return self.copy()
+
+    def __abs__(self, /):
+        'Return abs(self).'
+        return type(self)._from_raw(abs(self.to_int()))
+
+    def __invert__(self, /):
+        'Return ~self.'
+        return type(self)._from_raw(~self._value)
+
+    # ----- Bitwise Calculation Methods ----- #
+    def __and__(self, other, /):
+        'Return self&other.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else cls._from_raw(a & b)
+
+    def __rand__(self, other, /):
+        'Return other&self.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else cls._from_raw(b & a)
+
+    def __xor__(self, other, /):
+        'Return self^other.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else cls._from_raw(a ^ b)
+
+    def __rxor__(self, other, /):
+        'Return other^self.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else cls._from_raw(b ^ a)
+
+    def __or__(self, other, /):
+        'Return self|other.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else cls._from_raw(a | b)
+
+    def __ror__(self, other, /):
+        'Return other|self.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else cls._from_raw(b | a)
+
+    # ----- In-place Calculation Methods ----- #
+    def _assign(self, result, /):
+        'Store the value of result in self, wrapping to its width.'
+        if result is NotImplemented:
+            return NotImplemented
+        self._value = result.to_int() & self._mask
+        return self
+
+    def __iadd__(self, other, /):
+        'Implement self+=other.'
+        return self._assign(self.__add__(other))
+
+    def __isub__(self, other, /):
+        'Implement self-=other.'
+        return self._assign(self.__sub__(other))
+
+    def __imul__(self, other, /):
+        'Implement self*=other.'
+        return self._assign(self.__mul__(other))
+
+    def __itruediv__(self, other, /):
+        'Implement self/=other.'
+        return self._assign(self.__truediv__(other))
+
+    def __ifloordiv__(self, other, /):
+        'Implement self//=other.'
+        return self._assign(self.__floordiv__(other))
+
+    def __imod__(self, other, /):
+        'Implement self%=other.'
+        return self._assign(self.__mod__(other))
+
+    def __ilshift__(self, other, /):
+        'Implement self<<=other.'
+        return self._assign(self.__lshift__(other))
+
+    def __irshift__(self, other, /):
+        'Implement self>>=other.'
+        return self._assign(self.__rshift__(other))
+
+    def __iand__(self, other, /):
+        'Implement self&=other.'
+        return self._assign(self.__and__(other))
+
+    def __ixor__(self, other, /):
+        'Implement self^=other.'
+        return self._assign(self.__xor__(other))
+
+    def __ior__(self, other, /):
+        'Implement self|=other.'
+        return self._assign(self.__or__(other))
+
     # ----- Custom Mutable Methods ----- #
     def copy(self, /):
-        'Return a copy of the signed character.'
-        return Char(self.value)
+        'Return a copy of the integer.'
+        return type(self)._from_raw(self._value)
+
+
+def _common_type(left, right, /):
+    'Return the result type of an operation between two integer types.'
+    if left is right:
+        return left
+    elif left.size != right.size:
+        return left if left.size > right.size else right
+    else:
+        return right if left.signed else left
+
 
+def _c_div(a, b, /):
+    'Return a/b truncated toward zero as in C.'
+    if b == 0:
+        raise ZeroDivisionError('integer division by zero')
+    quotient = abs(a) // abs(b)
+    return quotient if (a < 0) == (b < 0) else -quotient
 
-class UnsignedChar(Mutable):
+
+def _shift_count(count, /):
+    'Return a shift count as a non-negative python integer.'
+    count = int(count)
+    if count < 0:
+        raise ValueError('negative shift count')
+    return count
+
+
+class Char(FixedWidthInteger):
+    """
+    Mutable signed character.
+    Same as signed 8-bit integer.
+    The value can be from -128 to 127.
+
+    Char(char) -> mutable copy of the signed character
+    Char(int) -> signed character initialized with given value
+    Char(bytes) -> signed character read from a byte group of size 1
+    Char() -> Empty signed character
+
+    Construct a mutable signed character from:
+        - a signed character object
+        - an integer from -128 to 127
+        - a byte group holding its memory
+        - nothing
+
+    Addition and subtraction of two signed characters are lookups in
+    the tables of the 8-bit ALU unless a gate-level adder is set.
+    """
+    size = 1
+    signed = True
+    description = 'a signed character'
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return f'{type(self).__name__}({self.to_str()!r})'
+
+    def __str__(self, /):
+        'Return str(self).'
+        return f'{type(self).__name__}({self.to_str()!r})'
+
+    def to_str(self, /):
+        'Return a raw representation of the signed character.'
+        return chr(self._value)
+
+    # ----- Calculation Methods ----- #
+    def __add__(self, other, /):
+        'Return self+other.'
+        if type(other) is Char and type(self).adder is None:
+            return Char._from_raw(
+                result_table('add')[self._value << 8 | other._value])
+        return super().__add__(other)
+
+    def __sub__(self, other, /):
+        'Return self-other.'
+        if type(other) is Char and type(self).adder is None:
+            return Char._from_raw(
+                result_table('sub')[self._value << 8 | other._value])
+        return super().__sub__(other)
+
+
+class UnsignedChar(FixedWidthInteger):
     """
     Mutable unsigned character.
     Same as unsigned 8-bit integer.
@@ -158,29 +572,22 @@ class UnsignedChar(Mutable):
 
     UnsignedChar(unsigned_char) -> mutable copy of the unsigned character
     UnsignedChar(int) -> unsigned character initialized with given value
+    UnsignedChar(bytes) -> unsigned character read from a byte group
+                           of size 1
     UnsignedChar() -> Empty unsigned character
 
-    Construct a mutable short integer from:
+    Construct a mutable unsigned character from:
         - an unsigned character object
         - an integer from 0 to 255
+        - a byte group holding its memory
         - nothing
-    """
 
-    # ----- Initialization Methods ----- #
-    def __init__(self, value=0):
-        if isinstance(value, UnsignedChar):
-            self.value = value.value.copy()
-        elif isinstance(value, int):
-            if not 0 <= value <= 255:
-                raise ValueError(f'an unsigned character only accepts integer '
-                                 f'from 0 to 255, not {value}.')
-            self.value = Bytes(1)
-            for i in range(7):
-                if value & 2 ** i != 0:
-                    self[7 - i] = true
-        else:
-            raise TypeError(f'cannot convert {type(value).__name__} '
-                            f'object to an unsigned character.')
+    Addition and subtraction of two unsigned characters are lookups in
+    the tables of the 8-bit ALU unless a gate-level adder is set.
+    """
+    size = 1
+    signed = False
+    description = 'an unsigned character'
 
     # ----- Informal Methods ----- #
     def __repr__(self, /):
@@ -193,157 +600,928 @@ class UnsignedChar(Mutable):
 
     def to_str(self, /):
         'Return a raw representation of the unsigned character.'
-        return chr(self.to_int())
+        return chr(self._value)
 
-    def to_mem(self, /):
-        'Return a hexadecimal representation of the unsigned character memory.'
-        return f'{self.to_int():0>2x}'
+    # ----- Calculation Methods ----- #
+    def __add__(self, other, /):
+        'Return self+other.'
+        if type(other) is UnsignedChar and type(self).adder is None:
+            return UnsignedChar._from_raw(
+                result_table('add')[self._value << 8 | other._value])
+        return super().__add__(other)
 
-    # ----- Comparison Methods ----- #
+    def __sub__(self, other, /):
+        'Return self-other.'
+        if type(other) is UnsignedChar and type(self).adder is None:
+            return UnsignedChar._from_raw(
+                result_table('sub')[self._value << 8 | other._value])
+        return super().__sub__(other)
 
-    # ----- Transformation Methods ----- #
-    def __hash__(self, /):
-        'Return hash(self).'
-        return hash(self.to_int())
 
-    def __bool__(self, /):
-        'Return bool(self).'
-        return any(self.value)
+class Short(FixedWidthInteger):
+    """
+    Mutable short integer.
+    Same as signed 16-bit integer.
+    The value can be from -32,768 to 32,767.
 
-    def to_int(self, /):
-        'Return a python integer translation of the unsigned character.'
-        return self.value[0].to_int()
+    Short(short) -> mutable copy of the short integer
+    Short(int) -> short integer initialized with given value
+    Short(bytes) -> short integer read from a byte group of size 2
+    Short() -> Empty short integer
 
-    # ----- Iterable Methods ----- #
-    def __len__(self, /):
-        'Return len(self).'
-        return 8
+    Construct a mutable short integer from:
+        - a short integer object
+        - an integer from -32,768 to 32,767
+        - a byte group holding its memory
+        - nothing
+    """
+    size = 2
+    signed = True
+    description = 'a short integer'
 
-    def __getitem__(self, key, /):
-        'Return self[key].'
-        return self.value[0][key]
 
-    def __setitem__(self, key, value, /):
-        'Set self[key] to value.'
-        self.value[0][key] = value
+class UnsignedShort(FixedWidthInteger):
+    """
+    Mutable unsigned short integer.
+    Same as unsigned 16-bit integer.
+    The value can be from 0 to 65,535.
+
+    UnsignedShort(unsigned_short) -> mutable copy of the unsigned short
+    UnsignedShort(int) -> unsigned short initialized with given value
+    UnsignedShort(bytes) -> unsigned short read from a byte group of size 2
+    UnsignedShort() -> Empty unsigned short
+
+    Construct a mutable unsigned short integer from:
+        - an unsigned short integer object
+        - an integer from 0 to 65,535
+        - a byte group holding its memory
+        - nothing
+    """
+    size = 2
+    signed = False
+    description = 'an unsigned short integer'
 
-    def __delitem__(self, key, /):
-        'Delete self[key].'
-        if isinstance(key, (int, slice)):
-            raise ValueError('unsigned character memory size is fixed')
-        else:
-            raise TypeError(f'unsigned character indices must be '
-                            f'integers or slices, not {type(key).__name__}')
 
-    def __iter__(self, /):
-        'Implement iter(self).'
-        return iter(self.value[0])
+class Integer(FixedWidthInteger):
+    """
+    Mutable integer.
+    Same as signed 32-bit integer.
+    The value can be from -2,147,483,648 to 2,147,483,647.
+
+    Integer(integer) -> mutable copy of the integer
+    Integer(int) -> integer initialized with given value
+    Integer(bytes) -> integer read from a byte group of size 4
+    Integer() -> Empty integer
+
+    Construct a mutable integer from:
+        - an integer object
+        - an integer from -2,147,483,648 to 2,147,483,647
+        - a byte group holding its memory
+        - nothing
+    """
+    size = 4
+    signed = True
+    description = 'an integer'
 
-    def __reversed__(self, /):
-        'Return a reverse iterator over the object.'
-        return reversed(self.value[0])
 
-    # ----- Calculation Methods ----- #
-    def __add__(self, other, /):
-        'Return self+other.'
-        if isinstance(other, UnsignedChar):
-            carry = false
-            result = Char()
-            for i in range(8):
-                last_carry = carry
-                carry = false
-                digit = false
-                for value in (self[7 - i], other[7 - i], last_carry):
-                    if value:
-                        if digit:
-                            carry = true
-                            digit = false
-                        else:
-                            digit = true
-                result.value[0][7 - i] = digit
-            return result
-        else:
-            return NotImplemented
+class UnsignedInteger(FixedWidthInteger):
+    """
+    Mutable unsigned integer.
+    Same as unsigned 32-bit integer.
+    The value can be from 0 to 4,294,967,295.
+
+    UnsignedInteger(unsigned_integer) -> mutable copy of the unsigned
+                                         integer
+    UnsignedInteger(int) -> unsigned integer initialized with given value
+    UnsignedInteger(bytes) -> unsigned integer read from a byte group
+                              of size 4
+    UnsignedInteger() -> Empty unsigned integer
+
+    Construct a mutable unsigned integer from:
+        - an unsigned integer object
+        - an integer from 0 to 4,294,967,295
+        - a byte group holding its memory
+        - nothing
+    """
+    size = 4
+    signed = False
+    description = 'an unsigned integer'
 
-    def __iadd__(self, other, /):
-        'Implement self+=other.'
-        if isinstance(other, UnsignedChar):
-            self.value = (self + other).value
-        else:
-            return NotImplemented
 
-    # ----- Custom Mutable Methods ----- #
-    def copy(self, /):
-        'Return a copy of the unsigned character.'
-        return UnsignedChar(self.value)
+class Long(FixedWidthInteger):
+    """
+    Mutable long integer.
+    Same as signed 64-bit integer (LP64 data model).
+    The value can be from -9,223,372,036,854,775,808
+    to 9,223,372,036,854,775,807.
+
+    Long(long) -> mutable copy of the long integer
+    Long(int) -> long integer initialized with given value
+    Long(bytes) -> long integer read from a byte group of size 8
+    Long() -> Empty long integer
+
+    Construct a mutable long integer from:
+        - a long integer object
+        - an integer in the range of the type
+        - a byte group holding its memory
+        - nothing
+    """
+    size = 8
+    signed = True
+    description = 'a long integer'
 
 
-class Short(Mutable):
+class UnsignedLong(FixedWidthInteger):
     """
-    Mutable short integer.
-    Same as 16-bit integer.
-    The value can be from -32,768 to 32,767.
+    Mutable unsigned long integer.
+    Same as unsigned 64-bit integer (LP64 data model).
+    The value can be from 0 to 18,446,744,073,709,551,615.
+
+    UnsignedLong(unsigned_long) -> mutable copy of the unsigned long
+    UnsignedLong(int) -> unsigned long initialized with given value
+    UnsignedLong(bytes) -> unsigned long read from a byte group of size 8
+    UnsignedLong() -> Empty unsigned long
+
+    Construct a mutable unsigned long integer from:
+        - an unsigned long integer object
+        - an integer in the range of the type
+        - a byte group holding its memory
+        - nothing
+    """
+    size = 8
+    signed = False
+    description = 'an unsigned long integer'
 
-    Char(char) -> mutable copy of char
-    Char(int) -> Char object initialized with given value
-    Char() -> Empty Char object
 
-    Construct a mutable short integer from:
-        - a character object
-        - an integer from 0 to 255
+class LongLong(FixedWidthInteger):
+    """
+    Mutable long long integer.
+    Same as signed 64-bit integer.
+    The value can be from -9,223,372,036,854,775,808
+    to 9,223,372,036,854,775,807.
+
+    LongLong(long_long) -> mutable copy of the long long integer
+    LongLong(int) -> long long integer initialized with given value
+    LongLong(bytes) -> long long integer read from a byte group of size 8
+    LongLong() -> Empty long long integer
+
+    Construct a mutable long long integer from:
+        - a long long integer object
+        - an integer in the range of the type
+        - a byte group holding its memory
         - nothing
     """
-    pass
+    size = 8
+    signed = True
+    description = 'a long long integer'
 
 
-class UnsignedShort(Mutable):
-    pass
+class UnsignedLongLong(FixedWidthInteger):
+    """
+    Mutable unsigned long long integer.
+    Same as unsigned 64-bit integer.
+    The value can be from 0 to 18,446,744,073,709,551,615.
+
+    UnsignedLongLong(unsigned_long_long) -> mutable copy of the unsigned
+                                            long long
+    UnsignedLongLong(int) -> unsigned long long initialized with given
+                             value
+    UnsignedLongLong(bytes) -> unsigned long long read from a byte group
+                               of size 8
+    UnsignedLongLong() -> Empty unsigned long long
+
+    Construct a mutable unsigned long long integer from:
+        - an unsigned long long integer object
+        - an integer in the range of the type
+        - a byte group holding its memory
+        - nothing
+    """
+    size = 8
+    signed = False
+    description = 'an unsigned long long integer'
 
 
-class Integer(Mutable):
-    pass
+class FloatingPoint(MutableIterable):
+    """
+    Mutable IEEE 754 binary floating-point number.
+    Base of the floating-point data types, parametrised by the class
+    attributes size (in bytes), exponent_bits, fraction_bits and
+    explicit_integer (set for formats storing the integer bit of the
+    significand, like x87 extended precision).
+
+    FloatingPoint(float_object) -> number converted from another
+                                   floating-point object
+    FloatingPoint(float) -> number converted from a python float
+    FloatingPoint(int) -> number converted from an integer
+    FloatingPoint(bytes) -> number read from a byte group of its size,
+                            least significant byte first
+    FloatingPoint(value, rounding) -> number converted with a rounding
+                                      mode
+    FloatingPoint() -> Positive zero
+
+    Construct a mutable floating-point number from:
+        - a floating-point or integer object
+        - a python float or integer
+        - a byte group holding its memory
+        - nothing
 
+    The value is stored as its raw bit pattern.  Conversions and
+    arithmetic round exactly to the format with the rounding mode of
+    the class attribute rounding, one of 'nearest' (ties to even),
+    'zero', 'up' and 'down'.  Subnormals, signed zeros, infinities
+    and NaN payloads are kept; as in C, division by zero gives an
+    infinity.  Operations between two floating-point types give the
+    wider type; python and integer operands take the type of the
+    floating-point operand.
+    """
+    size: int = 0
+    exponent_bits: int = 0
+    fraction_bits: int = 0
+    explicit_integer: bool = False
+    description: str = 'a floating-point number'
+    rounding: str = 'nearest'
+    _typecode: str = None
+    _bits: int
+    _mask: int
+    _bias: int
+    _precision: int
+    _emin: int
+    _emax: int
+    _exponent_max: int
+    _significand_bits: int
+    _significand_mask: int
+    _fraction_mask: int
+    _integer_bit: int
+    _quiet: int
+    _infinity: int
+    _largest: int
+    _default_nan: int
+    _value: int
+
+    def __init_subclass__(cls, /, **kwargs):
+        'Derive the format constants of the subclass from its fields.'
+        super().__init_subclass__(**kwargs)
+        cls._significand_bits = cls.fraction_bits + cls.explicit_integer
+        cls._bits = 1 + cls.exponent_bits + cls._significand_bits
+        cls._mask = (1 << cls._bits) - 1
+        cls._bias = (1 << cls.exponent_bits - 1) - 1
+        cls._precision = cls.fraction_bits + 1
+        cls._emin = 1 - cls._bias
+        cls._emax = cls._bias
+        cls._exponent_max = (1 << cls.exponent_bits) - 1
+        cls._significand_mask = (1 << cls._significand_bits) - 1
+        cls._fraction_mask = (1 << cls.fraction_bits) - 1
+        cls._integer_bit = 1 << cls.fraction_bits if cls.explicit_integer \
+            else 0
+        cls._quiet = 1 << cls.fraction_bits - 1
+        cls._infinity = (cls._exponent_max << cls._significand_bits |
+                         cls._integer_bit)
+        cls._largest = ((cls._exponent_max - 1) << cls._significand_bits |
+                        cls._significand_mask)
+        cls._default_nan = (1 << cls._bits - 1 | cls._infinity |
+                            cls._quiet)
 
-class UnsignedInteger(Mutable):
-    pass
+    # ----- Initialization Methods ----- #
+    def __init__(self, value=0.0, rounding=None):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        self._value = self._encode(value, _rounding(self, rounding))
+
+    @classmethod
+    def _from_raw(cls, raw, /):
+        'Return a number of the class holding the raw bit pattern.'
+        self = cls.__new__(cls)
+        self._value = raw & cls._mask
+        return self
+
+    @classmethod
+    def _encode(cls, value, rounding, /):
+        'Return the raw bit pattern of value rounded to the format.'
+        if isinstance(value, float):
+            if cls._typecode == 'd':
+                return _DOUBLE_BITS.unpack(_DOUBLE.pack(value))[0]
+            elif cls._typecode == 'f' and rounding == 'nearest' and \
+                    value == value:
+                try:
+                    return _FLOAT_BITS.unpack(_FLOAT.pack(value))[0]
+                except OverflowError:
+                    pass
+            return cls._convert(
+                Double, _DOUBLE_BITS.unpack(_DOUBLE.pack(value))[0],
+                rounding)
+        elif isinstance(value, FloatingPoint):
+            if type(value) is cls:
+                return value._value
+            return cls._convert(type(value), value._value, rounding)
+        elif isinstance(value, FixedWidthInteger):
+            value = value.to_int()
+        elif isinstance(value, (Bytes, FrozenBytes)):
+            if len(value) != cls.size:
+                raise ValueError(f'{cls.description} takes {cls.size} '
+                                 f'bytes, not {len(value)}.')
+            return int.from_bytes(value._data, 'little') & cls._mask
+        elif not isinstance(value, int):
+            raise TypeError(f'cannot convert {type(value).__name__} '
+                            f'object to {cls.description}.')
+        return cls._round(1 if value < 0 else 0, abs(value), 0, rounding)
+
+    @classmethod
+    def _round(cls, sign, n, e, rounding, /):
+        'Return the raw bit pattern of (-1)**sign * n * 2**e.'
+        sign <<= cls._bits - 1
+        if n == 0:
+            return sign
+        exponent = max(n.bit_length() - 1 + e, cls._emin)
+        shift = exponent - cls._precision + 1 - e
+        if shift > 0:
+            rest = n & (1 << shift) - 1
+            n >>= shift
+            if rest and _rounds_up(rounding, sign, n & 1,
+                                   rest, 1 << shift - 1):
+                n += 1
+                if n >> cls._precision:
+                    n >>= 1
+                    exponent += 1
+        else:
+            n <<= -shift
+        if exponent > cls._emax:
+            if rounding == 'nearest' or \
+                    rounding == ('down' if sign else 'up'):
+                return sign | cls._infinity
+            return sign | cls._largest
+        if n >> cls._precision - 1:
+            return (sign | exponent + cls._bias << cls._significand_bits |
+                    (n if cls.explicit_integer else n & cls._fraction_mask))
+        return sign | n
+
+    @classmethod
+    def _convert(cls, source, raw, rounding, /):
+        'Return the raw bit pattern of a raw number of the source class.'
+        sign, kind, n, e = source._parts(raw)
+        if kind == _FINITE:
+            return cls._round(sign, n, e, rounding)
+        elif kind == _INFINITE:
+            return sign << cls._bits - 1 | cls._infinity
+        return cls._nan(sign, n, source.fraction_bits)
+
+    @classmethod
+    def _nan(cls, sign, fraction, fraction_bits, /):
+        'Return the raw bit pattern of a NaN, aligning the payload.'
+        shift = cls.fraction_bits - fraction_bits
+        fraction = fraction << shift if shift >= 0 else fraction >> -shift
+        return (sign << cls._bits - 1 | cls._infinity |
+                (fraction or cls._quiet))
+
+    @classmethod
+    def _parts(cls, raw, /):
+        """
+        Return the sign, kind, significand and exponent of a raw number.
+
+        Finite numbers are (-1)**sign * significand * 2**exponent; the
+        significand of a NaN is its fraction field.
+        """
+        sign = raw >> cls._bits - 1
+        biased = raw >> cls._significand_bits & cls._exponent_max
+        n = raw & cls._significand_mask
+        if biased == cls._exponent_max:
+            fraction = n & cls._fraction_mask
+            if fraction == 0 and n & cls._integer_bit == cls._integer_bit:
+                return sign, _INFINITE, 0, 0
+            return sign, _NAN, fraction, 0
+        elif biased == 0:
+            return sign, _FINITE, n, cls._emin - cls._precision + 1
+        if not cls.explicit_integer:
+            n |= 1 << cls.fraction_bits
+        return sign, _FINITE, n, biased - cls._bias - cls._precision + 1
+
+    @classmethod
+    def nan(cls, payload=0, signaling=False, sign=False, /):
+        'Return a NaN of the class with given payload, signal and sign.'
+        if not 0 <= payload < cls._quiet or signaling and payload == 0:
+            raise ValueError(f'invalid NaN payload {payload} '
+                             f'for {cls.description}.')
+        return cls._from_raw((1 << cls._bits - 1 if sign else 0) |
+                             cls._infinity | payload |
+                             (0 if signaling else cls._quiet))
+
+    # ----- Memory Methods ----- #
+    @property
+    def value(self, /):
+        """
+        A frozen byte group of the memory, least significant byte
+        first.  Assign a byte group to change the memory.
+        """
+        return FrozenBytes._wrap(self._value.to_bytes(self.size, 'little'))
+
+    @value.setter
+    def value(self, value, /):
+        if not isinstance(value, (Bytes, FrozenBytes)) or \
+                len(value) != self.size:
+            raise ValueError(f'{self.description} takes a byte group '
+                             f'of {self.size} bytes.')
+        self._value = int.from_bytes(value._data, 'little') & self._mask
+
+    @classmethod
+    def pack_many(cls, values, rounding=None, /):
+        """
+        Return a byte group holding the memory of an iterable of
+        numbers, converted without creating floating-point objects.
+        """
+        rounding = _rounding(cls, rounding)
+        if cls._typecode is not None and rounding == 'nearest':
+            data = array(cls._typecode, values)
+            if sys.byteorder == 'big':
+                data.byteswap()
+            return Bytes._wrap(bytearray(data))
+        return Bytes._wrap(bytearray(b''.join(
+            cls._encode(value, rounding).to_bytes(cls.size, 'little')
+            for value in values
+        )))
+
+    @classmethod
+    def unpack_many(cls, data, /):
+        """
+        Return an array of python floats read from the memory of
+        consecutive numbers of the class, held by a byte group or a
+        bytes-like object.  Numbers wider than a double are rounded to
+        nearest.
+        """
+        if isinstance(data, (Bytes, FrozenBytes)):
+            data = data._data
+        if len(data) % cls.size:
+            raise ValueError(f'{cls.description} takes {cls.size} bytes, '
+                             f'{len(data)} is not a multiple of it.')
+        if cls._typecode is None:
+            data = array('Q', [
+                Double._convert(cls, int.from_bytes(data[i:i + cls.size],
+                                                    'little'), 'nearest')
+                for i in range(0, len(data), cls.size)
+            ])
+            if sys.byteorder == 'big':
+                data.byteswap()
+            data = data.tobytes()
+        result = array(cls._typecode or 'd')
+        result.frombytes(data)
+        if sys.byteorder == 'big':
+            result.byteswap()
+        return result
 
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return f'{type(self).__name__}({self.to_str()})'
 
-class Long(Mutable):
-    pass
+    def __str__(self, /):
+        'Return str(self).'
+        return f'{type(self).__name__}({self.to_str()})'
 
+    def to_str(self, /):
+        'Return a raw representation of the number.'
+        return repr(self.to_float())
 
-class UnsignedLong(Mutable):
-    pass
+    def to_mem(self, /):
+        'Return a hexadecimal representation of the number memory.'
+        return self._value.to_bytes(self.size, 'little').hex(' ')
 
+    # ----- Comparison Methods ----- #
+    def _key(self, /):
+        'Return the exact value as a fraction, or a float if not finite.'
+        sign, kind, n, e = self._parts(self._value)
+        if kind == _FINITE:
+            value = Fraction(n << e) if e >= 0 else Fraction(n, 1 << -e)
+            return -value if sign else value
+        elif kind == _INFINITE:
+            return -_INF if sign else _INF
+        return _NAN_FLOAT
+
+    @staticmethod
+    def _other_key(other, /):
+        'Return the comparison key of other, or None.'
+        if isinstance(other, FloatingPoint):
+            return other._key()
+        elif isinstance(other, FixedWidthInteger):
+            return other.to_int()
+        elif isinstance(other, (int, float)):
+            return other
+        return None
+
+    def __lt__(self, other, /):
+        'Return self<other.'
+        other = self._other_key(other)
+        return NotImplemented if other is None else self._key() < other
+
+    def __le__(self, other, /):
+        'Return self<=other.'
+        other = self._other_key(other)
+        return NotImplemented if other is None else self._key() <= other
+
+    def __eq__(self, other, /):
+        'Return self==other.'
+        other = self._other_key(other)
+        return NotImplemented if other is None else self._key() == other
+
+    def __ne__(self, other, /):
+        'Return self!=other.'
+        other = self._other_key(other)
+        return NotImplemented if other is None else self._key() != other
+
+    def __gt__(self, other, /):
+        'Return self>other.'
+        other = self._other_key(other)
+        return NotImplemented if other is None else self._key() > other
+
+    def __ge__(self, other, /):
+        'Return self>=other.'
+        other = self._other_key(other)
+        return NotImplemented if other is None else self._key() >= other
+
+    # ----- Classification Methods ----- #
+    def is_nan(self, /):
+        'Return whether the number is a NaN.'
+        return self._parts(self._value)[1] == _NAN
+
+    def is_signaling(self, /):
+        'Return whether the number is a signaling NaN.'
+        return self.is_nan() and not self._value & self._quiet
+
+    def is_infinite(self, /):
+        'Return whether the number is an infinity.'
+        return self._parts(self._value)[1] == _INFINITE
+
+    def is_finite(self, /):
+        'Return whether the number is neither an infinity nor a NaN.'
+        return self._parts(self._value)[1] == _FINITE
+
+    def is_subnormal(self, /):
+        'Return whether the number is subnormal.'
+        return (self._value >> self._significand_bits &
+                self._exponent_max) == 0 and \
+            self._value & self._significand_mask != 0
+
+    @property
+    def payload(self, /):
+        'The payload of a NaN, without its quiet bit.'
+        if not self.is_nan():
+            raise ValueError(f'{self!r} is not a NaN.')
+        return self._value & self._fraction_mask & ~self._quiet
 
-class LongLong(Mutable):
-    pass
+    # ----- Transformation Methods ----- #
+    def __hash__(self, /):
+        'Return hash(self).'
+        return hash(self._key())
 
+    def __bool__(self, /):
+        'Return bool(self).'
+        return self._value & (self._mask >> 1) != 0
+
+    def __float__(self, /):
+        'Return float(self).'
+        return self.to_float()
+
+    def __int__(self, /):
+        'Return int(self), truncated toward zero.'
+        n, d = self.as_integer_ratio()
+        return n // d if n >= 0 else -(-n // d)
+
+    def to_float(self, /):
+        'Return a python float translation, rounded to nearest.'
+        if self._typecode == 'f':
+            return _FLOAT.unpack(_FLOAT_BITS.pack(self._value))[0]
+        elif self._typecode == 'd':
+            return _DOUBLE.unpack(_DOUBLE_BITS.pack(self._value))[0]
+        return _DOUBLE.unpack(_DOUBLE_BITS.pack(
+            Double._convert(type(self), self._value, 'nearest')))[0]
+
+    def as_integer_ratio(self, /):
+        'Return a pair of integers whose ratio is exactly the number.'
+        sign, kind, n, e = self._parts(self._value)
+        if kind == _INFINITE:
+            raise OverflowError('cannot convert Infinity to integer ratio')
+        elif kind == _NAN:
+            raise ValueError('cannot convert NaN to integer ratio')
+        value = self._key()
+        return value.numerator, value.denominator
+
+    # ----- Iterable Methods ----- #
+    __len__ = FixedWidthInteger.__len__
+    __getitem__ = FixedWidthInteger.__getitem__
+    __setitem__ = FixedWidthInteger.__setitem__
+    __delitem__ = FixedWidthInteger.__delitem__
+    __iter__ = FixedWidthInteger.__iter__
+    __reversed__ = FixedWidthInteger.__reversed__
+
+    # ----- Calculation Helper Methods ----- #
+    def _operands(self, other, /):
+        'Return the result type and the raw patterns of both operands.'
+        if isinstance(other, FloatingPoint):
+            cls = type(self) if self.size >= other.size else type(other)
+        elif isinstance(other, (int, float, FixedWidthInteger)):
+            cls = type(self)
+        else:
+            return None, None, None
+        return (cls, cls._encode(self, 'nearest'),
+                cls._encode(other, cls.rounding))
+
+    @classmethod
+    def _propagate(cls, a, b, /):
+        'Return the quiet NaN propagated from two raw parts, or None.'
+        for sign, kind, n, _ in (a, b):
+            if kind == _NAN:
+                return sign << cls._bits - 1 | cls._infinity | n | cls._quiet
+        return None
+
+    @classmethod
+    def _add(cls, a, b, /):
+        'Return the raw sum of two raw numbers.'
+        a, b = cls._parts(a), cls._parts(b)
+        nan = cls._propagate(a, b)
+        if nan is not None:
+            return nan
+        (sa, ka, na, ea), (sb, kb, nb, eb) = a, b
+        if ka == _INFINITE or kb == _INFINITE:
+            if ka == kb and sa != sb:
+                return cls._default_nan
+            return (sa if ka == _INFINITE else sb) << cls._bits - 1 | \
+                cls._infinity
+        e = min(ea, eb)
+        total = ((-na if sa else na) << ea - e) + \
+            ((-nb if sb else nb) << eb - e)
+        if total == 0:
+            if na or nb:
+                sign = 1 if cls.rounding == 'down' else 0
+            else:
+                sign = sa | sb if cls.rounding == 'down' else sa & sb
+            return sign << cls._bits - 1
+        return cls._round(1 if total < 0 else 0, abs(total), e, cls.rounding)
+
+    @classmethod
+    def _multiply(cls, a, b, /):
+        'Return the raw product of two raw numbers.'
+        a, b = cls._parts(a), cls._parts(b)
+        nan = cls._propagate(a, b)
+        if nan is not None:
+            return nan
+        (sa, ka, na, ea), (sb, kb, nb, eb) = a, b
+        sign = sa ^ sb
+        if ka == _INFINITE or kb == _INFINITE:
+            if ka == _FINITE and na == 0 or kb == _FINITE and nb == 0:
+                return cls._default_nan
+            return sign << cls._bits - 1 | cls._infinity
+        return cls._round(sign, na * nb, ea + eb, cls.rounding)
+
+    @classmethod
+    def _divide(cls, a, b, /):
+        'Return the raw quotient of two raw numbers.'
+        a, b = cls._parts(a), cls._parts(b)
+        nan = cls._propagate(a, b)
+        if nan is not None:
+            return nan
+        (sa, ka, na, ea), (sb, kb, nb, eb) = a, b
+        sign = sa ^ sb
+        if ka == _INFINITE:
+            if kb == _INFINITE:
+                return cls._default_nan
+            return sign << cls._bits - 1 | cls._infinity
+        elif kb == _INFINITE:
+            return sign << cls._bits - 1
+        elif nb == 0:
+            if na == 0:
+                return cls._default_nan
+            return sign << cls._bits - 1 | cls._infinity
+        # keep a sticky bit below the rounding position
+        k = max(0, cls._precision + 2 - na.bit_length() + nb.bit_length())
+        quotient, remainder = divmod(na << k, nb)
+        return cls._round(sign, quotient << 1 | (remainder != 0),
+                          ea - eb - k - 1, cls.rounding)
+
+    # ----- Calculation Methods ----- #
+    def __add__(self, other, /):
+        'Return self+other.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else \
+            cls._from_raw(cls._add(a, b))
+
+    def __radd__(self, other, /):
+        'Return other+self.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else \
+            cls._from_raw(cls._add(b, a))
+
+    def __sub__(self, other, /):
+        'Return self-other.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else \
+            cls._from_raw(cls._add(a, _negate(cls, b)))
+
+    def __rsub__(self, other, /):
+        'Return other-self.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else \
+            cls._from_raw(cls._add(b, _negate(cls, a)))
+
+    def __mul__(self, other, /):
+        'Return self*other.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else \
+            cls._from_raw(cls._multiply(a, b))
+
+    def __rmul__(self, other, /):
+        'Return other*self.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else \
+            cls._from_raw(cls._multiply(b, a))
+
+    def __truediv__(self, other, /):
+        'Return self/other.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else \
+            cls._from_raw(cls._divide(a, b))
+
+    def __rtruediv__(self, other, /):
+        'Return other/self.'
+        cls, a, b = self._operands(other)
+        return NotImplemented if cls is None else \
+            cls._from_raw(cls._divide(b, a))
+
+    def __neg__(self, /):
+        'Return -self.'
+        return type(self)._from_raw(self._value ^ 1 << self._bits - 1)
+
+    def __pos__(self, /):
+        'Return +self.'
+        return self.copy()
+
+    def __abs__(self, /):
+        'Return abs(self).'
+        return type(self)._from_raw(self._value & self._mask >> 1)
+
+    # ----- In-place Calculation Methods ----- #
+    def _assign(self, result, /):
+        'Store the value of result in self, rounding to its format.'
+        if result is NotImplemented:
+            return NotImplemented
+        self._value = self._encode(result, self.rounding)
+        return self
+
+    def __iadd__(self, other, /):
+        'Implement self+=other.'
+        return self._assign(self.__add__(other))
+
+    def __isub__(self, other, /):
+        'Implement self-=other.'
+        return self._assign(self.__sub__(other))
+
+    def __imul__(self, other, /):
+        'Implement self*=other.'
+        return self._assign(self.__mul__(other))
 
-class UnsignedLongLong(Mutable):
-    pass
+    def __itruediv__(self, other, /):
+        'Implement self/=other.'
+        return self._assign(self.__truediv__(other))
 
+    # ----- Custom Mutable Methods ----- #
+    def copy(self, /):
+        'Return a copy of the number.'
+        return type(self)._from_raw(self._value)
+
+
+_FINITE = 0
+_INFINITE = 1
+_NAN = 2
+_INF = float('inf')
+_NAN_FLOAT = float('nan')
+_FLOAT = Struct('<f')
+_FLOAT_BITS = Struct('<I')
+_DOUBLE = Struct('<d')
+_DOUBLE_BITS = Struct('<Q')
+
+
+def _rounding(obj, rounding, /):
+    'Return a checked rounding mode, defaulting to the one of obj.'
+    if rounding is None:
+        return obj.rounding
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f'rounding mode must be one of '
+                         f'{ROUNDING_MODES}, not {rounding!r}.')
+    return rounding
+
+
+def _rounds_up(rounding, sign, odd, rest, half, /):
+    'Return whether a truncated significand rounds away from zero.'
+    if rounding == 'nearest':
+        return rest > half or rest == half and odd
+    elif rounding == 'zero':
+        return False
+    elif rounding == 'up':
+        return not sign
+    return bool(sign)
+
+
+def _negate(cls, raw, /):
+    'Return a raw number with its sign flipped, unless it is a NaN.'
+    if cls._parts(raw)[1] == _NAN:
+        return raw
+    return raw ^ 1 << cls._bits - 1
+
+
+class Float(FloatingPoint):
+    """
+    Mutable single-precision floating-point number.
+    Same as IEEE 754 binary32.
+    The finite values can be from -3.4028235e+38 to 3.4028235e+38.
+
+    Float(float_object) -> number converted from another floating-point
+                           object
+    Float(float) -> number converted from a python float
+    Float(int) -> number converted from an integer
+    Float(bytes) -> number read from a byte group of size 4
+    Float(value, rounding) -> number converted with a rounding mode
+    Float() -> Positive zero
+
+    Construct a mutable single-precision number from:
+        - a floating-point or integer object
+        - a python float or integer
+        - a byte group holding its memory
+        - nothing
+    """
+    size = 4
+    exponent_bits = 8
+    fraction_bits = 23
+    description = 'a single-precision float'
+    _typecode = 'f'
 
-class Float(Mutable):
-    pass
 
+class Double(FloatingPoint):
+    """
+    Mutable double-precision floating-point number.
+    Same as IEEE 754 binary64 and the python float.
+    The finite values can be from -1.7976931348623157e+308 to
+    1.7976931348623157e+308.
+
+    Double(float_object) -> number converted from another floating-point
+                            object
+    Double(float) -> exact copy of a python float
+    Double(int) -> number converted from an integer
+    Double(bytes) -> number read from a byte group of size 8
+    Double(value, rounding) -> number converted with a rounding mode
+    Double() -> Positive zero
+
+    Construct a mutable double-precision number from:
+        - a floating-point or integer object
+        - a python float or integer
+        - a byte group holding its memory
+        - nothing
+    """
+    size = 8
+    exponent_bits = 11
+    fraction_bits = 52
+    description = 'a double-precision float'
+    _typecode = 'd'
 
-class Double(Mutable):
-    pass
 
+class LongDouble(FloatingPoint):
+    """
+    Mutable extended-precision floating-point number.
+    Same as the x87 80-bit extended format, with a 64-bit significand
+    storing its integer bit, padded to 16 bytes like on x86-64.
+    The finite values can be from about -1.19e+4932 to 1.19e+4932.
+
+    LongDouble(float_object) -> number converted from another
+                                floating-point object
+    LongDouble(float) -> exact copy of a python float
+    LongDouble(int) -> number converted from an integer
+    LongDouble(bytes) -> number read from a byte group of size 16,
+                         ignoring the padding bytes
+    LongDouble(value, rounding) -> number converted with a rounding mode
+    LongDouble() -> Positive zero
+
+    Construct a mutable extended-precision number from:
+        - a floating-point or integer object
+        - a python float or integer
+        - a byte group holding its memory
+        - nothing
 
-class LongDouble(Mutable):
-    pass
+    Conversion to python floats rounds to the nearest double.
+    """
+    size = 16
+    exponent_bits = 15
+    fraction_bits = 63
+    explicit_integer = True
+    description = 'an extended-precision float'
 
 
-DATA_TYPES = (
+INTEGER_TYPES = (
     Char, UnsignedChar,
     Short, UnsignedShort,
     Integer, UnsignedInteger,
     Long, UnsignedLong,
     LongLong, UnsignedLongLong,
+)
+
+FLOAT_TYPES = (
     Float, Double, LongDouble,
 )
 
+DATA_TYPES = INTEGER_TYPES + FLOAT_TYPES
+
 
 null = Char()
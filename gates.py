@@ -0,0 +1,279 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+from obj import Mutable
+from bits import Bit, true, false
+from data import FixedWidthInteger
+
+__all__ = [
+    'Adder',
+    'RippleCarryAdder',
+    'CarryLookaheadAdder',
+    'CarrySelectAdder',
+    'gate_level',
+]
+
+Signal = Tuple[Bit, int]
+
+
+class Adder(Mutable, ABC):
+    """
+    Gate-level binary adder with cost accounting.
+
+    Adder subclasses build the sum out of two-input AND, OR and XOR
+    gates and NOT gates on bits.  Every gate evaluation is counted, and
+    each signal carries its depth so the critical path of an operation
+    is known.  The counters of the last operation and the running
+    totals are exported by stats().
+    """
+    name = 'adder'
+    gates: int
+    operations: int
+    max_depth: int
+    last_gates: int
+    last_depth: int
+
+    # ----- Initialization Methods ----- #
+    def __init__(self):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        self.reset_stats()
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return f'{type(self).__name__}()'
+
+    def __str__(self, /):
+        'Return str(self).'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return a raw representation of the adder.'
+        return self.__repr__()
+
+    # ----- Gate Methods ----- #
+    def _and(self, x: Signal, y: Signal, /) -> Signal:
+        'Evaluate an AND gate.'
+        self.last_gates += 1
+        return x[0] & y[0], max(x[1], y[1]) + 1
+
+    def _or(self, x: Signal, y: Signal, /) -> Signal:
+        'Evaluate an OR gate.'
+        self.last_gates += 1
+        return x[0] | y[0], max(x[1], y[1]) + 1
+
+    def _xor(self, x: Signal, y: Signal, /) -> Signal:
+        'Evaluate an XOR gate.'
+        self.last_gates += 1
+        return x[0] ^ y[0], max(x[1], y[1]) + 1
+
+    def _not(self, x: Signal, /) -> Signal:
+        'Evaluate a NOT gate.'
+        self.last_gates += 1
+        return (false if x[0] else true), x[1] + 1
+
+    def _tree(self, gate, signals: List[Signal], /) -> Signal:
+        'Combine signals with a balanced tree of two-input gates.'
+        while len(signals) > 1:
+            paired = [gate(signals[i], signals[i + 1])
+                      for i in range(0, len(signals) - 1, 2)]
+            if len(signals) % 2:
+                paired.append(signals[-1])
+            signals = paired
+        return signals[0]
+
+    def _full_adder(self, a: Signal, b: Signal,
+                    carry: Signal, /) -> Tuple[Signal, Signal]:
+        'Return the sum and carry-out signals of one bit position.'
+        half = self._xor(a, b)
+        total = self._xor(half, carry)
+        carry = self._or(self._and(a, b), self._and(half, carry))
+        return total, carry
+
+    def _ripple(self, a: List[Signal], b: List[Signal],
+                carry: Signal, /) -> Tuple[List[Signal], Signal]:
+        'Return the sum signals and carry-out of a ripple-carry chain.'
+        result = []
+        for x, y in zip(a, b):
+            total, carry = self._full_adder(x, y, carry)
+            result.append(total)
+        return result, carry
+
+    def _mux(self, select: Signal, one: Signal, zero: Signal, /) -> Signal:
+        'Return one when select is set, zero otherwise.'
+        return self._or(self._and(select, one),
+                        self._and(self._not(select), zero))
+
+    @abstractmethod
+    def _add(self, a: List[Signal], b: List[Signal],
+             carry: Signal, /) -> Tuple[List[Signal], Signal]:
+        'Return the sum signals and carry-out, least significant first.'
+
+    # ----- Calculation Methods ----- #
+    def add(self, a, b, width, carry=0, /):
+        """
+        Return the width-bit sum of a, b and the carry and the carry-out.
+
+        The operands are python integers taken modulo 2 ** width.
+        """
+        self.last_gates = 0
+        a = [(Bit(a >> i & 1), 0) for i in range(width)]
+        b = [(Bit(b >> i & 1), 0) for i in range(width)]
+        total, carry = self._add(a, b, (Bit(carry), 0))
+        result = 0
+        for i, (bit, _) in enumerate(total):
+            if bit:
+                result |= 1 << i
+        self.last_depth = max(depth for _, depth in total + [carry])
+        self.gates += self.last_gates
+        self.operations += 1
+        self.max_depth = max(self.max_depth, self.last_depth)
+        return result, 1 if carry[0] else 0
+
+    # ----- Statistics Methods ----- #
+    def stats(self, /) -> Dict[str, float]:
+        'Return the gate and depth counters as a dictionary.'
+        return {
+            'operations': self.operations,
+            'gates': self.gates,
+            'gates_per_operation':
+                self.gates / self.operations if self.operations else 0.0,
+            'last_gates': self.last_gates,
+            'last_depth': self.last_depth,
+            'max_depth': self.max_depth,
+        }
+
+    def reset_stats(self, /):
+        'Set every counter to zero.'
+        self.gates = 0
+        self.operations = 0
+        self.max_depth = 0
+        self.last_gates = 0
+        self.last_depth = 0
+
+    # ----- Mutable Methods ----- #
+    def copy(self, /):
+        'Return an adder of the same architecture with zero counters.'
+        return type(self)()
+
+
+class RippleCarryAdder(Adder):
+    """
+    Ripple-carry adder.
+
+    RippleCarryAdder() -> chain of full adders
+
+    Five gates per bit; the carry crosses every bit position, so the
+    depth grows linearly with the width.
+    """
+    name = 'ripple-carry'
+
+    def _add(self, a, b, carry, /):
+        'Return the sum signals and carry-out, least significant first.'
+        return self._ripple(a, b, carry)
+
+
+class CarryLookaheadAdder(Adder):
+    """
+    Carry-lookahead adder.
+
+    CarryLookaheadAdder(block) -> adder computing the carries of each
+                                  block of bits from generate and
+                                  propagate signals, chaining the blocks
+    CarryLookaheadAdder() -> adder with 4-bit blocks
+    """
+    name = 'carry-lookahead'
+    block: int
+
+    def __init__(self, block=4):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if block <= 0:
+            raise ValueError(f'block size must be positive, not {block}.')
+        self.block = block
+        super().__init__()
+
+    def __repr__(self, /):
+        'Return repr(self).'
+        return f'{type(self).__name__}({self.block})'
+
+    def copy(self, /):
+        'Return an adder of the same architecture with zero counters.'
+        return type(self)(self.block)
+
+    def _add(self, a, b, carry, /):
+        'Return the sum signals and carry-out, least significant first.'
+        generate = [self._and(x, y) for x, y in zip(a, b)]
+        propagate = [self._xor(x, y) for x, y in zip(a, b)]
+        result = []
+        for start in range(0, len(a), self.block):
+            stop = min(start + self.block, len(a))
+            block_carry = carry
+            for i in range(start, stop):
+                result.append(self._xor(propagate[i], block_carry))
+                # c[i+1] = g[i] | p[i]g[i-1] | ... | p[i]...p[start]c[start]
+                terms = [generate[i]]
+                for j in range(i - 1, start - 2, -1):
+                    inputs = propagate[j + 1:i + 1]
+                    inputs.append(generate[j] if j >= start else carry)
+                    terms.append(self._tree(self._and, inputs))
+                block_carry = self._tree(self._or, terms)
+            carry = block_carry
+        return result, carry
+
+
+class CarrySelectAdder(Adder):
+    """
+    Carry-select adder.
+
+    CarrySelectAdder(block) -> adder computing every block after the
+                               first for both carry-in values and
+                               selecting the result with multiplexers
+    CarrySelectAdder() -> adder with 4-bit blocks
+    """
+    name = 'carry-select'
+    block: int
+
+    def __init__(self, block=4):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if block <= 0:
+            raise ValueError(f'block size must be positive, not {block}.')
+        self.block = block
+        super().__init__()
+
+    def __repr__(self, /):
+        'Return repr(self).'
+        return f'{type(self).__name__}({self.block})'
+
+    def copy(self, /):
+        'Return an adder of the same architecture with zero counters.'
+        return type(self)(self.block)
+
+    def _add(self, a, b, carry, /):
+        'Return the sum signals and carry-out, least significant first.'
+        result, carry = self._ripple(a[:self.block], b[:self.block], carry)
+        for start in range(self.block, len(a), self.block):
+            stop = start + self.block
+            zero, zero_carry = self._ripple(a[start:stop], b[start:stop],
+                                            (false, 0))
+            one, one_carry = self._ripple(a[start:stop], b[start:stop],
+                                          (true, 0))
+            result.extend(self._mux(carry, x, y) for x, y in zip(one, zero))
+            carry = self._mux(carry, one_carry, zero_carry)
+        return result, carry
+
+
+@contextmanager
+def gate_level(adder=None, /):
+    """
+    Run the integer additions and subtractions in the block through
+    adder, a RippleCarryAdder by default.  Yield the adder.
+    """
+    if adder is None:
+        adder = RippleCarryAdder()
+    previous = FixedWidthInteger.adder
+    FixedWidthInteger.adder = adder
+    try:
+        yield adder
+    finally:
+        FixedWidthInteger.adder = previous
@@ -0,0 +1,678 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from copy import deepcopy
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from obj import Mutable
+from memory import AddressSpace
+
+__all__ = [
+    'Heap',
+    'FirstFitHeap',
+    'BestFitHeap',
+    'SegregatedHeap',
+    'BuddyHeap',
+    'compare_heaps',
+]
+
+HEAP_ADDRESS = 0x20000000
+HEAP_SIZE = 1 << 24
+SMALL_LIMIT = 1024
+
+Block = Tuple[int, int]
+
+
+class Heap(Mutable, ABC):
+    """
+    Heap manager of a region of an address space.
+
+    Heap subclasses take the arguments:
+        space: the address space, a new 32-bit one by default
+        base: the first address of the region, 0x20000000 by default
+        size: the size of the region, 16 MiB by default
+        alignment: the alignment of the blocks, 16 by default
+
+    Heap subclasses choose the free blocks serving each request;
+    SegregatedHeap is the fast default and the others serve to compare
+    strategies on a trace with compare_heaps().
+
+    malloc, calloc, realloc and free follow C: a failed allocation
+    returns 0, and realloc keeps the old block on failure.  Block
+    bookkeeping is kept out of the region, so the heap never writes to
+    memory except for calloc zeroing and realloc copies.
+
+    The heap counts every operation and the time it takes, and tracks
+    the bytes requested and held by live blocks.  stats() exports
+    these counters with the peak footprint and the internal and
+    external fragmentation.
+    """
+    name = 'heap'
+    space: AddressSpace
+    base: int
+    size: int
+    alignment: int
+    _blocks: Dict[int, int]
+    _requested: Dict[int, int]
+    requested_bytes: int
+    block_bytes: int
+    mallocs: int
+    frees: int
+    reallocs: int
+    failures: int
+    seconds: float
+    peak_block_bytes: int
+    peak_footprint: int
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, space=None, base=HEAP_ADDRESS, size=HEAP_SIZE,
+                 alignment=16):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if space is None:
+            space = AddressSpace()
+        elif not isinstance(space, AddressSpace):
+            raise TypeError(f'space must be an address space, '
+                            f'not {type(space).__name__}')
+        if alignment <= 0 or alignment & (alignment - 1):
+            raise ValueError(f'alignment must be a power of 2, '
+                             f'not {alignment}.')
+        if not base:
+            raise ValueError('heap base must not be the null address 0.')
+        if base % alignment:
+            raise ValueError(f'heap base {base:#x} is not aligned to '
+                             f'{alignment} bytes.')
+        if size < alignment:
+            raise ValueError(f'heap size must be at least {alignment}, '
+                             f'not {size}.')
+        space._check_range(base, size)
+        self.space = space
+        self.base = base
+        self.size = size - size % alignment
+        self.alignment = alignment
+        self._blocks = {}
+        self._requested = {}
+        self.requested_bytes = 0
+        self.block_bytes = 0
+        self._reset()
+        self.reset_stats()
+
+    @abstractmethod
+    def _reset(self, /):
+        'Set up the free blocks of an empty heap.'
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return (f'{type(self).__name__}(base={self.base:#x}, '
+                f'size={self.size}, blocks={len(self._blocks)})')
+
+    def __str__(self, /):
+        'Return str(self).'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return a raw representation of the heap.'
+        return self.__repr__()
+
+    # ----- Strategy Methods ----- #
+    def _block_size(self, size: int, /) -> int:
+        'Return the size of the block serving a request of size bytes.'
+        mask = self.alignment - 1
+        return max(size + mask & ~mask, self.alignment)
+
+    @abstractmethod
+    def _allocate(self, size: int, /) -> Optional[Block]:
+        """
+        Return the address and size of a free block of at least size
+        bytes taken off the free blocks.  Return None on failure.
+        """
+
+    @abstractmethod
+    def _release(self, address: int, size: int, /):
+        'Return the block of size bytes at address to the free blocks.'
+
+    def _resize(self, address: int, block: int, size: int, /):
+        """
+        Resize the block at address to at least size bytes in place and
+        return its new size.  Return None if it cannot stay in place.
+        """
+        return block if size <= block else None
+
+    @abstractmethod
+    def _largest_free(self, /) -> int:
+        'Return the size of the largest free block.'
+
+    # ----- Allocation Methods ----- #
+    def _malloc(self, size: int, /) -> int:
+        'Allocate a block without timing.'
+        if size < 0:
+            raise ValueError(f'allocation size must be non-negative, '
+                             f'not {size}.')
+        block = self._allocate(self._block_size(size))
+        if block is None:
+            self.failures += 1
+            return 0
+        address, block_size = block
+        self._blocks[address] = block_size
+        self._requested[address] = size
+        self._grow(size, block_size, address + block_size)
+        return address
+
+    def _grow(self, requested: int, block: int, end: int, /):
+        'Account for bytes added to the live blocks.'
+        self.requested_bytes += requested
+        self.block_bytes += block
+        if self.block_bytes > self.peak_block_bytes:
+            self.peak_block_bytes = self.block_bytes
+        if end - self.base > self.peak_footprint:
+            self.peak_footprint = end - self.base
+
+    def _block(self, address: int, /) -> int:
+        'Return the size of the live block at address.'
+        block = self._blocks.get(address)
+        if block is None:
+            raise ValueError(f'{address:#x} is not the address of a live '
+                             f'heap block.')
+        return block
+
+    def _pop(self, address: int, /) -> int:
+        'Remove the live block at address from the accounts.'
+        block = self._block(address)
+        del self._blocks[address]
+        self.block_bytes -= block
+        self.requested_bytes -= self._requested.pop(address)
+        return block
+
+    def malloc(self, size, /):
+        'Return the address of a new block of size bytes, 0 on failure.'
+        start = perf_counter()
+        address = self._malloc(size)
+        self.mallocs += 1
+        self.seconds += perf_counter() - start
+        return address
+
+    def calloc(self, count, size, /):
+        """
+        Return the address of a new zeroed block of count items of size
+        bytes, 0 on failure.
+        """
+        start = perf_counter()
+        address = self._malloc(count * size)
+        if address:
+            self.space.write(address, bytes(count * size))
+        self.mallocs += 1
+        self.seconds += perf_counter() - start
+        return address
+
+    def realloc(self, address, size, /):
+        """
+        Return the address of the block at address resized to size
+        bytes, keeping its content.  realloc(0, size) is malloc(size)
+        and realloc(address, 0) frees the block and returns 0.  Return
+        0 on failure, leaving the block unchanged.
+        """
+        if not address:
+            return self.malloc(size)
+        if not size:
+            self.free(address)
+            return 0
+        start = perf_counter()
+        self.reallocs += 1
+        block = self._block(address)
+        new_block = self._resize(address, block, self._block_size(size))
+        if new_block is not None:
+            self._pop(address)
+            self._blocks[address] = new_block
+            self._requested[address] = size
+            self._grow(size, new_block, address + new_block)
+        else:
+            new = self._malloc(size)
+            if new:
+                count = min(self._requested[address], size)
+                self.space.write(new, self.space.read(address, count))
+                self._release(address, self._pop(address))
+            address = new
+        self.seconds += perf_counter() - start
+        return address
+
+    def free(self, address, /):
+        'Return the block at address to the heap.  free(0) does nothing.'
+        if not address:
+            return
+        start = perf_counter()
+        self._release(address, self._pop(address))
+        self.frees += 1
+        self.seconds += perf_counter() - start
+
+    def usable_size(self, address, /):
+        'Return the size of the block at address.'
+        return self._block(address)
+
+    def blocks(self, /) -> Iterable[Tuple[int, int, int]]:
+        """
+        Return an iterator of (address, block size, requested size) of
+        the live blocks by address.
+        """
+        for address in sorted(self._blocks):
+            yield address, self._blocks[address], self._requested[address]
+
+    # ----- Trace Methods ----- #
+    def replay(self, trace, /) -> Dict[str, float]:
+        """
+        Run an allocation trace and return stats().
+
+        The trace is an iterable of tuples naming blocks by keys:
+            ('malloc', key, size)
+            ('calloc', key, count, size)
+            ('realloc', key, size)
+            ('free', key)
+        Failed allocations bind their key to 0.
+        """
+        addresses = {}
+        for event in trace:
+            operation, key = event[0], event[1]
+            if operation == 'malloc':
+                addresses[key] = self.malloc(event[2])
+            elif operation == 'calloc':
+                addresses[key] = self.calloc(event[2], event[3])
+            elif operation == 'realloc':
+                address = self.realloc(addresses.get(key, 0), event[2])
+                if address or not event[2]:
+                    addresses[key] = address
+            elif operation == 'free':
+                self.free(addresses.pop(key))
+            else:
+                raise ValueError(f'unknown heap operation {operation!r}.')
+        return self.stats()
+
+    # ----- Statistics Methods ----- #
+    def stats(self, /) -> Dict[str, float]:
+        'Return the operation, footprint and fragmentation counters.'
+        operations = self.mallocs + self.frees + self.reallocs
+        free = self.size - self.block_bytes
+        return {
+            'operations': operations,
+            'mallocs': self.mallocs,
+            'frees': self.frees,
+            'reallocs': self.reallocs,
+            'failures': self.failures,
+            'seconds': self.seconds,
+            'operations_per_second':
+                operations / self.seconds if self.seconds else 0.0,
+            'live_blocks': len(self._blocks),
+            'requested_bytes': self.requested_bytes,
+            'block_bytes': self.block_bytes,
+            'peak_block_bytes': self.peak_block_bytes,
+            'peak_footprint': self.peak_footprint,
+            'internal_fragmentation':
+                1 - self.requested_bytes / self.block_bytes
+                if self.block_bytes else 0.0,
+            'external_fragmentation':
+                1 - self._largest_free() / free if free else 0.0,
+        }
+
+    def reset_stats(self, /):
+        'Set the operation counters and peaks to their current values.'
+        self.mallocs = 0
+        self.frees = 0
+        self.reallocs = 0
+        self.failures = 0
+        self.seconds = 0.0
+        self.peak_block_bytes = self.block_bytes
+        self.peak_footprint = max((address + block - self.base for
+                                   address, block in self._blocks.items()),
+                                  default=0)
+
+    # ----- Mutable Methods ----- #
+    def copy(self, /):
+        """
+        Return a heap with the same blocks on a fork of the address
+        space.
+        """
+        heap = type(self).__new__(type(self))
+        for name, value in vars(self).items():
+            if name != 'space':
+                setattr(heap, name, deepcopy(value))
+        heap.space = self.space.fork()
+        return heap
+
+
+class FirstFitHeap(Heap):
+    """
+    First-fit heap.
+
+    FirstFitHeap(space, base, size, alignment) -> heap taking each block
+                                                  from the lowest free
+                                                  block large enough
+
+    Free blocks are kept by address, split on allocation and coalesced
+    with their free neighbours on release.  Blocks grow in place into
+    a free successor.
+    """
+    name = 'first-fit'
+    _starts: List[int]
+    _free: Dict[int, int]
+
+    def _reset(self, /):
+        'Set up the free blocks of an empty heap.'
+        self._starts = []
+        self._free = {}
+        self._insert(self.base, self.size)
+
+    def _insert(self, address: int, size: int, /):
+        'Add a free block.'
+        insort(self._starts, address)
+        self._free[address] = size
+
+    def _remove(self, address: int, /) -> int:
+        'Remove the free block at address and return its size.'
+        del self._starts[bisect_left(self._starts, address)]
+        return self._free.pop(address)
+
+    def _find(self, size: int, /) -> Optional[int]:
+        'Return the address of the free block serving size bytes.'
+        free = self._free
+        for address in self._starts:
+            if free[address] >= size:
+                return address
+        return None
+
+    def _allocate(self, size, /):
+        'Return the address and size of a free block of size bytes.'
+        address = self._find(size)
+        if address is None:
+            return None
+        rest = self._remove(address) - size
+        if rest >= self.alignment:
+            self._insert(address + size, rest)
+            return address, size
+        return address, size + rest
+
+    def _release(self, address, size, /):
+        'Return a block to the free blocks, coalescing its neighbours.'
+        index = bisect_right(self._starts, address)
+        if index < len(self._starts) and \
+                self._starts[index] == address + size:
+            size += self._remove(address + size)
+        if index:
+            previous = self._starts[index - 1]
+            if previous + self._free[previous] == address:
+                address = previous
+                size += self._remove(previous)
+        self._insert(address, size)
+
+    def _resize(self, address, block, size, /):
+        'Resize a block in place, splitting or taking its successor.'
+        if size <= block:
+            if block - size >= self.alignment:
+                self._release(address + size, block - size)
+                return size
+            return block
+        following = self._free.get(address + block)
+        if following is None or block + following < size:
+            return None
+        self._remove(address + block)
+        rest = block + following - size
+        if rest >= self.alignment:
+            self._insert(address + size, rest)
+            return size
+        return size + rest
+
+    def _largest_free(self, /):
+        'Return the size of the largest free block.'
+        return max(self._free.values(), default=0)
+
+
+class BestFitHeap(FirstFitHeap):
+    """
+    Best-fit heap.
+
+    BestFitHeap(space, base, size, alignment) -> heap taking each block
+                                                 from the smallest free
+                                                 block large enough
+
+    Free blocks are also kept sorted by size, so the best fit is a
+    binary search.  Splitting, coalescing and resizing work as in
+    FirstFitHeap.
+    """
+    name = 'best-fit'
+    _sizes: List[Block]
+
+    def _reset(self, /):
+        'Set up the free blocks of an empty heap.'
+        self._sizes = []
+        super()._reset()
+
+    def _insert(self, address, size, /):
+        'Add a free block.'
+        super()._insert(address, size)
+        insort(self._sizes, (size, address))
+
+    def _remove(self, address, /):
+        'Remove the free block at address and return its size.'
+        size = super()._remove(address)
+        del self._sizes[bisect_left(self._sizes, (size, address))]
+        return size
+
+    def _find(self, size, /):
+        'Return the address of the free block serving size bytes.'
+        index = bisect_left(self._sizes, (size, 0))
+        if index == len(self._sizes):
+            return None
+        return self._sizes[index][1]
+
+    def _largest_free(self, /):
+        'Return the size of the largest free block.'
+        return self._sizes[-1][0] if self._sizes else 0
+
+
+class SegregatedHeap(Heap):
+    """
+    Segregated free-list heap.
+
+    SegregatedHeap(space, base, size, alignment) -> heap keeping a free
+                                                    list per block size
+
+    Requests are rounded to a size class: multiples of the alignment
+    up to 1 KiB, powers of 2 above.  A freed block goes on the list of
+    its class and serves the next request of that class, so malloc and
+    free are a list pop and append.  Empty lists are refilled from the
+    untouched top of the region.  A block freed just below the top is
+    returned to it, together with the free blocks below it.  Once the
+    top is used up, adjacent free blocks are coalesced and a larger
+    free block is split.
+
+    This is the default strategy, the fastest for workloads of many
+    small blocks of a few sizes.
+    """
+    name = 'segregated'
+    _bins: Dict[int, List[int]]
+    _free: Dict[int, int]
+    _ends: Dict[int, int]
+    _top: int
+
+    def _reset(self, /):
+        'Set up the free blocks of an empty heap.'
+        # The lists may hold stale addresses; _free is authoritative.
+        self._bins = {}
+        self._free = {}
+        self._ends = {}
+        self._top = self.base
+
+    def _block_size(self, size, /):
+        'Return the size of the block serving a request of size bytes.'
+        size = super()._block_size(size)
+        if size > SMALL_LIMIT:
+            return 1 << (size - 1).bit_length()
+        return size
+
+    def _insert(self, address: int, size: int, /):
+        'Add a free block to the list of its size.'
+        self._free[address] = size
+        self._ends[address + size] = address
+        self._bins.setdefault(size, []).append(address)
+
+    def _remove(self, address: int, /) -> int:
+        'Remove a free block, leaving its list entry stale.'
+        size = self._free.pop(address)
+        del self._ends[address + size]
+        return size
+
+    def _coalesce(self, /):
+        'Merge adjacent free blocks and return the last ones to the top.'
+        blocks = sorted(self._free.items())
+        self._reset_lists()
+        runs = []
+        for address, size in blocks:
+            if runs and runs[-1][0] + runs[-1][1] == address:
+                runs[-1][1] += size
+            else:
+                runs.append([address, size])
+        for address, size in runs:
+            if address + size == self._top:
+                self._top = address
+            else:
+                self._insert(address, size)
+
+    def _reset_lists(self, /):
+        'Drop every free block.'
+        self._bins.clear()
+        self._free.clear()
+        self._ends.clear()
+
+    def _allocate(self, size, /):
+        'Return the address and size of a free block of size bytes.'
+        free = self._bins.get(size)
+        while free:
+            address = free.pop()
+            if self._free.get(address) == size:
+                self._remove(address)
+                return address, size
+        end = self.base + self.size
+        if self._top + size > end and self._free:
+            self._coalesce()
+        if self._top + size <= end:
+            self._top += size
+            return self._top - size, size
+        fits = [(block, address) for address, block in self._free.items()
+                if block >= size]
+        if not fits:
+            return None
+        block, address = min(fits)
+        self._remove(address)
+        rest = block - size
+        if rest >= self.alignment:
+            self._insert(address + size, rest)
+            return address, size
+        return address, block
+
+    def _release(self, address, size, /):
+        'Return a block to the list of its size or to the top.'
+        if address + size != self._top:
+            self._insert(address, size)
+            return
+        self._top = address
+        while self._top in self._ends:
+            self._top = self._ends[self._top]
+            self._remove(self._top)
+
+    def _resize(self, address, block, size, /):
+        'Resize a block in place, growing it into the top if it ends there.'
+        if size <= block:
+            return block
+        if address + block == self._top and \
+                address + size <= self.base + self.size:
+            self._top = address + size
+            return size
+        return None
+
+    def _largest_free(self, /):
+        'Return the size of the largest free block.'
+        return max(self.base + self.size - self._top,
+                   max(self._free.values(), default=0))
+
+
+class BuddyHeap(Heap):
+    """
+    Binary buddy heap.
+
+    BuddyHeap(space, base, size, alignment) -> heap splitting the largest
+                                               power-of-2 part of the
+                                               region into halves
+
+    Every block is a power of 2 of at least the alignment, placed at a
+    multiple of its size from the base.  A free block is merged with
+    its buddy, the other half of the block it was split from, as long
+    as the buddy is free, so free and malloc take a number of steps
+    logarithmic in the heap size.  Blocks shrink in place by releasing
+    their upper halves.
+    """
+    name = 'buddy'
+    _orders: List[Set[int]]
+
+    def _reset(self, /):
+        'Set up the free blocks of an empty heap.'
+        top = self.size.bit_length() - 1
+        self.size = 1 << top
+        self._orders = [set() for _ in range(top + 1)]
+        self._orders[top].add(0)
+
+    def _block_size(self, size, /):
+        'Return the size of the block serving a request of size bytes.'
+        return 1 << (super()._block_size(size) - 1).bit_length()
+
+    def _allocate(self, size, /):
+        'Return the address and size of a free block of size bytes.'
+        order = size.bit_length() - 1
+        orders = self._orders
+        for level in range(order, len(orders)):
+            if orders[level]:
+                offset = orders[level].pop()
+                while level > order:
+                    level -= 1
+                    orders[level].add(offset + (1 << level))
+                return self.base + offset, size
+        return None
+
+    def _release(self, address, size, /):
+        'Return a block to the free blocks, merging it with its buddies.'
+        offset = address - self.base
+        level = size.bit_length() - 1
+        orders = self._orders
+        while level < len(orders) - 1:
+            buddy = offset ^ 1 << level
+            if buddy not in orders[level]:
+                break
+            orders[level].remove(buddy)
+            offset &= ~(1 << level)
+            level += 1
+        orders[level].add(offset)
+
+    def _resize(self, address, block, size, /):
+        'Shrink a block in place by releasing its upper halves.'
+        if size > block:
+            return None
+        while block > size:
+            block >>= 1
+            self._release(address + block, block)
+        return block
+
+    def _largest_free(self, /):
+        'Return the size of the largest free block.'
+        for level in range(len(self._orders) - 1, -1, -1):
+            if self._orders[level]:
+                return 1 << level
+        return 0
+
+
+def compare_heaps(trace, heaps=None, /) -> Dict[str, Dict[str, float]]:
+    """
+    Replay an allocation trace on each heap and return their stats()
+    by heap name.  The heaps default to one of each strategy on its own
+    address space.
+    """
+    if heaps is None:
+        heaps = [FirstFitHeap(), BestFitHeap(), SegregatedHeap(),
+                 BuddyHeap()]
+    trace = list(trace)
+    return {heap.name: heap.replay(trace) for heap in heaps}
@@ -0,0 +1,454 @@
+import mmap
+import os
+from typing import Dict, List, Set
+
+from obj import Mutable
+from bytes import ByteUnit, Bytes, FrozenBytes
+from data import DATA_TYPES
+from tlb import TLB
+from cache import CacheHierarchy
+
+__all__ = [
+    'AddressSpace',
+]
+
+
+class AddressSpace(Mutable):
+    """
+    Mutable paged virtual address space.
+
+    AddressSpace(bits, page_size, tlb, cache) -> address space of
+        2 ** bits bytes divided in pages of page_size bytes, translated
+        through tlb, with its typed accesses simulated in cache
+    AddressSpace(bits, page_size, tlb) -> address space without a cache
+    AddressSpace(bits, page_size) -> address space without a TLB
+    AddressSpace(bits) -> address space with 4 KiB pages
+    AddressSpace() -> 32-bit address space with 4 KiB pages
+
+    Pages are allocated on the first write that touches them.  Reading
+    an untouched page returns zeros without allocating it, so only the
+    touched part of a large address space is kept in memory.
+
+    fork() returns a copy-on-write snapshot: parent and child share
+    their pages until one of them writes, and only the written page
+    is copied.
+
+    map_file() backs a page-aligned range of the address space with a
+    file through mmap.  Its pages are faulted in from the file on first
+    access, writes go to the mapped buffer and flush() persists the
+    dirty pages.  After a fork, the parent still persists its writes to
+    file-backed pages on flush(), while the writes of the child stay
+    private to it.  Pages the child has not written follow the file.
+
+    When a TLB is given, page-table walks are cached in it and its
+    counters record the translation hits and misses.
+
+    When a cache hierarchy is given, every load() and store() is
+    passed to it, so its counters show the locality of the typed
+    accesses.  Raw read() and write() bypass it.
+    """
+    bits: int
+    size: int
+    page_size: int
+    tlb: TLB
+    cache: CacheHierarchy
+    _page_shift: int
+    _page_mask: int
+    _pages: Dict[int, bytearray]
+    _owned: Set[int]
+    _mappings: List[list]
+    _mapped: Dict[int, list]
+    _dirty: Set[int]
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, bits=32, page_size=4096, tlb=None, cache=None):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if not isinstance(bits, int) or not isinstance(page_size, int):
+            raise TypeError('address width and page size must be integers')
+        if bits <= 0:
+            raise ValueError(f'address width must be positive, not {bits}.')
+        if page_size <= 0 or page_size & (page_size - 1):
+            raise ValueError(f'page size must be a power of 2, '
+                             f'not {page_size}.')
+        if tlb is not None and not isinstance(tlb, TLB):
+            raise TypeError(f'tlb must be a TLB, not {type(tlb).__name__}')
+        if cache is not None and not isinstance(cache, CacheHierarchy):
+            raise TypeError(f'cache must be a cache hierarchy, '
+                            f'not {type(cache).__name__}')
+        self.bits = bits
+        self.size = 2 ** bits
+        self.page_size = page_size
+        self._page_shift = page_size.bit_length() - 1
+        self._page_mask = page_size - 1
+        self.tlb = tlb
+        self.cache = cache
+        self._pages = {}
+        self._owned = set()
+        self._mappings = []
+        self._mapped = {}
+        self._dirty = set()
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return (f'AddressSpace(bits={self.bits}, '
+                f'page_size={self.page_size}, pages={len(self._pages)})')
+
+    def __str__(self, /):
+        'Return str(self).'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return a raw representation of the address space.'
+        return self.__repr__()
+
+    # ----- Page Table Methods ----- #
+    @property
+    def page_count(self, /):
+        'The number of allocated pages.'
+        return len(self._pages)
+
+    @property
+    def resident_size(self, /):
+        'The number of bytes held by allocated pages.'
+        return len(self._pages) * self.page_size
+
+    def is_allocated(self, address, /):
+        'Return whether the page containing address is allocated.'
+        return address >> self._page_shift in self._pages
+
+    def _check_range(self, address: int, size: int, /):
+        'Check that the address range lies in the address space.'
+        if not isinstance(address, int):
+            raise TypeError(f'addresses must be integers, '
+                            f'not {type(address).__name__}')
+        if address < 0 or size < 0 or address + size > self.size:
+            raise IndexError(f'address range {address:#x}+{size} '
+                             f'out of the address space')
+
+    def _read_page(self, number: int, /):
+        'Return the page for reading, or None if it is not allocated.'
+        tlb = self.tlb
+        if tlb is None:
+            return self._walk_read(number)
+        entry = tlb.lookup(number)
+        if entry is not None:
+            return entry[0]
+        page = self._walk_read(number)
+        if page is not None:
+            tlb.insert(number, (page, number in self._owned))
+        return page
+
+    def _write_page(self, number: int, /) -> bytearray:
+        'Return the page for writing, allocating it if needed.'
+        tlb = self.tlb
+        if tlb is None:
+            return self._walk_write(number)
+        entry = tlb.lookup(number)
+        if entry is not None and entry[1]:
+            if number in self._mapped:
+                self._dirty.add(number)
+            return entry[0]
+        page = self._walk_write(number)
+        tlb.insert(number, (page, True))
+        return page
+
+    def _walk_read(self, number: int, /):
+        'Look up page number in the page table for reading.'
+        page = self._pages.get(number)
+        if page is None and self._mappings:
+            page = self._fault(number)
+        return page
+
+    def _walk_write(self, number: int, /) -> bytearray:
+        """
+        Look up page number in the page table for writing.
+
+        The page is allocated if needed, and a page that may be shared
+        with a fork is copied first.
+        """
+        if number in self._owned:
+            if number in self._mapped:
+                self._dirty.add(number)
+            return self._pages[number]
+        page = self._pages.get(number)
+        if page is None and self._mappings:
+            page = self._fault(number)
+            if number in self._owned:
+                self._dirty.add(number)
+                return page
+        if page is None:
+            page = bytearray(self.page_size)
+        else:
+            page = bytearray(page)
+            mapping = self._mapped.get(number)
+            if mapping is not None and mapping[4]:
+                # The copy of a shared file-backed page is flushed back.
+                self._dirty.add(number)
+            else:
+                self._mapped.pop(number, None)
+        self._pages[number] = page
+        self._owned.add(number)
+        return page
+
+    # ----- File Mapping Methods ----- #
+    def map_file(self, file, address=0, writable=True, /):
+        """
+        Back the address space from address on with the content of file.
+
+        The file can be a path or an open binary file, and address must
+        be page-aligned.  Pages in the range are replaced by the file.
+        """
+        if address & self._page_mask:
+            raise ValueError(f'mapping address must be page-aligned, '
+                             f'not {address:#x}.')
+        if isinstance(file, (str, bytes, os.PathLike)):
+            file = own_file = open(file, 'r+b' if writable else 'rb')
+        elif hasattr(file, 'fileno'):
+            own_file = None
+        else:
+            raise TypeError(f'cannot map {type(file).__name__} object '
+                            f'to an address space.')
+        length = os.fstat(file.fileno()).st_size
+        if length == 0:
+            raise ValueError('cannot map an empty file')
+        self._check_range(address, length)
+        mapping = [
+            address >> self._page_shift, length,
+            mmap.mmap(file.fileno(), length, access=mmap.ACCESS_WRITE
+                      if writable else mmap.ACCESS_READ),
+            own_file, writable,
+        ]
+        first = mapping[0]
+        for number in range(first, first + self._page_count(length)):
+            self._pages.pop(number, None)
+            self._owned.discard(number)
+            self._dirty.discard(number)
+        self._mappings.append(mapping)
+        if self.tlb is not None:
+            self.tlb.flush()
+
+    def _page_count(self, length: int, /) -> int:
+        'Return the number of pages needed to hold length bytes.'
+        return (length + self._page_mask) >> self._page_shift
+
+    def _fault(self, number: int, /):
+        'Return the file-backed page number, or None if it is not mapped.'
+        for mapping in self._mappings:
+            first, length, data, _, writable = mapping
+            if first <= number < first + self._page_count(length):
+                break
+        else:
+            return None
+        start = (number - first) << self._page_shift
+        stop = start + self.page_size
+        if stop <= length:
+            page = memoryview(data)[start:stop]
+        else:
+            page = bytearray(self.page_size)
+            page[:length - start] = data[start:length]
+        self._pages[number] = page
+        self._mapped[number] = mapping
+        if writable:
+            self._owned.add(number)
+        return page
+
+    def flush(self, /):
+        'Write the dirty file-backed pages back to their files.'
+        granularity = mmap.ALLOCATIONGRANULARITY
+        for number in sorted(self._dirty):
+            mapping = self._mapped.get(number)
+            if mapping is None:
+                continue
+            first, length, data, _, _ = mapping
+            start = (number - first) << self._page_shift
+            stop = min(start + self.page_size, length)
+            page = self._pages[number]
+            if not isinstance(page, memoryview):
+                data[start:stop] = page[:stop - start]
+            aligned = start - start % granularity
+            data.flush(aligned, stop - aligned)
+        self._dirty.clear()
+
+    def close(self, /):
+        """
+        Flush the dirty pages and unmap every mapped file.
+
+        Forks share the mappings of their parent, so the pages of a
+        closed mapping must no longer be in use by any fork.
+        """
+        self.flush()
+        for number in self._mapped:
+            self._pages.pop(number, None)
+            self._owned.discard(number)
+        self._mapped.clear()
+        if self.tlb is not None:
+            self.tlb.flush()
+        for _, _, data, file, _ in self._mappings:
+            data.close()
+            if file is not None:
+                file.close()
+        self._mappings.clear()
+
+    # ----- Memory Methods ----- #
+    def read(self, address, size, /):
+        'Return a byte group copy of size bytes at address.'
+        self._check_range(address, size)
+        page_size = self.page_size
+        result = bytearray(size)
+        position = 0
+        while position < size:
+            number = (address + position) >> self._page_shift
+            offset = (address + position) & self._page_mask
+            chunk = min(page_size - offset, size - position)
+            page = self._read_page(number)
+            if page is not None:
+                result[position:position + chunk] = \
+                    page[offset:offset + chunk]
+            position += chunk
+        return Bytes._wrap(result)
+
+    def write(self, address, data, /):
+        'Write the content of a byte group or bytes-like object at address.'
+        if isinstance(data, (Bytes, FrozenBytes)):
+            data = data._data
+        elif not isinstance(data, (bytes, bytearray, memoryview)):
+            data = Bytes(data)._data
+        size = len(data)
+        self._check_range(address, size)
+        page_size = self.page_size
+        position = 0
+        while position < size:
+            number = (address + position) >> self._page_shift
+            offset = (address + position) & self._page_mask
+            chunk = min(page_size - offset, size - position)
+            page = self._write_page(number)
+            page[offset:offset + chunk] = data[position:position + chunk]
+            position += chunk
+
+    def load(self, address, data_type, /):
+        'Return a value of data_type read from memory at address.'
+        if data_type not in DATA_TYPES:
+            raise TypeError(f'cannot load {data_type.__name__} '
+                            f'from an address space')
+        size = data_type.size
+        self._check_range(address, size)
+        if self.cache is not None:
+            self.cache.access(address, size, False)
+        offset = address & self._page_mask
+        if offset + size > self.page_size:
+            return data_type(self.read(address, size))
+        page = self._read_page(address >> self._page_shift)
+        if page is None:
+            return data_type._from_raw(0)
+        return data_type._from_raw(
+            int.from_bytes(page[offset:offset + size], 'little'))
+
+    def store(self, address, value, /):
+        'Write the memory of a typed value at address.'
+        if not isinstance(value, DATA_TYPES):
+            raise TypeError(f'cannot store {type(value).__name__} '
+                            f'in an address space')
+        size = value.size
+        self._check_range(address, size)
+        if self.cache is not None:
+            self.cache.access(address, size, True)
+        offset = address & self._page_mask
+        if offset + size > self.page_size:
+            self.write(address, value.value)
+            return
+        page = self._write_page(address >> self._page_shift)
+        page[offset:offset + size] = value._value.to_bytes(size, 'little')
+
+    # ----- Iterable Methods ----- #
+    def __getitem__(self, key, /):
+        'Return self[key].'
+        if isinstance(key, int):
+            self._check_range(key, 1)
+            page = self._read_page(key >> self._page_shift)
+            if page is None:
+                return ByteUnit()
+            return ByteUnit(page[key & self._page_mask])
+        elif isinstance(key, slice):
+            if key.step not in (None, 1):
+                raise ValueError('address space slices must be contiguous')
+            start = 0 if key.start is None else key.start
+            stop = self.size if key.stop is None else key.stop
+            return self.read(start, max(stop - start, 0))
+        else:
+            raise TypeError(f'address space indices must be integers or '
+                            f'slices, not {type(key).__name__}')
+
+    def __setitem__(self, key, value, /):
+        'Set self[key] to value.'
+        if isinstance(key, int):
+            self.write(key, Bytes((value,)))
+        elif isinstance(key, slice):
+            if key.step not in (None, 1):
+                raise ValueError('address space slices must be contiguous')
+            value = Bytes(value)
+            start = 0 if key.start is None else key.start
+            stop = self.size if key.stop is None else key.stop
+            if len(value) != stop - start:
+                raise ValueError('address space memory size is fixed')
+            self.write(start, value)
+        else:
+            raise TypeError(f'address space indices must be integers or '
+                            f'slices, not {type(key).__name__}')
+
+    # ----- Mutable Methods ----- #
+    def clear(self, /):
+        """
+        Release all pages, zeroing the whole address space.
+
+        The dirty file-backed pages are flushed to their files first,
+        and the file mappings are dropped.  Unlike close(), the mapped
+        files stay open for the forks sharing them.
+        """
+        self.flush()
+        self._mappings.clear()
+        self._mapped.clear()
+        self._pages.clear()
+        self._owned.clear()
+        if self.tlb is not None:
+            self.tlb.flush()
+
+    def copy(self, /):
+        'Return a copy of the address space.'
+        for first, length, _, _, _ in self._mappings:
+            for number in range(first, first + self._page_count(length)):
+                if number not in self._pages:
+                    self._fault(number)
+        result = AddressSpace(self.bits, self.page_size,
+                              None if self.tlb is None else self.tlb.copy(),
+                              None if self.cache is None
+                              else self.cache.copy())
+        result._pages = {number: bytearray(page)
+                         for number, page in self._pages.items()}
+        result._owned = set(result._pages)
+        return result
+
+    def fork(self, /):
+        """
+        Return a copy-on-write snapshot of the address space.
+
+        No page is copied here; every page becomes shared, and the first
+        write to a shared page on either side gives that side its own copy.
+        The parent keeps its file mappings: its copies of file-backed
+        pages are written back by flush().  The mappings of the child are
+        private, so its writes never reach the files.
+        """
+        mappings = {id(mapping): mapping[:4] + [False]
+                    for mapping in self._mappings}
+        result = AddressSpace(self.bits, self.page_size,
+                              None if self.tlb is None else self.tlb.copy(),
+                              None if self.cache is None
+                              else self.cache.copy())
+        result._pages = self._pages.copy()
+        result._mappings = list(mappings.values())
+        result._mapped = {number: mappings[id(mapping)]
+                          for number, mapping in self._mapped.items()}
+        self._owned.clear()
+        if self.tlb is not None:
+            self.tlb.flush()
+        return result
@@ -0,0 +1,631 @@
+from typing import Iterable, Iterator, Tuple, Union
+
+from obj import MutableIterable
+from bytes import (
+    ByteUnit, Bytes, FrozenByteUnit, FrozenBytes,
+    _buffer, _bulk_values, _byte_value,
+)
+
+__all__ = [
+    'Rope',
+]
+
+_LEAF_SIZE = 1024
+_REPR_LIMIT = 64
+
+
+class _Node:
+    'Inner node of a rope tree, concatenating two subtrees.'
+    __slots__ = ('left', 'right', 'length', 'height')
+
+    def __init__(self, left, right, /):
+        self.left = left
+        self.right = right
+        self.length = _length(left) + _length(right)
+        self.height = 1 + max(_height(left), _height(right))
+
+
+Tree = Union[_Node, bytes]
+
+
+def _length(tree: Tree, /) -> int:
+    'Return the number of bytes in a tree.'
+    return tree.length if type(tree) is _Node else len(tree)
+
+
+def _height(tree: Tree, /) -> int:
+    'Return the height of a tree, zero for a leaf.'
+    return tree.height if type(tree) is _Node else 0
+
+
+def _build(data, /) -> Tree:
+    'Return a balanced tree holding a copy of a bytes-like object.'
+    view = _buffer(data)
+    leaves = [bytes(view[i:i + _LEAF_SIZE])
+              for i in range(0, len(view), _LEAF_SIZE)]
+
+    def build(start, stop):
+        if stop - start == 1:
+            return leaves[start]
+        middle = (start + stop) // 2
+        return _Node(build(start, middle), build(middle, stop))
+
+    return build(0, len(leaves)) if leaves else b''
+
+
+def _balance(left: Tree, right: Tree, /) -> Tree:
+    'Return a node of two subtrees, rotating if their heights differ by 2.'
+    left_height, right_height = _height(left), _height(right)
+    if left_height > right_height + 1:
+        if _height(left.left) >= _height(left.right):
+            return _Node(left.left, _Node(left.right, right))
+        return _Node(_Node(left.left, left.right.left),
+                     _Node(left.right.right, right))
+    elif right_height > left_height + 1:
+        if _height(right.right) >= _height(right.left):
+            return _Node(_Node(left, right.left), right.right)
+        return _Node(_Node(left, right.left.left),
+                     _Node(right.left.right, right.right))
+    return _Node(left, right)
+
+
+def _join(left: Tree, right: Tree, /) -> Tree:
+    'Return the concatenation of two trees, sharing their nodes.'
+    if not _length(left):
+        return right
+    elif not _length(right):
+        return left
+    left_height, right_height = _height(left), _height(right)
+    if left_height > right_height + 1:
+        return _balance(left.left, _join(left.right, right))
+    elif right_height > left_height + 1:
+        return _balance(_join(left, right.left), right.right)
+    elif not left_height and not right_height and \
+            len(left) + len(right) <= _LEAF_SIZE:
+        return left + right
+    return _Node(left, right)
+
+
+def _split(tree: Tree, index: int, /) -> Tuple[Tree, Tree]:
+    'Return the trees of the bytes before and from index.'
+    if index <= 0:
+        return b'', tree
+    elif index >= _length(tree):
+        return tree, b''
+    elif type(tree) is not _Node:
+        return tree[:index], tree[index:]
+    left_length = _length(tree.left)
+    if index < left_length:
+        left, right = _split(tree.left, index)
+        return left, _join(right, tree.right)
+    elif index > left_length:
+        left, right = _split(tree.right, index - left_length)
+        return _join(tree.left, left), right
+    return tree.left, tree.right
+
+
+def _repeat(tree: Tree, count: int, /) -> Tree:
+    'Return a tree repeating another count times with shared nodes.'
+    result = b''
+    while count > 0:
+        if count & 1:
+            result = _join(result, tree)
+        count >>= 1
+        if count:
+            tree = _join(tree, tree)
+    return result
+
+
+def _item(tree: Tree, index: int, /) -> int:
+    'Return the byte at index of a tree.'
+    while type(tree) is _Node:
+        left_length = _length(tree.left)
+        if index < left_length:
+            tree = tree.left
+        else:
+            index -= left_length
+            tree = tree.right
+    return tree[index]
+
+
+def _replace(tree: Tree, index: int, value: int, /) -> Tree:
+    'Return a copy of a tree with the byte at index replaced.'
+    if type(tree) is not _Node:
+        return tree[:index] + bytes((value,)) + tree[index + 1:]
+    left_length = _length(tree.left)
+    if index < left_length:
+        return _Node(_replace(tree.left, index, value), tree.right)
+    return _Node(tree.left, _replace(tree.right, index - left_length, value))
+
+
+def _patch(tree: Tree, start: int, stop: int, data: bytes, /):
+    """
+    Return a copy of a tree with the bytes in [start, stop) replaced by
+    data when they lie in a single leaf, copying only the path to it.
+    Return None otherwise.
+    """
+    if type(tree) is not _Node:
+        leaf = tree[:start] + data + tree[stop:]
+        if not leaf or len(leaf) > 2 * _LEAF_SIZE:
+            return None
+        elif len(leaf) > _LEAF_SIZE:
+            return _Node(leaf[:len(leaf) // 2], leaf[len(leaf) // 2:])
+        return leaf
+    left_length = _length(tree.left)
+    if stop <= left_length:
+        left = _patch(tree.left, start, stop, data)
+        return None if left is None else _balance(left, tree.right)
+    elif start >= left_length:
+        right = _patch(tree.right, start - left_length,
+                       stop - left_length, data)
+        return None if right is None else _balance(tree.left, right)
+    return None
+
+
+def _chunks(tree: Tree, start: int, stop: int, /) -> Iterator[bytes]:
+    'Generate the leaf contents of a tree within [start, stop), in order.'
+    stack = [(tree, 0)]
+    while stack:
+        tree, offset = stack.pop()
+        length = _length(tree)
+        if offset >= stop or offset + length <= start or not length:
+            continue
+        elif type(tree) is _Node:
+            stack.append((tree.right, offset + _length(tree.left)))
+            stack.append((tree.left, offset))
+        elif start <= offset and offset + length <= stop:
+            yield tree
+        else:
+            yield tree[max(start - offset, 0):stop - offset]
+
+
+def _rchunks(tree: Tree, start: int, stop: int, /) -> Iterator[bytes]:
+    'Generate the leaf contents of a tree within [start, stop), reversed.'
+    stack = [(tree, 0)]
+    while stack:
+        tree, offset = stack.pop()
+        length = _length(tree)
+        if offset >= stop or offset + length <= start or not length:
+            continue
+        elif type(tree) is _Node:
+            stack.append((tree.left, offset))
+            stack.append((tree.right, offset + _length(tree.left)))
+        elif start <= offset and offset + length <= stop:
+            yield tree
+        else:
+            yield tree[max(start - offset, 0):stop - offset]
+
+
+class Rope(MutableIterable):
+    """
+    Mutable byte group stored as a balanced tree of byte chunks.
+
+    Rope(iterable_of_byte_units) -> rope initialized with given
+                                    byte-unit-convertibles
+    Rope(bytes) -> rope holding a copy of a byte group or of a
+                   bytes-like object
+    Rope(rope) -> copy of the rope, sharing its chunks
+    Rope(int) -> rope of size given by the parameter initialized
+                 with empty byte units
+    Rope() -> empty rope
+
+    Construct a rope from:
+        - an iterable of byte units
+        - a byte group, a rope or a bytes-like object
+        - an integer
+
+    Insertion, deletion and splicing anywhere cost O(log n).  The
+    chunks are immutable and shared, so slicing, concatenation and
+    repetition build a few new tree nodes instead of copying bytes.
+    Appended bytes are buffered and added to the tree a chunk at a
+    time.  Indexing returns frozen byte units, not views.
+    """
+    _root: Tree
+    _tail: bytearray
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, value=0):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        self._tail = bytearray()
+        if isinstance(value, Rope):
+            self._root = value._tree()
+        elif isinstance(value, int):
+            if value < 0:
+                raise ValueError('negative count')
+            self._root = _join(_repeat(bytes(_LEAF_SIZE),
+                                       value // _LEAF_SIZE),
+                               bytes(value % _LEAF_SIZE))
+        elif isinstance(value, (Bytes, FrozenBytes, bytes, bytearray,
+                                memoryview)):
+            self._root = _build(value)
+        elif isinstance(value, Iterable):
+            self._root = _build(_bulk_values(value, bytes))
+        else:
+            raise TypeError(f'cannot convert {type(value).__name__} '
+                            f'object to a rope.')
+
+    @classmethod
+    def _from_tree(cls, tree: Tree, /):
+        'Return a rope using tree as its storage.'
+        self = cls.__new__(cls)
+        self._root = tree
+        self._tail = bytearray()
+        return self
+
+    # ----- Storage Methods ----- #
+    def _tree(self, /) -> Tree:
+        'Return the tree of the rope, adding the buffered appends first.'
+        if self._tail:
+            self._root = _join(self._root, bytes(self._tail))
+            self._tail = bytearray()
+        return self._root
+
+    def chunks(self, start=0, stop=None, /) -> Iterator[bytes]:
+        'Return an iterator over the chunks holding self[start:stop].'
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return _chunks(self._tree(), start, stop)
+
+    @property
+    def height(self, /) -> int:
+        'The height of the chunk tree.'
+        return _height(self._tree())
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self), truncated for large ropes.'
+        head = b''.join(self.chunks(0, _REPR_LIMIT)).decode('latin-1')
+        if len(self) <= _REPR_LIMIT:
+            return f'Rope({head!r})'
+        return f'Rope({head!r}..., {len(self)} bytes)'
+
+    def __str__(self, /):
+        'Return str(self), truncated for large ropes.'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return a raw representation of the rope.'
+        return self.to_bytes().decode('latin-1')
+
+    def to_mem(self, /):
+        'Return a hexadecimal representation of the rope memory.'
+        return self.to_bytes().hex(' ')
+
+    # ----- Comparison Methods ----- #
+    @staticmethod
+    def _other_bytes(other, /):
+        'Return the bytes of a byte group or rope, or None.'
+        if isinstance(other, Rope):
+            return other.to_bytes()
+        elif isinstance(other, (Bytes, FrozenBytes)):
+            return bytes(other._data)
+        return None
+
+    def __lt__(self, other, /):
+        'Return self<other.'
+        other = self._other_bytes(other)
+        return NotImplemented if other is None else self.to_bytes() < other
+
+    def __le__(self, other, /):
+        'Return self<=other.'
+        other = self._other_bytes(other)
+        return NotImplemented if other is None else self.to_bytes() <= other
+
+    def __eq__(self, other, /):
+        'Return self==other.'
+        if isinstance(other, (Rope, Bytes, FrozenBytes)) and \
+                len(self) != len(other):
+            return False
+        other = self._other_bytes(other)
+        return NotImplemented if other is None else self.to_bytes() == other
+
+    def __ne__(self, other, /):
+        'Return self!=other.'
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __gt__(self, other, /):
+        'Return self>other.'
+        other = self._other_bytes(other)
+        return NotImplemented if other is None else self.to_bytes() > other
+
+    def __ge__(self, other, /):
+        'Return self>=other.'
+        other = self._other_bytes(other)
+        return NotImplemented if other is None else self.to_bytes() >= other
+
+    # ----- Transformation Methods ----- #
+    def __hash__(self, /):
+        'Return hash(self).'
+        raise TypeError("unhashable type: 'Rope'")
+
+    def __bool__(self, /):
+        'Return bool(self).'
+        return len(self) != 0
+
+    def to_bytes(self, /):
+        'Return a python bytes copy of the rope.'
+        return b''.join(_chunks(self._tree(), 0, len(self)))
+
+    # ----- Iterable Methods ----- #
+    def __len__(self, /):
+        'Return len(self).'
+        return _length(self._root) + len(self._tail)
+
+    def _normalize_index(self, key: int, /) -> int:
+        'Return the non-negative position of index key.'
+        length = len(self)
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError('rope index out of range')
+        return key
+
+    def __getitem__(self, key, /):
+        'Return self[key].'
+        if isinstance(key, int):
+            return FrozenByteUnit(_item(self._tree(),
+                                        self._normalize_index(key)))
+        elif isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return Rope(self.to_bytes()[key])
+            _, right = _split(self._tree(), start)
+            return Rope._from_tree(_split(right, max(stop - start, 0))[0])
+        else:
+            raise TypeError(f'rope indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __setitem__(self, key, value, /):
+        'Set self[key] to value.'
+        if isinstance(key, int):
+            self._root = _replace(self._tree(), self._normalize_index(key),
+                                  _byte_value(value))
+        elif isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                self.splice(start, stop, value)
+                return
+            value = Rope(value).to_bytes()
+            indices = range(start, stop, step)
+            if len(value) != len(indices):
+                raise ValueError(f'attempt to assign bytes of size '
+                                 f'{len(value)} to extended slice of size '
+                                 f'{len(indices)}')
+            for index, item in zip(indices, value):
+                self._root = _replace(self._tree(), index, item)
+        else:
+            raise TypeError(f'rope indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __delitem__(self, key, /):
+        'Delete self[key].'
+        if isinstance(key, int):
+            key = self._normalize_index(key)
+            self.splice(key, key + 1, b'')
+        elif isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                self.splice(start, stop, b'')
+                return
+            for index in sorted(range(start, stop, step), reverse=True):
+                self.splice(index, index + 1, b'')
+        else:
+            raise TypeError(f'rope indices must be integers or slices, '
+                            f'not {type(key).__name__}')
+
+    def __iter__(self, /):
+        'Implement iter(self).'
+        for chunk in self.chunks():
+            yield from map(FrozenByteUnit, chunk)
+
+    def __reversed__(self, /):
+        'Return a reverse iterator over the object.'
+        for chunk in _rchunks(self._tree(), 0, len(self)):
+            yield from map(FrozenByteUnit, reversed(chunk))
+
+    def __contains__(self, item, /):
+        'Return item in self.'
+        if isinstance(item, (ByteUnit, FrozenByteUnit, int)):
+            return self.count(item) != 0
+        elif isinstance(item, (Rope, Bytes, FrozenBytes, bytes, bytearray)):
+            return self.find(item) != -1
+        else:
+            return NotImplemented
+
+    def clear(self, /):
+        'Remove all items from mutable.'
+        self._root = b''
+        self._tail = bytearray()
+
+    def count(self, value, /):
+        'Return number of occurrences of value.'
+        if isinstance(value, (ByteUnit, FrozenByteUnit)):
+            value = value.to_int()
+        elif not isinstance(value, int) or not 0 <= value <= 255:
+            return 0
+        return sum(chunk.count(value) for chunk in self.chunks())
+
+    def index(self, value, start=0, stop=9223372036854775807, /):
+        """
+        Return first index of value.
+
+        Raises ValueError if the value is not present.
+        """
+        if isinstance(value, (ByteUnit, FrozenByteUnit)) or \
+                isinstance(value, int) and 0 <= value <= 255:
+            index = self.find(value, start, stop)
+            if index != -1:
+                return index
+        raise ValueError(f'{value!r} is not in rope')
+
+    # ----- Search Methods ----- #
+    @staticmethod
+    def _search_key(sub, /) -> bytes:
+        'Return sub as the bytes to search for.'
+        if isinstance(sub, Rope):
+            return sub.to_bytes()
+        elif isinstance(sub, (Bytes, FrozenBytes)):
+            return bytes(sub._data)
+        elif isinstance(sub, (ByteUnit, FrozenByteUnit, int)):
+            return bytes((_byte_value(sub),))
+        elif isinstance(sub, (bytes, bytearray)):
+            return bytes(sub)
+        else:
+            raise TypeError(f'cannot search for {type(sub).__name__} '
+                            f'in a rope')
+
+    def find(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return the lowest index where subsection sub is found,
+        such that sub is contained within self[start:stop].
+
+        Return -1 on failure.
+        """
+        return next(self.finditer(sub, start, stop), -1)
+
+    def rfind(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return the highest index where subsection sub is found,
+        such that sub is contained within self[start:stop].
+
+        Return -1 on failure.
+        """
+        key = self._search_key(sub)
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if not key:
+            return stop if start <= stop else -1
+        buffer = b''
+        begin = stop
+        for chunk in _rchunks(self._tree(), start, stop):
+            begin -= len(chunk)
+            buffer = chunk + buffer
+            index = buffer.rfind(key)
+            if index != -1:
+                return begin + index
+            buffer = buffer[:len(key) - 1]
+        return -1
+
+    def finditer(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return an iterator over the indices of the non-overlapping
+        occurrences of subsection sub in self[start:stop].
+        """
+        key = self._search_key(sub)
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if not key:
+            return iter(range(start, stop + 1))
+        return self._finditer(key, start, stop)
+
+    def _finditer(self, key: bytes, start: int, stop: int, /):
+        'Generate the indices of key, carrying matches across chunks.'
+        buffer = b''
+        begin = start
+        for chunk in _chunks(self._tree(), start, stop):
+            buffer += chunk
+            resume = 0
+            index = buffer.find(key)
+            while index != -1:
+                yield begin + index
+                resume = index + len(key)
+                index = buffer.find(key, resume)
+            keep = max(resume, len(buffer) - len(key) + 1)
+            begin += keep
+            buffer = buffer[keep:]
+
+    def count_subsequence(self, sub, start=0, stop=9223372036854775807, /):
+        """
+        Return the number of non-overlapping occurrences of
+        subsection sub in self[start:stop].
+        """
+        return sum(1 for _ in self.finditer(sub, start, stop))
+
+    # ----- Calculation Methods ----- #
+    def __add__(self, other, /):
+        'Return self+other, sharing the chunks of both.'
+        if isinstance(other, (Rope, Bytes, FrozenBytes, bytes, bytearray)):
+            return Rope._from_tree(_join(self._tree(), Rope(other)._tree()))
+        else:
+            raise TypeError(f"can't concat {type(other).__name__}"
+                            f" to rope")
+
+    def __radd__(self, other, /):
+        'Return other+self, sharing the chunks of both.'
+        if isinstance(other, (Bytes, FrozenBytes, bytes, bytearray)):
+            return Rope._from_tree(_join(Rope(other)._tree(), self._tree()))
+        else:
+            return NotImplemented
+
+    def __iadd__(self, other, /):
+        'Implement self+=other.'
+        self.extend(other)
+        return self
+
+    def __mul__(self, other, /):
+        'Return self*other, sharing the chunks of self.'
+        if isinstance(other, int):
+            return Rope._from_tree(_repeat(self._tree(), other))
+        else:
+            raise TypeError(f"can't multiply sequence by non-int of "
+                            f"type '{type(other).__name__}'")
+
+    def __rmul__(self, other, /):
+        'Return other*self, sharing the chunks of self.'
+        return self.__mul__(other)
+
+    def __imul__(self, other, /):
+        'Implement self*=other.'
+        if isinstance(other, int):
+            self._root = _repeat(self._tree(), other)
+            return self
+        else:
+            raise TypeError(f"can't multiply sequence by non-int of "
+                            f"type '{type(other).__name__}'")
+
+    # ----- Mutational Methods ----- #
+    def append(self, value, /):
+        'Append a byte unit to the end of the rope.'
+        self._tail.append(_byte_value(value))
+        if len(self._tail) >= _LEAF_SIZE:
+            self._tree()
+
+    def extend(self, iterable, /):
+        'Extend the rope by appending the byte units of an iterable.'
+        if isinstance(iterable, Rope):
+            self._root = _join(self._tree(), iterable._tree())
+            return
+        elif isinstance(iterable, (Bytes, FrozenBytes)):
+            data = iterable._data
+        elif isinstance(iterable, (bytes, bytearray, memoryview)):
+            data = iterable
+        else:
+            data = _bulk_values(iterable, bytes)
+        if len(self._tail) + len(data) < _LEAF_SIZE:
+            self._tail += data
+        else:
+            self._root = _join(self._tree(), _build(data))
+
+    def insert(self, index, value, /):
+        'Insert a byte unit before index.'
+        length = len(self)
+        if index < 0:
+            index = max(index + length, 0)
+        self.splice(min(index, length), min(index, length),
+                    bytes((_byte_value(value),)))
+
+    def splice(self, start, stop, value, /):
+        'Replace self[start:stop] with a byte group, rope or bytes.'
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+        tree = self._tree()
+        value = Rope(value)._tree()
+        if type(value) is not _Node:
+            patched = _patch(tree, start, stop, value)
+            if patched is not None:
+                self._root = patched
+                return
+        left, right = _split(tree, start)
+        self._root = _join(_join(left, value), _split(right, stop - start)[1])
+
+    def copy(self, /):
+        'Return a copy of the rope, sharing its chunks.'
+        return Rope._from_tree(self._tree())
@@ -0,0 +1,648 @@
+import re
+import struct
+from abc import ABC, abstractmethod
+from itertools import groupby
+from typing import Dict, List, Tuple
+
+from obj import Object, Mutable
+from bytes import Bytes, FrozenBytes, _buffer
+from data import DATA_TYPES, FixedWidthInteger, FloatingPoint
+
+__all__ = [
+    'Field',
+    'Layout',
+    'StructLayout',
+    'UnionLayout',
+    'Record',
+]
+
+_RAW_CODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+_PATH = re.compile(r'[A-Za-z_]\w*(?:\[\d+\]|\.[A-Za-z_]\w*)*')
+_PATH_PARTS = re.compile(r'([A-Za-z_]\w*)|\[(\d+)\]')
+
+
+def _check_alignment(alignment, /):
+    'Return an optional alignment, checking it is a power of 2.'
+    if alignment is not None and (not isinstance(alignment, int) or
+                                  alignment <= 0 or
+                                  alignment & (alignment - 1)):
+        raise ValueError(f'alignment must be a power of 2, not {alignment}.')
+    return alignment
+
+
+def _value_code(data_type, /) -> str:
+    'Return the struct format code of the python value of a data type.'
+    if issubclass(data_type, FixedWidthInteger):
+        code = _RAW_CODES[data_type.size]
+        return code.lower() if data_type.signed else code
+    return data_type._typecode or f'{data_type.size}s'
+
+
+def _native(value, /):
+    'Return a python number for a data type object, or value itself.'
+    if isinstance(value, FixedWidthInteger):
+        return value.to_int()
+    elif isinstance(value, FloatingPoint):
+        return value.to_float()
+    return value
+
+
+def _storage(buffer, /):
+    'Return the python buffer behind a byte group, or buffer itself.'
+    if isinstance(buffer, (Bytes, FrozenBytes)):
+        return buffer._data
+    return buffer
+
+
+def _scalar_accessors(data_type, offset, /):
+    """
+    Return the get(buffer, base=0) and set(buffer, value, base=0)
+    functions of a data type stored at offset from base in a buffer.
+    """
+    size = data_type.size
+    from_raw = data_type._from_raw
+    if issubclass(data_type, FixedWidthInteger):
+        def to_raw(value):
+            return data_type.wrap(value)._value
+    else:
+        def to_raw(value):
+            return data_type(value)._value
+
+    if size in _RAW_CODES:
+        packer = struct.Struct('<' + _RAW_CODES[size])
+        unpack_from, pack_into = packer.unpack_from, packer.pack_into
+
+        def get(buffer, base=0, /):
+            return from_raw(unpack_from(buffer, base + offset)[0])
+
+        def set(buffer, value, base=0, /):
+            pack_into(buffer, base + offset, to_raw(value))
+    else:
+        def get(buffer, base=0, /):
+            start = base + offset
+            return from_raw(int.from_bytes(buffer[start:start + size],
+                                           'little'))
+
+        def set(buffer, value, base=0, /):
+            start = base + offset
+            buffer[start:start + size] = to_raw(value).to_bytes(size,
+                                                                'little')
+    return get, set
+
+
+class Field(Object):
+    """
+    Member of a structure or union layout.
+
+    Field(name, data_type, count, align) -> member of a data type or a
+                                            layout, an array of count
+                                            elements when count is given,
+                                            aligned to at least align
+                                            bytes (like alignas)
+    Field(name, data_type, count) -> member with natural alignment
+    Field(name, data_type) -> scalar or nested member
+
+    Layouts place copies of their fields: offset, size and alignment
+    are set on the placed copies and None on the original.
+    """
+    name: str
+    data_type: type
+    count: int
+    align: int
+    offset: int
+    size: int
+    alignment: int
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, name, data_type, count=None, align=None):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if not isinstance(name, str) or not name.isidentifier():
+            raise ValueError(f'field name must be an identifier, '
+                             f'not {name!r}.')
+        if not isinstance(data_type, Layout) and data_type not in DATA_TYPES:
+            raise TypeError(f'cannot lay out {data_type!r} as a field.')
+        if count is not None and (not isinstance(count, int) or count <= 0):
+            raise ValueError(f'array length must be a positive integer, '
+                             f'not {count!r}.')
+        self.name = name
+        self.data_type = data_type
+        self.count = count
+        self.align = _check_alignment(align)
+        self.offset = None
+        self.size = None
+        self.alignment = None
+
+    def _placed(self, offset, alignment, /):
+        'Return a copy of the field placed at offset.'
+        field = Field(self.name, self.data_type, self.count, self.align)
+        field.offset = offset
+        field.size = self.data_type.size * (self.count or 1)
+        field.alignment = alignment
+        return field
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        arguments = [repr(self.name), self._type_name()]
+        if self.count is not None:
+            arguments.append(str(self.count))
+        if self.align is not None:
+            arguments.append(f'align={self.align}')
+        return f'Field({", ".join(arguments)})'
+
+    def __str__(self, /):
+        'Return str(self).'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return the type of the field, with its length for arrays.'
+        if self.count is None:
+            return self._type_name()
+        return f'{self._type_name()}[{self.count}]'
+
+    def _type_name(self, /) -> str:
+        'Return the name of the type of the field.'
+        if isinstance(self.data_type, Layout):
+            return self.data_type.name
+        return self.data_type.__name__
+
+
+class Layout(Object, ABC):
+    """
+    Compiled memory layout of a C structure or union.
+    Abstract base of StructLayout and UnionLayout.
+
+    Layout(name, fields, pack, align) -> layout of fields capping their
+                                         alignment to pack bytes (like
+                                         #pragma pack, 1 for packed)
+                                         and aligned to at least align
+                                         bytes (like alignas)
+    Layout(name, fields) -> layout with natural alignment
+
+    Fields are Field objects or (name, data_type[, count[, align]])
+    tuples; data types come from DATA_TYPES and are aligned to their
+    size, as on x86-64.  A field can also be another layout.
+
+    Offsets are computed once, when the layout is created, and compiled
+    into struct formats and accessor functions:
+        - record(buffer, offset) returns a record whose members read
+          and write the buffer at fixed offsets
+        - accessor(path) returns the get and set functions of a member
+        - unpack_from, iter_unpack, pack and pack_into convert whole
+          records to and from tuples of python values in one call
+    """
+    kind: str = 'layout'
+    name: str
+    fields: Tuple[Field, ...]
+    offsets: Dict[str, int]
+    size: int
+    alignment: int
+    packing: int
+    align: int
+    record_type: type
+    _members: Dict[str, Field]
+    _leaves: List[tuple]
+    _segments: List[tuple]
+    _wide: List[tuple]
+    _accessors: Dict[str, tuple]
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, name, fields, pack=None, align=None):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        self.name = name
+        self.packing = _check_alignment(pack)
+        self.align = _check_alignment(align)
+        fields = [field if isinstance(field, Field) else Field(*field)
+                  for field in fields]
+        names = set()
+        for field in fields:
+            if field.name in names:
+                raise ValueError(f'duplicate field name {field.name!r} '
+                                 f'in {self.name}.')
+            names.add(field.name)
+        self.fields = tuple(self._place(fields))
+        self._members = {field.name: field for field in self.fields}
+        self.offsets = {field.name: field.offset for field in self.fields}
+        self._leaves = list(self._flatten(0, ''))
+        self._compile()
+        self._accessors = {}
+        self.record_type = self._record_type()
+
+    def _field_alignment(self, field: Field, /) -> int:
+        'Return the alignment of a field in the layout.'
+        if isinstance(field.data_type, Layout):
+            alignment = field.data_type.alignment
+        else:
+            alignment = field.data_type.size
+        if self.packing is not None:
+            alignment = min(alignment, self.packing)
+        if field.align is not None:
+            alignment = max(alignment, field.align)
+        return alignment
+
+    def _finish(self, size, alignment, /):
+        'Set the alignment and the padded size of the layout.'
+        if self.align is not None:
+            alignment = max(alignment, self.align)
+        self.alignment = alignment
+        self.size = size + -size % alignment
+
+    @abstractmethod
+    def _place(self, fields: List[Field], /) -> List[Field]:
+        'Return the fields placed at their offsets.'
+
+    def _flatten(self, base, prefix, /):
+        'Yield the path, data type and offset of every scalar member.'
+        for field in self.fields:
+            path = prefix + field.name
+            for index in range(field.count or 1):
+                offset = base + field.offset + index * field.data_type.size
+                if field.count is not None:
+                    element = f'{path}[{index}]'
+                else:
+                    element = path
+                if isinstance(field.data_type, Layout):
+                    yield from field.data_type._flatten(offset,
+                                                        element + '.')
+                else:
+                    yield element, field.data_type, offset
+
+    def _compile(self, /):
+        """
+        Compile the scalar members into struct formats.  Members are
+        grouped in segments of increasing offsets; a structure has a
+        single segment, a union one per overlapping member.
+        """
+        groups = []
+        position = None
+        for path, data_type, offset in self._leaves:
+            if position is None or offset < position:
+                groups.append((offset, []))
+                position = offset
+            codes = groups[-1][1]
+            codes.extend('x' * (offset - position))
+            codes.append(_value_code(data_type))
+            position = offset + data_type.size
+        if groups:
+            groups[-1][1].extend('x' * (self.size - position))
+        self._segments = []
+        for start, codes in groups:
+            format = []
+            for code, run in groupby(codes):
+                length = len([*run])
+                if len(code) > 1:
+                    format.append(code * length)
+                elif length > 1:
+                    format.append(f'{length}{code}')
+                else:
+                    format.append(code)
+            packer = struct.Struct('<' + ''.join(format))
+            count = sum(code != 'x' for code in codes)
+            self._segments.append((start, packer, count))
+        self._wide = [(index, data_type) for index, (_, data_type, _)
+                      in enumerate(self._leaves)
+                      if _value_code(data_type).endswith('s')]
+
+    def _record_type(self, /) -> type:
+        'Return the record class of the layout.'
+        namespace = {
+            '__doc__': f'Record of the {self.kind} {self.name}.',
+            'layout': self,
+        }
+        for field in self.fields:
+            namespace[field.name] = _member(field)
+        return type(self.name, (Record,), namespace)
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return (f'{type(self).__name__}({self.name!r}, size={self.size}, '
+                f'alignment={self.alignment})')
+
+    def __str__(self, /):
+        'Return str(self).'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return a table of the offset, size and type of every field.'
+        lines = [f'{self.kind} {self.name}: size {self.size}, '
+                 f'alignment {self.alignment}']
+        for field in self.fields:
+            lines.append(f'  {field.offset:>6}  {field.size:>6}  '
+                         f'{field.name}: {field.to_str()}')
+        return '\n'.join(lines)
+
+    # ----- Member Methods ----- #
+    def _resolve(self, path, /) -> Tuple[object, int, int]:
+        'Return the type, array length and offset of the member at path.'
+        if not isinstance(path, str) or not _PATH.fullmatch(path):
+            raise ValueError(f'invalid member path {path!r}.')
+        data_type, count, offset = self, None, 0
+        for name, index in _PATH_PARTS.findall(path):
+            if name:
+                if count is not None or not isinstance(data_type, Layout) \
+                        or name not in data_type._members:
+                    raise ValueError(f'{self.name} has no member {path!r}.')
+                field = data_type._members[name]
+                data_type, count = field.data_type, field.count
+                offset += field.offset
+            else:
+                if count is None:
+                    raise ValueError(f'{self.name} has no member {path!r}.')
+                if int(index) >= count:
+                    raise IndexError(f'array index out of range in {path!r}')
+                offset += int(index) * data_type.size
+                count = None
+        return data_type, count, offset
+
+    def offsetof(self, path, /):
+        "Return the offset of the member at path, like 'points[2].x'."
+        return self._resolve(path)[2]
+
+    def accessor(self, path, /):
+        """
+        Return the compiled get(buffer, offset=0) and
+        set(buffer, value, offset=0) functions of the scalar member at
+        path in the record at offset of a python buffer (a bytearray,
+        a memoryview or an mmap).  get returns a data type object; set
+        takes one or a python number, and wraps integers like C.
+        """
+        try:
+            return self._accessors[path]
+        except KeyError:
+            pass
+        data_type, count, offset = self._resolve(path)
+        if isinstance(data_type, Layout) or count is not None:
+            raise ValueError(f'{path!r} is not a scalar member '
+                             f'of {self.name}.')
+        accessors = self._accessors[path] = _scalar_accessors(data_type,
+                                                              offset)
+        return accessors
+
+    # ----- Record Methods ----- #
+    def record(self, buffer=None, offset=0, /):
+        """
+        Return the record at offset of a byte group or a buffer, or a
+        record with its own zeroed storage.
+        """
+        return self.record_type(buffer, offset)
+
+    def unpack_from(self, buffer, offset=0, /) -> tuple:
+        """
+        Return the python values of the scalar members of the record at
+        offset, in declaration order with arrays and nested layouts
+        flattened.  Numbers wider than a double are returned as data
+        type objects.
+        """
+        buffer = _storage(buffer)
+        if len(self._segments) == 1 and not self._wide:
+            start, packer, _ = self._segments[0]
+            return packer.unpack_from(buffer, offset + start)
+        values = []
+        for start, packer, _ in self._segments:
+            values.extend(packer.unpack_from(buffer, offset + start))
+        for index, data_type in self._wide:
+            values[index] = data_type._from_raw(
+                int.from_bytes(values[index], 'little'))
+        return tuple(values)
+
+    def iter_unpack(self, buffer, /):
+        """
+        Return an iterator of the values of every record of a buffer
+        holding an array of records, as unpack_from.
+        """
+        buffer = _storage(buffer)
+        if not self.size or len(buffer) % self.size:
+            raise ValueError(f'{self.name} takes {self.size} bytes, '
+                             f'{len(buffer)} is not a multiple of it.')
+        if len(self._segments) == 1 and not self._wide and \
+                self._segments[0][0] == 0:
+            return self._segments[0][1].iter_unpack(buffer)
+        return (self.unpack_from(buffer, offset)
+                for offset in range(0, len(buffer), self.size))
+
+    def pack_into(self, buffer, offset, /, *values):
+        """
+        Write a record at offset of a buffer from the values of its
+        scalar members, as returned by unpack_from.  Members of a union
+        are written in order, so the last one wins.
+        """
+        if len(values) != len(self._leaves):
+            raise ValueError(f'{self.name} takes {len(self._leaves)} '
+                             f'values, not {len(values)}.')
+        converted = [value if type(value) in (int, float) else _native(value)
+                     for value in values]
+        for index, data_type in self._wide:
+            converted[index] = data_type(values[index])._value.to_bytes(
+                data_type.size, 'little')
+        buffer = _storage(buffer)
+        position = 0
+        try:
+            for start, packer, count in self._segments:
+                packer.pack_into(buffer, offset + start,
+                                 *converted[position:position + count])
+                position += count
+        except (struct.error, OverflowError) as error:
+            for (path, data_type, _), value in zip(self._leaves, converted):
+                try:
+                    struct.pack('<' + _value_code(data_type), value)
+                except (struct.error, OverflowError) as field_error:
+                    raise ValueError(f'cannot pack {self.name}.{path}: '
+                                     f'{field_error}.') from None
+            raise ValueError(f'cannot pack {self.name}: {error}.') from None
+
+    def pack(self, /, *values):
+        'Return a byte group holding a record of the values, as pack_into.'
+        data = bytearray(self.size)
+        self.pack_into(data, 0, *values)
+        return Bytes._wrap(data)
+
+
+class StructLayout(Layout):
+    """
+    Compiled memory layout of a C structure.
+
+    StructLayout(name, fields, pack, align) -> structure of fields with
+                                               alignment capped to pack
+                                               and raised to align
+    StructLayout(name, fields) -> structure with natural alignment
+
+    Each field is placed at the next offset that is a multiple of its
+    alignment, and the size is padded to a multiple of the alignment of
+    the structure, the largest alignment of its fields.  See Layout.
+    """
+    kind = 'struct'
+
+    def _place(self, fields, /):
+        'Return the fields placed one after the other.'
+        placed = []
+        offset = 0
+        alignment = 1
+        for field in fields:
+            field_alignment = self._field_alignment(field)
+            offset += -offset % field_alignment
+            placed.append(field._placed(offset, field_alignment))
+            offset += placed[-1].size
+            alignment = max(alignment, field_alignment)
+        self._finish(offset, alignment)
+        return placed
+
+
+class UnionLayout(Layout):
+    """
+    Compiled memory layout of a C union.
+
+    UnionLayout(name, fields, pack, align) -> union of fields with
+                                              alignment capped to pack
+                                              and raised to align
+    UnionLayout(name, fields) -> union with natural alignment
+
+    Every field is placed at offset 0, and the size is the largest
+    field size padded to the alignment of the union.  See Layout.
+    """
+    kind = 'union'
+
+    def _place(self, fields, /):
+        'Return the fields placed at offset 0.'
+        placed = []
+        size = 0
+        alignment = 1
+        for field in fields:
+            field_alignment = self._field_alignment(field)
+            placed.append(field._placed(0, field_alignment))
+            size = max(size, placed[-1].size)
+            alignment = max(alignment, field_alignment)
+        self._finish(size, alignment)
+        return placed
+
+
+def _member(field: Field, /) -> property:
+    'Return the property giving access to a field of records.'
+    data_type, offset, count = field.data_type, field.offset, field.count
+    if isinstance(data_type, Layout):
+        size = data_type.size
+
+        def get(buffer, base=0, /):
+            return data_type.record_type._wrap(buffer, base + offset)
+
+        def set(buffer, value, base=0, /):
+            if isinstance(value, Record):
+                if value.layout is not data_type:
+                    raise TypeError(f'cannot assign {value.layout.name} '
+                                    f'to {data_type.name}.')
+                value = value._buffer[value._offset:value._offset + size]
+            else:
+                value = _buffer(value)
+            if len(value) != size:
+                raise ValueError(f'{data_type.name} takes {size} bytes, '
+                                 f'not {len(value)}.')
+            start = base + offset
+            buffer[start:start + size] = value
+    else:
+        get, set = _scalar_accessors(data_type, offset)
+
+    if count is None:
+        def getter(self, /):
+            return get(self._buffer, self._offset)
+
+        def setter(self, value, /):
+            set(self._buffer, value, self._offset)
+    else:
+        step = data_type.size
+
+        def getter(self, /):
+            return tuple(get(self._buffer, self._offset + index * step)
+                         for index in range(count))
+
+        def setter(self, values, /):
+            if len(values) != count:
+                raise ValueError(f'{field.name} takes {count} elements, '
+                                 f'not {len(values)}.')
+            for index, value in enumerate(values):
+                set(self._buffer, value, self._offset + index * step)
+
+    return property(getter, setter, doc=f'{field.to_str()} member at '
+                                        f'offset {offset}.')
+
+
+class Record(Mutable):
+    """
+    Mutable record of a structure or union in a buffer.
+    Base of the record classes created by layouts.
+
+    Record(buffer, offset) -> record at offset of a byte group or a
+                              buffer, sharing its storage
+    Record() -> record with its own zeroed storage
+
+    Every field of the layout is a property reading and writing the
+    buffer at a fixed offset: scalars give data type objects, nested
+    layouts give records sharing the storage, and arrays give tuples.
+    """
+    layout: Layout = None
+    _buffer: bytearray
+    _offset: int
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, buffer=None, offset=0):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if buffer is None:
+            buffer = bytearray(self.layout.size)
+        buffer = _storage(buffer)
+        if not 0 <= offset <= len(buffer) - self.layout.size:
+            raise ValueError(f'{self.layout.name} at offset {offset} does '
+                             f'not fit in a buffer of {len(buffer)} bytes.')
+        self._buffer = buffer
+        self._offset = offset
+
+    @classmethod
+    def _wrap(cls, buffer, offset, /):
+        'Return a record at offset of a python buffer without checks.'
+        self = cls.__new__(cls)
+        self._buffer = buffer
+        self._offset = offset
+        return self
+
+    # ----- Informal Methods ----- #
+    def to_str(self, /):
+        'Return the fields of the record.'
+        return ', '.join(f'{field.name}={getattr(self, field.name)!r}'
+                         for field in self.layout.fields)
+
+    def to_mem(self, /):
+        'Return a hexadecimal representation of the record memory.'
+        return self.to_bytes().hex(' ')
+
+    # ----- Comparison Methods ----- #
+    def __eq__(self, other, /):
+        'Return self==other.'
+        if isinstance(other, Record):
+            return (self.layout is other.layout and
+                    self.to_bytes() == other.to_bytes())
+        else:
+            return NotImplemented
+
+    def __ne__(self, other, /):
+        'Return self!=other.'
+        if isinstance(other, Record):
+            return not self.__eq__(other)
+        else:
+            return NotImplemented
+
+    # ----- Transformation Methods ----- #
+    def __hash__(self, /):
+        'Return hash(self).'
+        raise TypeError(f"unhashable type: '{type(self).__name__}'")
+
+    def to_bytes(self, /):
+        'Return a copy of the record memory as bytes.'
+        return bytes(self._buffer[self._offset:
+                                  self._offset + self.layout.size])
+
+    def unpack(self, /) -> tuple:
+        'Return the python values of the scalar members, as unpack_from.'
+        return self.layout.unpack_from(self._buffer, self._offset)
+
+    # ----- Mutable Methods ----- #
+    def copy(self, /):
+        'Return a record with its own copy of the memory.'
+        return type(self)._wrap(bytearray(self.to_bytes()), 0)
@@ -36,6 +36,39 @@ print(f'{(c in d) = }')
 print(f'{(Bytes((72, 117, 110, 116)) in d) = }')
 print(f"{c.count(ByteUnit(80)) = }")
 print(f'{d.count(101) = }')
+print()
+
+print(f'{d.find(c) = }')
+print(f'{[*d.finditer(101)] = }')
+print()
+
+g = FrozenBytes(c)
+print(f'{g = }')
+print(f'{(g == c) = }')
+print(f'{({g: 1}[FrozenBytes(c)]) = }')
+print()
+
+print(f'{bytes(d.to_memoryview()[5:]) = }')
+print(f'{Bytes.frombuffer(b"Peter Hunt", 6, 4) = }')
+h = Bytes(6)
+h.fill(0x2a, 1, 5)
+print(f'{h.to_bytes() = }')
+print(*d.hexdump(width=8), sep='\n')
+print()
+
+v = d.view(5)
+v[0] = 104
+print(f'{v = }')
+print(f'{d = }')
+print(f'{v[1:3] = }')
+v.release()
+print()
+
+k = Bytes((0xf0, 0x0f))
+print(f'{(k ^ Bytes((0xff, 0xff))).to_mem() = }')
+print(f'{(k << 4).to_mem() = }')
+print(f'{k.rotate_right(4).to_mem() = }')
+print(f'{k.popcount() = }')
 print('\n')
 
 # character
@@ -57,3 +90,164 @@ print(f'{f.to_int() = }')
 print()
 
 print(f'{e + f = }')
+print('\n')
+
+# integers
+h = Integer(2 ** 31 - 1)
+print(f'{h = }')
+print(f'{h + 1 = }')
+print(f'{h.to_mem() = }')
+print(f'{Short(-7) / 2 = }')
+print(f'{UnsignedShort(1) - 2 = }')
+print('\n')
+
+# typed arrays (optional numpy)
+try:
+    import numpy
+except ImportError:
+    print('typed arrays need numpy')
+else:
+    i = CharArray([1, -5, 127])
+    print(f'{i = }')
+    print(f'{i + 1 = }')
+    print(f'{IntegerArray([1, 2, 3]) + numpy.int32(2) = }')
+    print(f'{i < 200 = }')
+    i[0:2] = 7
+    print(f'{i.to_mem() = }')
+print('\n')
+
+# address space
+m = AddressSpace(64)
+m.store(0x7fff0000, Char(80))
+m.write(0x7fff0001, c)
+print(f'{m = }')
+print(f'{m.load(0x7fff0000, Char) = }')
+print(f'{m.read(0x7fff0000, 8).to_mem() = }')
+print(f'{m.load(0x1000, UnsignedChar) = }')
+print(f'{m.page_count = }')
+
+n = m.fork()
+n.store(0x7fff0000, Char(72))
+print(f'{m.load(0x7fff0000, Char) = }')
+print(f'{n.load(0x7fff0000, Char) = }')
+print()
+
+m.map_file('test/data.c', 0x40000000, False)
+print(f'{m.read(0x40000000, 18).to_bytes() = }')
+m.close()
+print()
+
+o = AddressSpace(tlb=TLB(16, 4))
+for address in (0x1000, 0x1004, 0x2000, 0x1008):
+    o.store(address, Integer(address))
+print(f'{o.load(0x2000, Integer) = }')
+print(f'{o.tlb = }')
+print(f'{o.tlb.stats() = }')
+print('\n')
+
+# alu
+print(f'{alu.add(0x7f, 1) = }')
+print(f'{alu.sub(0, 1) = }')
+print(f'{alu.cmp(Char(3), Char(3)) = }')
+print('\n')
+
+# gates
+with gate_level(CarryLookaheadAdder()) as adder:
+    print(f'{Integer(100000) + Integer(23456) = }')
+    print(f'{adder.last_gates = }, {adder.last_depth = }')
+    print(f'{UnsignedChar(3) - UnsignedChar(5) = }')
+print(f'{adder.stats() = }')
+print('\n')
+
+# floats
+g = Float(0.1)
+print(f'{g = }')
+print(f'{g.to_mem() = }')
+print(f'{Float(1e39, "zero") = }')
+print(f'{Float(1e-45).is_subnormal() = }')
+print(f'{g + Double(0.2) = }')
+print(f'{LongDouble(1) / 3 = }')
+print(f'{Double.nan(0x1234).payload = }')
+print(f'{Float.unpack_many(Float.pack_many([1.5, -2.0])) = }')
+print('\n')
+
+# rope
+r = Rope(b'PeterHunt')
+r.insert(5, 32)
+print(f'{r = }')
+print(f'{r * 3 = }')
+del r[0:6]
+print(f'{r.to_bytes() = }')
+print(f'{(Rope(b"ab") * 10 ** 12).height = }')
+print('\n')
+
+# bit arrays
+t = BitArray(Bytes(4))
+t.fill(1, 3, 13)
+t.set_range(20, 24, 0b1010)
+print(f'{t = }')
+print(f'{t.find_first_clear(3) = }')
+print(f'{t.popcount() = }')
+print(f'{[(b, i, j) for b, i, j in t.runs(0, 16)] = }')
+print('\n')
+
+# structs
+sample = StructLayout('sample', [('a', Char), ('b', UnsignedChar),
+                                 ('n', Integer), ('x', Double, 2)])
+print(sample.to_str())
+u = sample.record()
+u.a = -65453
+u.b = 80
+u.x = (0.5, 1.5)
+print(f'{u = }')
+print(f'{sample.offsetof("x[1]") = }')
+print(f'{sample.unpack_from(u.to_bytes()) = }')
+print(f'{StructLayout("packed", sample.fields, pack=1).size = }')
+print('\n')
+
+# virtual machine
+w = VirtualMachine()
+print(f'{w.run(open("test/data.c").read()) = }')
+z = assemble('''
+main:
+    push Integer 6
+    push Integer 7
+    mul
+    dup
+    print "6 * 7 = %d\\n" 1
+    ret
+''')
+print(f'{w.run(z) = }')
+print(f'{w.stats()["instructions"] = }')
+y = compile_c('int main() { int s = 0; '
+              'for (int i = 0; i < 1000; i++) s += i; return s; }')
+print(f'{benchmark(y, 1)["instructions"] = }')
+print('\n')
+
+# heap
+q = SegregatedHeap(m)
+o = q.malloc(100)
+p = q.calloc(4, 8)
+q.space.write(o, b'PeterHunt')
+o = q.realloc(o, 2000)
+print(f'{q = }')
+print(f'{q.space.read(o, 9).to_bytes() = }')
+print(f'{q.usable_size(p) = }')
+q.free(o)
+print(f'{q.stats()["internal_fragmentation"] = }')
+trace = [('malloc', 0, 40), ('malloc', 1, 300), ('free', 0)]
+print(f'{BuddyHeap().replay(trace)["block_bytes"] = }')
+print('\n')
+
+# cache
+x = CacheHierarchy([CacheLevel(1024, 64, 4, 'plru'),
+                    CacheLevel(8192, 64, 8, write_policy='write-through',
+                               latency=12)])
+s = AddressSpace(cache=x)
+for i in range(512):
+    s.store(0x1000 + 4 * i, Integer(i))
+for i in range(512):
+    s.load(0x1000 + 4 * i, Integer)
+print(x.to_str())
+print(f'{x.stats()["cycles_per_access"] = }')
+print(f'{x.stats()["L1"]["hit_rate"] = }')
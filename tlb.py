@@ -0,0 +1,141 @@
+from collections import OrderedDict
+from random import Random
+from typing import Dict, List
+
+from obj import Mutable
+
+__all__ = [
+    'TLB',
+]
+
+REPLACEMENT_POLICIES = ('lru', 'random')
+
+
+class TLB(Mutable):
+    """
+    Mutable translation lookaside buffer.
+
+    TLB(entries, ways, policy, seed) -> set-associative buffer of
+                                        entries translations with ways
+                                        entries per set, evicting with
+                                        policy ('lru' or 'random')
+    TLB(entries) -> fully associative LRU buffer
+    TLB() -> 64-entry fully associative LRU buffer
+
+    Caches page-table translations from page numbers to pages and
+    counts hits, misses, evictions, invalidations and flushes.
+    """
+    entries: int
+    ways: int
+    policy: str
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    flushes: int
+    seed: object
+    _sets: List[OrderedDict]
+    _random: Random
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, entries=64, ways=None, policy='lru', seed=None):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        if ways is None:
+            ways = entries
+        if entries <= 0 or ways <= 0 or entries % ways:
+            raise ValueError(f'entries must be a positive multiple of ways, '
+                             f'not {entries} and {ways}.')
+        if policy not in REPLACEMENT_POLICIES:
+            raise ValueError(f'replacement policy must be one of '
+                             f'{REPLACEMENT_POLICIES}, not {policy!r}.')
+        self.entries = entries
+        self.ways = ways
+        self.policy = policy
+        self.seed = seed
+        self._sets = [OrderedDict() for i in range(entries // ways)]
+        self._random = Random(seed)
+        self.reset_stats()
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return (f'TLB(entries={self.entries}, ways={self.ways}, '
+                f'policy={self.policy!r})')
+
+    def __str__(self, /):
+        'Return str(self).'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return a raw representation of the buffer.'
+        return self.__repr__()
+
+    # ----- Translation Methods ----- #
+    def lookup(self, number, /):
+        'Return the cached translation of page number, or None on a miss.'
+        entries = self._sets[number % len(self._sets)]
+        entry = entries.get(number)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.policy == 'lru':
+            entries.move_to_end(number)
+        return entry
+
+    def insert(self, number, entry, /):
+        'Cache the translation of page number, evicting if the set is full.'
+        entries = self._sets[number % len(self._sets)]
+        if number in entries:
+            entries.move_to_end(number)
+        elif len(entries) >= self.ways:
+            if self.policy == 'lru':
+                entries.popitem(last=False)
+            else:
+                del entries[self._random.choice([*entries])]
+            self.evictions += 1
+        entries[number] = entry
+
+    def invalidate(self, number, /):
+        'Drop the translation of page number.  Return whether it was cached.'
+        entries = self._sets[number % len(self._sets)]
+        if entries.pop(number, None) is None:
+            return False
+        self.invalidations += 1
+        return True
+
+    def flush(self, /):
+        'Drop every cached translation.'
+        for entries in self._sets:
+            entries.clear()
+        self.flushes += 1
+
+    # ----- Statistics Methods ----- #
+    def __len__(self, /):
+        'Return the number of cached translations.'
+        return sum(len(entries) for entries in self._sets)
+
+    def stats(self, /) -> Dict[str, float]:
+        'Return the hit, miss and eviction counters as a dictionary.'
+        accesses = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'flushes': self.flushes,
+            'hit_rate': self.hits / accesses if accesses else 0.0,
+        }
+
+    def reset_stats(self, /):
+        'Set every counter to zero.'
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.flushes = 0
+
+    # ----- Mutable Methods ----- #
+    def copy(self, /):
+        'Return an empty buffer with the same configuration and seed.'
+        return TLB(self.entries, self.ways, self.policy, self.seed)
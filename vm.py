@@ -0,0 +1,1318 @@
+import codecs
+import io
+import operator
+import re
+import sys
+from bisect import bisect_right
+from time import perf_counter
+from typing import Dict, Tuple
+
+from obj import Immutable, Mutable
+from data import (
+    DATA_TYPES, FixedWidthInteger,
+    Char, UnsignedChar,
+    Short, UnsignedShort,
+    Integer, UnsignedInteger,
+    Long, UnsignedLong,
+    LongLong, UnsignedLongLong,
+    Float, Double, LongDouble,
+)
+from memory import AddressSpace
+
+__all__ = [
+    'Program',
+    'VirtualMachine',
+    'assemble',
+    'compile_c',
+    'benchmark',
+]
+
+STACK_TOP = 0x7fff0000
+DATA_ADDRESS = 0x10000
+
+# Operand kinds of every instruction: a data type, a python number, a
+# python integer, a label or a string.
+OPERANDS = {
+    'push': ('type', 'number'),
+    'load': ('type', 'int'),
+    'store': ('type', 'int'),
+    'loadg': ('type', 'int'),
+    'storeg': ('type', 'int'),
+    'cast': ('type',),
+    'add': (), 'sub': (), 'mul': (), 'div': (), 'mod': (),
+    'and': (), 'or': (), 'xor': (), 'shl': (), 'shr': (),
+    'eq': (), 'ne': (), 'lt': (), 'le': (), 'gt': (), 'ge': (),
+    'neg': (), 'inv': (), 'not': (),
+    'dup': (), 'pop': (),
+    'jmp': ('label',), 'jz': ('label',), 'jnz': ('label',),
+    'call': ('label',), 'enter': ('int',), 'ret': (),
+    'print': ('string', 'int'),
+    'halt': (),
+}
+
+_TYPES = {data_type.__name__: data_type for data_type in DATA_TYPES}
+_BINARY = {
+    'add': operator.add, 'sub': operator.sub, 'mul': operator.mul,
+    'div': operator.truediv, 'mod': operator.mod,
+    'and': operator.and_, 'or': operator.or_, 'xor': operator.xor,
+    'shl': operator.lshift, 'shr': operator.rshift,
+}
+_COMPARISONS = {
+    'eq': operator.eq, 'ne': operator.ne, 'lt': operator.lt,
+    'le': operator.le, 'gt': operator.gt, 'ge': operator.ge,
+}
+_UNARY = {'neg': operator.neg, 'inv': operator.invert}
+_TRUE = Integer(1)
+_FALSE = Integer(0)
+_CONVERSION = re.compile(r'%([-+ #0]*)(\d*)(?:\.(\d+))?(hh|h|ll|l|L|j|z|t)?'
+                         r'([diouxXeEfFgGc%])')
+_LENGTH_MASKS = {'hh': 0xFF, 'h': 0xFFFF, None: 0xFFFFFFFF}
+
+
+def _constant(data_type, value, /):
+    'Return a python number converted to a data type.'
+    if issubclass(data_type, FixedWidthInteger):
+        return data_type.wrap(int(value))
+    return data_type(value)
+
+
+def _converter(data_type, /):
+    'Return the function converting a typed value to data_type as C.'
+    if issubclass(data_type, FixedWidthInteger):
+        wrap = data_type.wrap
+
+        def convert(value):
+            if isinstance(value, FixedWidthInteger):
+                return wrap(value)
+            return wrap(int(value))
+    else:
+        def convert(value):
+            return data_type(value)
+    return convert
+
+
+def _printf_format(text, /):
+    """
+    Return a python format string and the argument converters of a
+    printf format string.
+    """
+    template = []
+    converters = []
+    position = 0
+    for match in _CONVERSION.finditer(text):
+        template.append(text[position:match.start()])
+        position = match.end()
+        flags, width, precision, length, conversion = match.groups()
+        if conversion == '%':
+            template.append('%%')
+            continue
+        spec = f'%{flags}{width}' + (f'.{precision}' if precision else '')
+        if conversion in 'di':
+            template.append(spec + 'd')
+            converters.append(int)
+        elif conversion in 'ouxX':
+            mask = _LENGTH_MASKS.get(length, 0xFFFFFFFFFFFFFFFF)
+            template.append(spec + ('d' if conversion == 'u'
+                                    else conversion))
+            converters.append(lambda value, mask=mask: int(value) & mask)
+        elif conversion == 'c':
+            template.append(spec + 'c')
+            converters.append(lambda value: int(value) & 0xFF)
+        else:
+            template.append(spec + conversion)
+            converters.append(float)
+    template.append(text[position:].replace('%', '%%'))
+    return ''.join(template), converters
+
+
+def _quote(text, /) -> str:
+    'Return a string literal of text for assembly listings.'
+    escaped = text.encode('unicode_escape').decode('ascii')
+    return '"' + escaped.replace('"', '\\"') + '"'
+
+
+def _unquote(literal, /) -> str:
+    'Return the text of a C or assembly string or character literal.'
+    return codecs.decode(literal[1:-1].encode('latin-1', 'backslashreplace'),
+                         'unicode_escape')
+
+
+class Program(Immutable):
+    """
+    Immutable program of the virtual machine.
+
+    Program(instructions, entry) -> program of instruction tuples and
+                                    ('label', name) markers, started
+                                    at the label entry
+    Program(instructions) -> program started at 'main'
+
+    Instructions are tuples of an opcode and its operands (see
+    OPERANDS), with jump and call targets given as label names.
+    Programs are built by assemble() and compile_c(); to_str() returns
+    an assembly listing that assemble() reads back.
+    """
+    instructions: Tuple[tuple, ...]
+    labels: Dict[str, int]
+    entry: str
+
+    __slots__ = ('instructions', 'labels', 'entry')
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, instructions, entry='main'):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        code = []
+        labels = {}
+        for instruction in instructions:
+            if instruction[0] == 'label':
+                if instruction[1] in labels:
+                    raise ValueError(f'duplicate label {instruction[1]!r}.')
+                labels[instruction[1]] = len(code)
+                continue
+            kinds = OPERANDS.get(instruction[0])
+            if kinds is None:
+                raise ValueError(f'unknown instruction {instruction[0]!r}.')
+            if len(instruction) != len(kinds) + 1:
+                raise ValueError(f'{instruction[0]} takes {len(kinds)} '
+                                 f'operands, not {len(instruction) - 1}.')
+            code.append(tuple(instruction))
+        for instruction in code:
+            for kind, operand in zip(OPERANDS[instruction[0]],
+                                     instruction[1:]):
+                if kind == 'label' and operand not in labels:
+                    raise ValueError(f'undefined label {operand!r}.')
+                elif kind == 'type' and operand not in DATA_TYPES:
+                    raise TypeError(f'{instruction[0]} takes a data type, '
+                                    f'not {operand!r}.')
+        if entry not in labels:
+            raise ValueError(f'undefined entry label {entry!r}.')
+        super(Immutable, self).__setattr__('instructions', tuple(code))
+        super(Immutable, self).__setattr__('labels', labels)
+        super(Immutable, self).__setattr__('entry', entry)
+
+    # ----- Informal Methods ----- #
+    def __repr__(self, /):
+        'Return repr(self).'
+        return (f'Program({len(self.instructions)} instructions, '
+                f'entry={self.entry!r})')
+
+    def __str__(self, /):
+        'Return str(self).'
+        return self.__repr__()
+
+    def to_str(self, /):
+        'Return the assembly listing of the program.'
+        names = {}
+        for name, index in self.labels.items():
+            names.setdefault(index, []).append(name)
+        lines = [f'.entry {self.entry}']
+        for index in range(len(self.instructions) + 1):
+            lines.extend(f'{name}:' for name in names.get(index, ()))
+            if index == len(self.instructions):
+                break
+            opcode, *operands = self.instructions[index]
+            words = [opcode]
+            for kind, operand in zip(OPERANDS[opcode], operands):
+                if kind == 'type':
+                    words.append(operand.__name__)
+                elif kind == 'string':
+                    words.append(_quote(operand))
+                else:
+                    words.append(str(operand))
+            lines.append('    ' + ' '.join(words))
+        return '\n'.join(lines) + '\n'
+
+    # ----- Iterable Methods ----- #
+    def __len__(self, /):
+        'Return len(self).'
+        return len(self.instructions)
+
+
+_ASSEMBLY_WORD = re.compile(r'"(?:\\.|[^"\\])*"|[^\s"]+')
+
+
+def assemble(source, /) -> Program:
+    """
+    Return the program of an assembly source.
+
+    Each line holds a label followed by a colon, an instruction with
+    its operands separated by spaces, or the directive '.entry label'.
+    Comments start with ';'.  Data types are written by class name and
+    strings in double quotes with C escapes.
+    """
+    instructions = []
+    entry = 'main'
+    for number, line in enumerate(source.splitlines(), 1):
+        words = _ASSEMBLY_WORD.findall(line)
+        for index, word in enumerate(words):
+            if word.startswith(';'):
+                del words[index:]
+                break
+        if not words:
+            continue
+        try:
+            if len(words) == 1 and words[0].endswith(':'):
+                instructions.append(('label', words[0][:-1]))
+                continue
+            opcode, *operands = words
+            if opcode == '.entry':
+                entry, = operands
+                continue
+            kinds = OPERANDS.get(opcode)
+            if kinds is None:
+                raise ValueError(f'unknown instruction {opcode!r}')
+            if len(operands) != len(kinds):
+                raise ValueError(f'{opcode} takes {len(kinds)} operands')
+            instruction = [opcode]
+            for kind, word in zip(kinds, operands):
+                if kind == 'type':
+                    if word not in _TYPES:
+                        raise ValueError(f'unknown data type {word!r}')
+                    instruction.append(_TYPES[word])
+                elif kind == 'number':
+                    number_type = instruction[-1]
+                    instruction.append(
+                        int(word, 0) if issubclass(number_type,
+                                                   FixedWidthInteger)
+                        else float(word))
+                elif kind == 'int':
+                    instruction.append(int(word, 0))
+                elif kind == 'string':
+                    if not word.startswith('"'):
+                        raise ValueError(f'expected a string, not {word!r}')
+                    instruction.append(_unquote(word))
+                else:
+                    instruction.append(word)
+            instructions.append(tuple(instruction))
+        except ValueError as error:
+            raise SyntaxError(f'line {number}: {error}') from None
+    return Program(instructions, entry)
+
+
+class VirtualMachine(Mutable):
+    """
+    Mutable stack machine running programs on an address space.
+
+    VirtualMachine(space, output, stack_top, stack_size) -> machine
+        using space for its memory, writing printed text to output,
+        with a call stack of stack_size bytes growing down from
+        stack_top
+    VirtualMachine(space, output) -> machine with a 1 MiB stack
+                                     below 0x7fff0000
+    VirtualMachine() -> machine on a new 32-bit address space
+                        printing to sys.stdout
+
+    The operand stack holds data type objects, and arithmetic uses
+    their C semantics.  load and store access the frame of the current
+    function at fp + offset in the address space, loadg and storeg
+    absolute addresses.
+
+    Before running, every instruction is decoded once into a closure
+    bound to its operands, the machine state and its successor, so
+    the dispatch loop only calls the closure of the current
+    instruction.  run() records the instruction count and the time,
+    exported by stats().
+    """
+    space: AddressSpace
+    output: object
+    stack_top: int
+    stack_size: int
+    steps: int
+    elapsed: float
+
+    # ----- Initialization Methods ----- #
+    def __init__(self, space=None, output=None, stack_top=STACK_TOP,
+                 stack_size=1 << 20):
+        'Initialize self.  See help(type(self)) for accurate signature.'
+        self.space = AddressSpace() if space is None else space
+        self.output = output
+        self.stack_top = stack_top
+        self.stack_size = stack_size
+        self.steps = 0
+        self.elapsed = 0.0
+
+    # ----- Informal Methods ----- #
+    def to_str(self, /):
+        'Return a raw representation of the machine.'
+        return f'{self.space!r}, stack_top={self.stack_top:#x}'
+
+    # ----- Decoding Methods ----- #
+    def _decode(self, program: Program, /) -> Tuple[list, list]:
+        'Return the closures of the instructions and the operand stack.'
+        load_value = self.space.load
+        store_value = self.space.store
+        write = (sys.stdout if self.output is None else self.output).write
+        labels = program.labels
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        fp = self.stack_top
+        limit = self.stack_top - self.stack_size
+        frames = [(-1, fp)]
+
+        def push_(next_pc, data_type, value):
+            value = _constant(data_type, value)
+
+            def step():
+                push(value)
+                return next_pc
+            return step
+
+        def load(next_pc, data_type, offset):
+            def step():
+                push(load_value(fp + offset, data_type))
+                return next_pc
+            return step
+
+        def store(next_pc, data_type, offset):
+            convert = _converter(data_type)
+
+            def step():
+                value = pop()
+                if value.__class__ is not data_type:
+                    value = convert(value)
+                store_value(fp + offset, value)
+                return next_pc
+            return step
+
+        def loadg(next_pc, data_type, address):
+            def step():
+                push(load_value(address, data_type))
+                return next_pc
+            return step
+
+        def storeg(next_pc, data_type, address):
+            convert = _converter(data_type)
+
+            def step():
+                value = pop()
+                if value.__class__ is not data_type:
+                    value = convert(value)
+                store_value(address, value)
+                return next_pc
+            return step
+
+        def cast(next_pc, data_type):
+            convert = _converter(data_type)
+
+            def step():
+                stack[-1] = convert(stack[-1])
+                return next_pc
+            return step
+
+        def binary(next_pc, operation):
+            def step():
+                value = pop()
+                stack[-1] = operation(stack[-1], value)
+                return next_pc
+            return step
+
+        def comparison(next_pc, operation):
+            def step():
+                value = pop()
+                stack[-1] = _TRUE if operation(stack[-1], value) else _FALSE
+                return next_pc
+            return step
+
+        def unary(next_pc, operation):
+            def step():
+                stack[-1] = operation(stack[-1])
+                return next_pc
+            return step
+
+        def not_(next_pc):
+            def step():
+                stack[-1] = _FALSE if stack[-1] else _TRUE
+                return next_pc
+            return step
+
+        def dup(next_pc):
+            def step():
+                push(stack[-1])
+                return next_pc
+            return step
+
+        def pop_(next_pc):
+            def step():
+                pop()
+                return next_pc
+            return step
+
+        def jmp(next_pc, label):
+            target = labels[label]
+
+            def step():
+                return target
+            return step
+
+        def jz(next_pc, label):
+            target = labels[label]
+
+            def step():
+                return next_pc if pop() else target
+            return step
+
+        def jnz(next_pc, label):
+            target = labels[label]
+
+            def step():
+                return target if pop() else next_pc
+            return step
+
+        def call(next_pc, label):
+            target = labels[label]
+
+            def step():
+                frames.append((next_pc, fp))
+                return target
+            return step
+
+        def enter(next_pc, size):
+            def step():
+                nonlocal fp
+                fp -= size
+                if fp < limit:
+                    raise MemoryError('virtual machine stack overflow')
+                return next_pc
+            return step
+
+        def ret(next_pc):
+            def step():
+                nonlocal fp
+                pc, fp = frames.pop()
+                return pc
+            return step
+
+        def print_(next_pc, text, count):
+            template, converters = _printf_format(text)
+            if len(converters) != count:
+                raise ValueError(f'{text!r} takes {len(converters)} '
+                                 f'arguments, not {count}.')
+
+            def step():
+                values = stack[len(stack) - count:]
+                del stack[len(stack) - count:]
+                write(template % tuple(convert(value) for convert, value
+                                       in zip(converters, values)))
+                return next_pc
+            return step
+
+        def halt(next_pc):
+            def step():
+                return -1
+            return step
+
+        decoders = {
+            'push': push_, 'load': load, 'store': store,
+            'loadg': loadg, 'storeg': storeg, 'cast': cast,
+            'not': not_, 'dup': dup, 'pop': pop_,
+            'jmp': jmp, 'jz': jz, 'jnz': jnz,
+            'call': call, 'enter': enter, 'ret': ret,
+            'print': print_, 'halt': halt,
+        }
+        code = []
+        for index, (opcode, *operands) in enumerate(program.instructions):
+            if opcode in _BINARY:
+                code.append(binary(index + 1, _BINARY[opcode]))
+            elif opcode in _COMPARISONS:
+                code.append(comparison(index + 1, _COMPARISONS[opcode]))
+            elif opcode in _UNARY:
+                code.append(unary(index + 1, _UNARY[opcode]))
+            else:
+                code.append(decoders[opcode](index + 1, *operands))
+        code.append(halt(-1))
+        return code, stack
+
+    # ----- Execution Methods ----- #
+    def run(self, program, /):
+        """
+        Run a program, or the source of a C program, from its entry
+        label until it returns or halts.  Return the python integer of
+        the value left on the operand stack, 0 if there is none.
+        """
+        if isinstance(program, str):
+            program = compile_c(program)
+        code, stack = self._decode(program)
+        pc = program.labels[program.entry]
+        steps = 0
+        start = perf_counter()
+        try:
+            while pc >= 0:
+                pc = code[pc]()
+                steps += 1
+        finally:
+            self.elapsed = perf_counter() - start
+            self.steps = steps
+        return int(stack[-1]) if stack else 0
+
+    # ----- Statistics Methods ----- #
+    def stats(self, /) -> Dict[str, float]:
+        'Return the instruction count and speed of the last run.'
+        return {
+            'instructions': self.steps,
+            'seconds': self.elapsed,
+            'instructions_per_second':
+                self.steps / self.elapsed if self.elapsed else 0.0,
+        }
+
+    # ----- Mutable Methods ----- #
+    def copy(self, /):
+        'Return a machine on a fork of the address space.'
+        return VirtualMachine(self.space.fork(), self.output,
+                              self.stack_top, self.stack_size)
+
+
+def benchmark(program, runs=3, /) -> Dict[str, float]:
+    """
+    Run a program, or the source of a C program, runs times on fresh
+    machines with the printed text discarded.  Return the statistics
+    of the fastest run.
+    """
+    if isinstance(program, str):
+        program = compile_c(program)
+    best = None
+    for _ in range(runs):
+        machine = VirtualMachine(output=io.StringIO())
+        machine.run(program)
+        stats = machine.stats()
+        if best is None or stats['seconds'] < best['seconds']:
+            best = stats
+    return best
+
+
+# ----- C Compiler ----- #
+_TOKEN = re.compile(r'''
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/|\#[^\n]*)
+  | (?P<float>(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?[fFlL]?
+             |\d+[eE][-+]?\d+[fFlL]?)
+  | (?P<int>0[xX][0-9a-fA-F]+[uUlL]*|\d+[uUlL]*)
+  | (?P<char>'(?:\\.|[^\\'\n])+')
+  | (?P<string>"(?:\\.|[^\\"\n])*")
+  | (?P<name>[A-Za-z_]\w*)
+  | (?P<op><<=|>>=|\+\+|--|&&|\|\||->|[-+*/%&|^!=<>]=|<<|>>
+          |[-+*/%&|^!~<>=?:;,(){}\[\]])
+''', re.X | re.S)
+
+_TYPE_WORDS = {'void', 'char', 'short', 'int', 'long', 'float', 'double',
+               'signed', 'unsigned'}
+_QUALIFIERS = {'const', 'volatile', 'register', 'auto'}
+_TYPE_NAMES = {
+    ('void',): None,
+    ('char',): Char, ('char', 'unsigned'): UnsignedChar,
+    ('short',): Short, ('short', 'unsigned'): UnsignedShort,
+    ('int',): Integer, ('signed',): Integer, ('unsigned',): UnsignedInteger,
+    ('long',): Long, ('long', 'unsigned'): UnsignedLong,
+    ('long', 'long'): LongLong, ('long', 'long', 'unsigned'): UnsignedLongLong,
+    ('float',): Float, ('double',): Double, ('double', 'long'): LongDouble,
+}
+_RANKS = {
+    Char: 1, UnsignedChar: 1, Short: 2, UnsignedShort: 2,
+    Integer: 3, UnsignedInteger: 3, Long: 4, UnsignedLong: 4,
+    LongLong: 5, UnsignedLongLong: 5,
+}
+_UNSIGNED = {
+    Char: UnsignedChar, Short: UnsignedShort, Integer: UnsignedInteger,
+    Long: UnsignedLong, LongLong: UnsignedLongLong,
+}
+_FLOAT_RANKS = {Float: 1, Double: 2, LongDouble: 3}
+_PRECEDENCE = {
+    '||': 1, '&&': 2, '|': 3, '^': 4, '&': 5, '==': 6, '!=': 6,
+    '<': 7, '>': 7, '<=': 7, '>=': 7, '<<': 8, '>>': 8,
+    '+': 9, '-': 9, '*': 10, '/': 10, '%': 10,
+}
+_OPCODES = {
+    '+': 'add', '-': 'sub', '*': 'mul', '/': 'div', '%': 'mod',
+    '&': 'and', '|': 'or', '^': 'xor', '<<': 'shl', '>>': 'shr',
+    '==': 'eq', '!=': 'ne', '<': 'lt', '<=': 'le', '>': 'gt', '>=': 'ge',
+}
+_ASSIGNMENTS = {'=', '+=', '-=', '*=', '/=', '%=', '&=', '|=', '^=',
+                '<<=', '>>='}
+
+
+def _is_float(data_type, /) -> bool:
+    'Return whether a data type is a floating-point type.'
+    return data_type in _FLOAT_RANKS
+
+
+def _promote(data_type, /):
+    'Return the type of a value after the C integer promotions.'
+    if data_type in _RANKS and _RANKS[data_type] < 3:
+        return Integer
+    return data_type
+
+
+def _common_type(a, b, /):
+    'Return the type of the C usual arithmetic conversions of a and b.'
+    if _is_float(a) or _is_float(b):
+        return max((t for t in (a, b) if _is_float(t)),
+                   key=_FLOAT_RANKS.__getitem__)
+    a, b = _promote(a), _promote(b)
+    if a is b:
+        return a
+    if a.signed == b.signed:
+        return a if _RANKS[a] >= _RANKS[b] else b
+    unsigned, signed = (a, b) if b.signed else (b, a)
+    if _RANKS[unsigned] >= _RANKS[signed]:
+        return unsigned
+    elif signed.size > unsigned.size:
+        return signed
+    return _UNSIGNED[signed]
+
+
+def _cast(code, source, target, /) -> list:
+    'Return code followed by a conversion from source to target.'
+    if source is not target:
+        code.append(('cast', target))
+    return code
+
+
+class _Function:
+    'State of the function being compiled.'
+
+    def __init__(self, name, return_type):
+        self.name = name
+        self.return_type = return_type
+        self.size = 0
+
+    def allocate(self, data_type, /) -> int:
+        'Return the frame offset of a new local variable.'
+        self.size += -self.size % data_type.size
+        offset = self.size
+        self.size += data_type.size
+        return offset
+
+
+class _Compiler:
+    'Recursive-descent compiler of a C subset to virtual machine code.'
+
+    def __init__(self, source):
+        self.source = source
+        self.lines = [index for index, char in enumerate(source)
+                      if char == '\n']
+        self.tokens = []
+        position = 0
+        while position < len(source):
+            match = _TOKEN.match(source, position)
+            if match is None:
+                self._error_at(position, 'invalid character')
+            if match.lastgroup != 'space':
+                self.tokens.append((match.lastgroup, match.group(),
+                                    position))
+            position = match.end()
+        self.tokens.append(('end', '', len(source)))
+        self.index = 0
+        self.labels = 0
+        self.functions = {}
+        self.defined = set()
+        self.globals = {}
+        self.data = DATA_ADDRESS
+        self.scopes = []
+        self.function = None
+        self.loops = []
+        self.start = [('label', '_start')]
+        self.code = []
+
+    # ----- Token Methods ----- #
+    def _error_at(self, position, message, /):
+        'Raise a SyntaxError at a source position.'
+        line = bisect_right(self.lines, position) + 1
+        raise SyntaxError(f'line {line}: {message}')
+
+    def _error(self, message, /):
+        'Raise a SyntaxError at the current token.'
+        self._error_at(self.tokens[self.index][2], message)
+
+    @property
+    def _token(self, /) -> str:
+        'The text of the current token.'
+        return self.tokens[self.index][1]
+
+    @property
+    def _kind(self, /) -> str:
+        'The kind of the current token.'
+        return self.tokens[self.index][0]
+
+    def _peek(self, offset, /) -> str:
+        'Return the text of the token offset tokens ahead.'
+        return self.tokens[min(self.index + offset,
+                               len(self.tokens) - 1)][1]
+
+    def _next(self, /) -> str:
+        'Return the text of the current token and move past it.'
+        token = self.tokens[self.index][1]
+        if self.index < len(self.tokens) - 1:
+            self.index += 1
+        return token
+
+    def _accept(self, text, /) -> bool:
+        'Move past the current token if it is text.'
+        if self._token == text and self._kind in ('op', 'name'):
+            self._next()
+            return True
+        return False
+
+    def _expect(self, text, /):
+        'Move past the current token, which must be text.'
+        if not self._accept(text):
+            self._error(f'expected {text!r}, not {self._token!r}')
+
+    def _name(self, /) -> str:
+        'Return the current token, which must be a name, and move on.'
+        if self._kind != 'name' or self._token in _TYPE_WORDS:
+            self._error(f'expected a name, not {self._token!r}')
+        return self._next()
+
+    def _label(self, /) -> str:
+        'Return a new internal label.'
+        self.labels += 1
+        return f'.L{self.labels}'
+
+    # ----- Declaration Methods ----- #
+    def _at_type(self, /) -> bool:
+        'Return whether the current token starts a type.'
+        return self._kind == 'name' and (self._token in _TYPE_WORDS or
+                                         self._token in _QUALIFIERS)
+
+    def _type(self, /):
+        'Parse a type, returning its data type or None for void.'
+        words = []
+        while self._at_type():
+            word = self._next()
+            if word in _TYPE_WORDS:
+                words.append(word)
+        if {'short', 'long', 'signed', 'unsigned'} & set(words) and \
+                'int' in words:
+            words.remove('int')
+        if 'signed' in words and len(words) > 1:
+            words.remove('signed')
+        key = tuple(sorted(words))
+        if key not in _TYPE_NAMES:
+            self._error(f'unsupported type {" ".join(words)!r}')
+        return _TYPE_NAMES[key]
+
+    def program(self, /) -> Program:
+        'Compile the whole source.'
+        while self._kind != 'end':
+            if not self._at_type():
+                self._error(f'expected a declaration, not {self._token!r}')
+            data_type = self._type()
+            name = self._name()
+            if self._token == '(':
+                self._function(data_type, name)
+            else:
+                self._global(data_type, name)
+        if 'main' not in self.defined:
+            raise SyntaxError('undefined function main')
+        for name in self.functions:
+            if name not in self.defined:
+                raise SyntaxError(f'undefined function {name}')
+        self.start += [('call', 'main'), ('ret',)]
+        return Program(self.start + self.code, '_start')
+
+    def _global(self, data_type, name, /):
+        'Compile a global variable declaration.'
+        while True:
+            if data_type is None:
+                self._error(f'variable {name!r} declared void')
+            if name in self.globals or name in self.functions:
+                self._error(f'redefinition of {name!r}')
+            self.data += -self.data % data_type.size
+            self.globals[name] = (data_type, self.data)
+            if self._accept('='):
+                code, source = self._assignment()
+                self.start += _cast(code, source, data_type)
+                self.start.append(('storeg', data_type, self.data))
+            self.data += data_type.size
+            if not self._accept(','):
+                break
+            name = self._name()
+        self._expect(';')
+
+    def _function(self, return_type, name, /):
+        'Compile a function definition or prototype.'
+        self._expect('(')
+        parameters = []
+        if self._token == 'void' and self._peek(1) == ')':
+            self._next()
+        while self._token != ')':
+            data_type = self._type()
+            if data_type is None:
+                self._error('parameter declared void')
+            # Prototypes may leave their parameters unnamed.
+            parameter = None if self._token in (',', ')') else self._name()
+            parameters.append((data_type, parameter))
+            if not self._accept(','):
+                break
+        self._expect(')')
+        signature = (return_type, [t for t, _ in parameters])
+        if self.functions.setdefault(name, signature) != signature:
+            self._error(f'conflicting types for {name!r}')
+        if name in self.globals:
+            self._error(f'redefinition of {name!r}')
+        if self._accept(';'):
+            return
+        if name in self.defined:
+            self._error(f'redefinition of {name!r}')
+        self.defined.add(name)
+        self.function = _Function(name, return_type)
+        self.scopes = [{}]
+        prologue = []
+        for data_type, parameter in parameters:
+            if parameter is None:
+                prologue.append(('pop',))
+                continue
+            offset = self._declare(data_type, parameter)
+            prologue.append(('store', data_type, offset))
+        body = self._block()
+        if return_type is not None:
+            body.append(('push', return_type, 0))
+        body.append(('ret',))
+        size = self.function.size + -self.function.size % 16
+        self.code += [('label', name), ('enter', size)]
+        self.code += prologue[::-1] + body
+        self.function = None
+
+    def _declare(self, data_type, name, /) -> int:
+        'Declare a local variable in the current scope.'
+        if name in self.scopes[-1]:
+            self._error(f'redeclaration of {name!r}')
+        offset = self.function.allocate(data_type)
+        self.scopes[-1][name] = (data_type, offset)
+        return offset
+
+    def _variable(self, name, /):
+        'Return the type and the load and store opcodes and address.'
+        for scope in reversed(self.scopes):
+            if name in scope:
+                data_type, offset = scope[name]
+                return data_type, 'load', 'store', offset
+        if name in self.globals:
+            data_type, address = self.globals[name]
+            return data_type, 'loadg', 'storeg', address
+        self._error(f'undeclared variable {name!r}')
+
+    # ----- Statement Methods ----- #
+    def _block(self, /) -> list:
+        'Compile a block statement.'
+        self._expect('{')
+        self.scopes.append({})
+        code = []
+        while not self._accept('}'):
+            if self._kind == 'end':
+                self._error("expected '}'")
+            code += self._statement()
+        self.scopes.pop()
+        return code
+
+    def _declaration(self, /) -> list:
+        'Compile a local variable declaration.'
+        data_type = self._type()
+        if data_type is None:
+            self._error('variable declared void')
+        code = []
+        while True:
+            name = self._name()
+            offset = self._declare(data_type, name)
+            if self._accept('='):
+                value, source = self._assignment()
+                code += _cast(value, source, data_type)
+                code.append(('store', data_type, offset))
+            if not self._accept(','):
+                break
+        self._expect(';')
+        return code
+
+    def _statement(self, /) -> list:
+        'Compile a statement.'
+        token = self._token if self._kind == 'name' else None
+        if self._token == '{' and self._kind == 'op':
+            return self._block()
+        elif self._at_type():
+            return self._declaration()
+        elif token == 'if':
+            self._next()
+            self._expect('(')
+            condition = self._condition()
+            self._expect(')')
+            then = self._statement()
+            if not self._accept('else'):
+                end = self._label()
+                return condition + [('jz', end)] + then + [('label', end)]
+            other, end = self._label(), self._label()
+            return (condition + [('jz', other)] + then + [('jmp', end),
+                    ('label', other)] + self._statement() +
+                    [('label', end)])
+        elif token == 'while':
+            self._next()
+            start, end = self._label(), self._label()
+            self._expect('(')
+            condition = self._condition()
+            self._expect(')')
+            body = self._loop(start, end)
+            return ([('label', start)] + condition + [('jz', end)] + body +
+                    [('jmp', start), ('label', end)])
+        elif token == 'do':
+            self._next()
+            start, step, end = self._label(), self._label(), self._label()
+            body = self._loop(step, end)
+            self._expect('while')
+            self._expect('(')
+            condition = self._condition()
+            self._expect(')')
+            self._expect(';')
+            return ([('label', start)] + body + [('label', step)] +
+                    condition + [('jnz', start), ('label', end)])
+        elif token == 'for':
+            return self._for()
+        elif token == 'return':
+            self._next()
+            return_type = self.function.return_type
+            code = []
+            if self._token != ';':
+                if return_type is None:
+                    self._error('return with a value in a void function')
+                value, source = self._expression()
+                code = _cast(value, source, return_type)
+            elif return_type is not None:
+                self._error('return without a value')
+            self._expect(';')
+            return code + [('ret',)]
+        elif token in ('break', 'continue'):
+            self._next()
+            if not self.loops:
+                self._error(f'{token} outside of a loop')
+            self._expect(';')
+            step, end = self.loops[-1]
+            return [('jmp', end if token == 'break' else step)]
+        elif self._accept(';'):
+            return []
+        code = self._discard(*self._expression())
+        self._expect(';')
+        return code
+
+    def _loop(self, step, end, /) -> list:
+        'Compile a loop body whose continue and break targets are given.'
+        self.loops.append((step, end))
+        try:
+            return self._statement()
+        finally:
+            self.loops.pop()
+
+    def _for(self, /) -> list:
+        'Compile a for statement.'
+        self._next()
+        self._expect('(')
+        self.scopes.append({})
+        if self._at_type():
+            code = self._declaration()
+        else:
+            code = [] if self._token == ';' else \
+                self._discard(*self._expression())
+            self._expect(';')
+        start, step, end = self._label(), self._label(), self._label()
+        code.append(('label', start))
+        if self._token != ';':
+            code += self._condition() + [('jz', end)]
+        self._expect(';')
+        increment = [] if self._token == ')' else \
+            self._discard(*self._expression())
+        self._expect(')')
+        code += self._loop(step, end)
+        code += [('label', step)] + increment + [('jmp', start),
+                                                 ('label', end)]
+        self.scopes.pop()
+        return code
+
+    def _condition(self, /) -> list:
+        'Compile a scalar expression used as a condition.'
+        code, data_type = self._expression()
+        if data_type is None:
+            self._error('void value used as a condition')
+        return code
+
+    @staticmethod
+    def _discard(code, data_type, /) -> list:
+        'Return the code of an expression whose value is unused.'
+        if data_type is None:
+            return code
+        if len(code) >= 2 and code[-2] == ('dup',) and \
+                code[-1][0] in ('store', 'storeg'):
+            return code[:-2] + code[-1:]
+        if len(code) >= 3 and code[1] == ('dup',) and \
+                code[0][0] in ('load', 'loadg') and \
+                code[-1][0] in ('store', 'storeg'):
+            return code[:1] + code[2:]
+        return code + [('pop',)]
+
+    # ----- Expression Methods ----- #
+    def _expression(self, /) -> Tuple[list, object]:
+        'Compile a comma expression.'
+        code, data_type = self._assignment()
+        while self._accept(','):
+            code = self._discard(code, data_type)
+            value, data_type = self._assignment()
+            code += value
+        return code, data_type
+
+    def _assignment(self, /) -> Tuple[list, object]:
+        'Compile an assignment or a conditional expression.'
+        if self._kind == 'name' and self._peek(1) in _ASSIGNMENTS:
+            name = self._name()
+            operator_ = self._next()
+            data_type, load, store, address = self._variable(name)
+            value, source = self._assignment()
+            if source is None:
+                self._error('void value assigned')
+            if operator_ == '=':
+                code = _cast(value, source, data_type)
+            else:
+                code, _ = self._arithmetic(
+                    operator_[:-1], [(load, data_type, address)], data_type,
+                    value, source)
+                code = _cast(code, _, data_type)
+            return code + [('dup',), (store, data_type, address)], data_type
+        return self._conditional()
+
+    def _conditional(self, /) -> Tuple[list, object]:
+        'Compile a conditional expression.'
+        code, data_type = self._binary(1)
+        if not self._accept('?'):
+            return code, data_type
+        first, first_type = self._expression()
+        self._expect(':')
+        second, second_type = self._conditional()
+        if first_type is None or second_type is None:
+            self._error('void value in a conditional expression')
+        result = _common_type(first_type, second_type)
+        other, end = self._label(), self._label()
+        return (code + [('jz', other)] + _cast(first, first_type, result) +
+                [('jmp', end), ('label', other)] +
+                _cast(second, second_type, result) + [('label', end)],
+                result)
+
+    def _binary(self, precedence, /) -> Tuple[list, object]:
+        'Compile binary operators of at least the given precedence.'
+        code, data_type = self._unary()
+        while self._kind == 'op' and \
+                _PRECEDENCE.get(self._token, 0) >= precedence:
+            operator_ = self._next()
+            right, right_type = self._binary(_PRECEDENCE[operator_] + 1)
+            if data_type is None or right_type is None:
+                self._error(f'void value used with {operator_!r}')
+            if operator_ in ('&&', '||'):
+                short, end = self._label(), self._label()
+                jump = 'jz' if operator_ == '&&' else 'jnz'
+                code = (code + [(jump, short)] + right + [(jump, short),
+                        ('push', Integer, int(operator_ == '&&')),
+                        ('jmp', end), ('label', short),
+                        ('push', Integer, int(operator_ == '||')),
+                        ('label', end)])
+                data_type = Integer
+            else:
+                code, data_type = self._arithmetic(operator_, code, data_type,
+                                                   right, right_type)
+        return code, data_type
+
+    def _arithmetic(self, operator_, code, data_type, right, right_type, /):
+        'Return the code and type of a binary arithmetic operation.'
+        if operator_ in ('%', '&', '|', '^', '<<', '>>') and \
+                (_is_float(data_type) or _is_float(right_type)):
+            self._error(f'invalid floating-point operand of {operator_!r}')
+        if operator_ in ('<<', '>>'):
+            result = _promote(data_type)
+            return (_cast(code, data_type, result) +
+                    _cast(right, right_type, _promote(right_type)) +
+                    [(_OPCODES[operator_],)], result)
+        common = _common_type(data_type, right_type)
+        code = (_cast(code, data_type, common) +
+                _cast(right, right_type, common) + [(_OPCODES[operator_],)])
+        if operator_ in ('==', '!=', '<', '<=', '>', '>='):
+            return code, Integer
+        return code, common
+
+    def _unary(self, /) -> Tuple[list, object]:
+        'Compile a unary expression.'
+        token = self._token if self._kind == 'op' else None
+        if token in ('++', '--'):
+            self._next()
+            name = self._name()
+            data_type, load, store, address = self._variable(name)
+            code, _ = self._arithmetic(token[0], [(load, data_type, address)],
+                                       data_type, [('push', Integer, 1)],
+                                       Integer)
+            code = _cast(code, _, data_type)
+            return code + [('dup',), (store, data_type, address)], data_type
+        elif token in ('-', '+', '~', '!'):
+            self._next()
+            code, data_type = self._unary()
+            if data_type is None:
+                self._error(f'void value used with {token!r}')
+            if token == '!':
+                return code + [('not',)], Integer
+            if token == '~' and _is_float(data_type):
+                self._error("invalid floating-point operand of '~'")
+            result = _promote(data_type)
+            code = _cast(code, data_type, result)
+            if token != '+':
+                code.append(('neg' if token == '-' else 'inv',))
+            return code, result
+        elif token == '(' and self.tokens[self.index + 1][0] == 'name' and \
+                (self._peek(1) in _TYPE_WORDS or self._peek(1) in _QUALIFIERS):
+            self._next()
+            target = self._type()
+            self._expect(')')
+            code, data_type = self._unary()
+            if target is None:
+                return self._discard(code, data_type), None
+            if data_type is None:
+                self._error('void value cast')
+            return _cast(code, data_type, target), target
+        elif self._kind == 'name' and self._token == 'sizeof':
+            self._next()
+            if self._token == '(' and self._peek(1) in _TYPE_WORDS:
+                self._next()
+                data_type = self._type()
+                self._expect(')')
+            else:
+                _, data_type = self._unary()
+            if data_type is None:
+                self._error('sizeof of void')
+            return [('push', UnsignedLong, data_type.size)], UnsignedLong
+        return self._postfix()
+
+    def _postfix(self, /) -> Tuple[list, object]:
+        'Compile a postfix expression.'
+        if self._kind == 'name' and self._peek(1) == '(':
+            return self._call()
+        if self._kind == 'name' and self._peek(1) in ('++', '--'):
+            name = self._name()
+            token = self._next()
+            data_type, load, store, address = self._variable(name)
+            code, result = self._arithmetic(
+                token[0], [('dup',)], data_type, [('push', Integer, 1)],
+                Integer)
+            code = [(load, data_type, address)] + _cast(code, result,
+                                                        data_type)
+            return code + [(store, data_type, address)], data_type
+        return self._primary()
+
+    def _call(self, /) -> Tuple[list, object]:
+        'Compile a function call.'
+        name = self._name()
+        self._expect('(')
+        if name in ('printf', 'putchar'):
+            return self._print(name)
+        if name not in self.functions:
+            self._error(f'implicit declaration of function {name!r}')
+        return_type, parameters = self.functions[name]
+        code = []
+        for index, parameter in enumerate(parameters):
+            if index:
+                self._expect(',')
+            value, data_type = self._assignment()
+            if data_type is None:
+                self._error('void value passed as an argument')
+            code += _cast(value, data_type, parameter)
+        if self._token != ')':
+            self._error(f'too many arguments to function {name!r}')
+        self._expect(')')
+        return code + [('call', name)], return_type
+
+    def _print(self, name, /) -> Tuple[list, object]:
+        'Compile a call of printf or putchar.'
+        if name == 'putchar':
+            text = '%c'
+        elif self._kind != 'string':
+            self._error('printf takes a string literal format')
+        else:
+            text = ''
+            while self._kind == 'string':
+                text += _unquote(self._next())
+        code = []
+        count = 0
+        while self._token != ')':
+            if count or name == 'printf':
+                self._expect(',')
+            value, data_type = self._assignment()
+            if data_type is None:
+                self._error('void value passed as an argument')
+            target = Double if data_type is Float else _promote(data_type)
+            code += _cast(value, data_type, target)
+            count += 1
+        self._expect(')')
+        try:
+            _, converters = _printf_format(text)
+        except ValueError as error:
+            self._error(str(error))
+        if len(converters) != count:
+            self._error(f'format {text!r} takes {len(converters)} '
+                        f'arguments, not {count}')
+        return code + [('print', text, count)], None
+
+    def _primary(self, /) -> Tuple[list, object]:
+        'Compile a constant, a variable or a parenthesized expression.'
+        kind, token = self._kind, self._token
+        if kind == 'int':
+            self._next()
+            return self._integer(token)
+        elif kind == 'float':
+            self._next()
+            data_type = Double
+            if token[-1] in 'fF':
+                data_type, token = Float, token[:-1]
+            elif token[-1] in 'lL':
+                data_type, token = LongDouble, token[:-1]
+            return [('push', data_type, float(token))], data_type
+        elif kind == 'char':
+            self._next()
+            text = _unquote(token)
+            if len(text) != 1:
+                self._error(f'invalid character constant {token}')
+            return [('push', Integer, Char.wrap(ord(text)).to_int())], \
+                Integer
+        elif kind == 'name':
+            name = self._name()
+            data_type, load, _, address = self._variable(name)
+            return [(load, data_type, address)], data_type
+        elif self._accept('('):
+            code = self._expression()
+            self._expect(')')
+            return code
+        self._error(f'expected an expression, not {token!r}')
+
+    def _integer(self, token, /) -> Tuple[list, object]:
+        'Compile an integer constant with the type given by C.'
+        digits = token.rstrip('uUlL')
+        suffix = token[len(digits):].lower()
+        if digits[:2].lower() == '0x':
+            value, decimal = int(digits, 16), False
+        elif len(digits) > 1 and digits[0] == '0':
+            value, decimal = int(digits, 8), False
+        else:
+            value, decimal = int(digits), True
+        longs = suffix.count('l')
+        candidates = [Integer, UnsignedInteger, Long, UnsignedLong,
+                      LongLong, UnsignedLongLong]
+        candidates = candidates[2 * longs:]
+        if 'u' in suffix:
+            candidates = [t for t in candidates if not t.signed]
+        elif decimal:
+            candidates = [t for t in candidates if t.signed]
+        for data_type in candidates:
+            if value <= data_type.maximum:
+                return [('push', data_type, value)], data_type
+        self._error(f'integer constant {token} is too large')
+
+
+def compile_c(source, /) -> Program:
+    """
+    Return the program of the source of a C program.
+
+    The subset covers the integer and floating-point types of
+    DATA_TYPES, global and local variables, functions with parameters,
+    the C operators on them except pointers, if, while, do, for,
+    break, continue and return, and calls to printf and putchar.
+    Comments and preprocessor lines are skipped.  Values are converted
+    with the C integer promotions and usual arithmetic conversions.
+    Errors raise SyntaxError with the line number.
+    """
+    return _Compiler(source).program()